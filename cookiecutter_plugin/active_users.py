@@ -0,0 +1,301 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:
+    memory-bounded unique active user estimates for capacity planning.
+
+    Logins reported by signals.post_login() and signals.session_login_completed()
+    are added to HyperLogLog sketches arranged in three rings of time buckets:
+    per-minute, per-hour and per-day. Each sketch is a fixed 2^precision bytes
+    (1 KB at the default precision of 10, about 3.25% standard error) no matter
+    how many users log in. Both receivers fire for the same login; the sketch
+    counts each user id once.
+
+    Recording a login only touches this process' sketches. A daemon thread
+    of every worker, every flush_interval seconds, max-merges each bucket it
+    still retains into a shared django cache entry, and writes back the entries that the merge
+    changed. HyperLogLog merges are idempotent, so a write lost to a race
+    between two workers, or to a cache error, is repaired by the next flush,
+    including for buckets that have since closed. Estimates are published at
+    /cookiecutter_plugin/active-users/ (staff only)
+
+    configured in settings.COOKIECUTTER_PLUGIN_ACTIVE_USERS. see settings/common.py
+"""
+# python stuff
+import hashlib
+import logging
+import math
+import os
+import threading
+import time
+
+# django stuff
+from django.conf import settings
+from django.core.cache import caches
+
+log = logging.getLogger(__name__)
+
+DEFAULTS = {
+    "enabled": True,
+    # sketch size is 2 ** precision bytes.
+    "precision": 10,
+    # number of buckets retained in each ring.
+    "minute_buckets": 60,
+    "hour_buckets": 24,
+    "day_buckets": 7,
+    # seconds between merges of this worker's sketches into the shared cache.
+    "flush_interval": 10,
+    "cache_alias": "default",
+}
+
+GRANULARITIES = (
+    ("minute", 60),
+    ("hour", 3600),
+    ("day", 86400),
+)
+CACHE_KEY_PREFIX = "cookiecutter_plugin.hll"
+HASH_BITS = 64
+
+
+def _hash64(value) -> int:
+    return int.from_bytes(hashlib.blake2b(str(value).encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class HyperLogLog:
+    """
+    HyperLogLog cardinality sketch with 2 ** precision one-byte registers.
+    """
+
+    __slots__ = ("precision", "m", "registers", "_suffix_bits", "_suffix_mask")
+
+    def __init__(self, precision=10, registers=None):
+        if not 4 <= precision <= 16:
+            raise ValueError("precision must be between 4 and 16")
+        self.precision = precision
+        self.m = 1 << precision
+        self._suffix_bits = HASH_BITS - precision
+        self._suffix_mask = (1 << self._suffix_bits) - 1
+        if registers is not None and len(registers) != self.m:
+            raise ValueError("expected {m} registers, received {n}".format(m=self.m, n=len(registers)))
+        self.registers = bytearray(registers) if registers is not None else bytearray(self.m)
+
+    def add(self, value) -> bool:
+        """
+        add a value. returns True if the sketch changed.
+        """
+        h = _hash64(value)
+        index = h >> self._suffix_bits
+        rank = self._suffix_bits - (h & self._suffix_mask).bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+            return True
+        return False
+
+    def merge(self, other):
+        if other.m != self.m:
+            raise ValueError("cannot merge sketches of different precision")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+        return self
+
+    def estimate(self) -> int:
+        m = self.m
+        if m == 16:
+            alpha = 0.673
+        elif m == 32:
+            alpha = 0.697
+        elif m == 64:
+            alpha = 0.709
+        else:
+            alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / sum(2.0**-r for r in self.registers)
+        zeros = self.registers.count(0)
+        if raw <= 2.5 * m and zeros:
+            # small range correction: linear counting.
+            return int(round(m * math.log(m / zeros)))
+        return int(round(raw))
+
+    def to_bytes(self) -> bytes:
+        return bytes(self.registers)
+
+    @classmethod
+    def from_bytes(cls, data, precision):
+        return cls(precision, data)
+
+
+class BucketRing:
+    """
+    the most recent `slots` sketches of one granularity, keyed by bucket number
+    (epoch seconds // width).
+    """
+
+    def __init__(self, name, width, slots, precision):
+        self.name = name
+        self.width = width
+        self.slots = slots
+        self.precision = precision
+        self.sketches = {}
+
+    def bucket(self, now) -> int:
+        return int(now) // self.width
+
+    def retained(self, now) -> list:
+        current = self.bucket(now)
+        return list(range(current, current - self.slots, -1))
+
+    def add(self, value, now):
+        bucket = self.bucket(now)
+        sketch = self.sketches.get(bucket)
+        if sketch is None:
+            sketch = self.sketches[bucket] = HyperLogLog(self.precision)
+            oldest = bucket - self.slots
+            for stale in [b for b in self.sketches if b <= oldest]:
+                del self.sketches[stale]
+        sketch.add(value)
+
+    def cache_key(self, bucket) -> str:
+        return "{prefix}.{precision}.{name}.{bucket}".format(
+            prefix=CACHE_KEY_PREFIX, precision=self.precision, name=self.name, bucket=bucket
+        )
+
+
+class ActiveUserEstimator:
+    def __init__(self, config=None, clock=time.time):
+        self.config = config or active_users_settings()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+        self.rings = [
+            BucketRing(name, width, self.config["{name}_buckets".format(name=name)], self.config["precision"])
+            for name, width in GRANULARITIES
+        ]
+
+    def _cache(self):
+        return caches[self.config["cache_alias"]]
+
+    def _ensure_thread(self):
+        # threads do not survive fork(); restart the flusher in each worker process.
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name="cookiecutter-plugin-active-users", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            time.sleep(self.config["flush_interval"])
+            self.flush()
+
+    def add(self, user_id):
+        """
+        record a login in this process' sketches. no cache round trips: see flush().
+        """
+        self._ensure_thread()
+        now = self._clock()
+        with self._lock:
+            for ring in self.rings:
+                ring.add(user_id, now)
+
+    def flush(self):
+        """
+        max-merge every retained local sketch into its shared cache entry.
+        called from the flusher thread, and before estimates() are read.
+        """
+        now = self._clock()
+        with self._lock:
+            pending = {}
+            for ring in self.rings:
+                for bucket in ring.retained(now):
+                    if bucket in ring.sketches:
+                        pending[ring.cache_key(bucket)] = (
+                            ring,
+                            HyperLogLog(ring.precision, ring.sketches[bucket].registers),
+                        )
+        if not pending:
+            return
+        try:
+            cache = self._cache()
+            shared = cache.get_many(list(pending.keys()))
+            timeouts = {}
+            for key, (ring, sketch) in pending.items():
+                if key in shared:
+                    sketch.merge(HyperLogLog.from_bytes(shared[key], ring.precision))
+                    if sketch.to_bytes() == bytes(shared[key]):
+                        # the shared entry already holds every register of this worker.
+                        continue
+                timeouts.setdefault(ring.width * ring.slots, {})[key] = sketch.to_bytes()
+            for timeout, values in timeouts.items():
+                cache.set_many(values, timeout=timeout)
+        except Exception as e:  # noqa: B902
+            # the cache is best-effort. local sketches keep counting regardless.
+            log.warning("cookiecutter_plugin could not flush active user sketches: %s", e)
+
+    def estimates(self) -> dict:
+        """
+        {"minute": [{"start": <epoch>, "users": <estimate>}, ...], "hour": [...], "day": [...]}
+        newest bucket first; the first bucket of each ring is still in progress.
+        """
+        self.flush()
+        now = self._clock()
+        with self._lock:
+            local = {
+                ring.cache_key(bucket): HyperLogLog(ring.precision, ring.sketches[bucket].registers)
+                for ring in self.rings
+                for bucket in ring.retained(now)
+                if bucket in ring.sketches
+            }
+        try:
+            shared = self._cache().get_many([ring.cache_key(b) for ring in self.rings for b in ring.retained(now)])
+        except Exception as e:  # noqa: B902
+            log.warning("cookiecutter_plugin could not read active user sketches: %s", e)
+            shared = {}
+
+        result = {}
+        for ring in self.rings:
+            rows = []
+            for bucket in ring.retained(now):
+                key = ring.cache_key(bucket)
+                sketch = local.get(key) or HyperLogLog(ring.precision)
+                if key in shared:
+                    sketch.merge(HyperLogLog.from_bytes(shared[key], ring.precision))
+                rows.append({"start": bucket * ring.width, "users": sketch.estimate()})
+            result[ring.name] = rows
+        return result
+
+
+def active_users_settings() -> dict:
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, "COOKIECUTTER_PLUGIN_ACTIVE_USERS", None) or {})
+    return config
+
+
+_estimator = None
+_estimator_lock = threading.Lock()
+
+
+def estimator() -> ActiveUserEstimator:
+    global _estimator
+
+    if _estimator is None:
+        with _estimator_lock:
+            if _estimator is None:
+                _estimator = ActiveUserEstimator()
+    return _estimator
+
+
+def record_login(user_id):
+    """
+    called from the login receivers in signals.py
+    """
+    if user_id is None:
+        return
+    est = estimator()
+    if est.config["enabled"]:
+        est.add(user_id)
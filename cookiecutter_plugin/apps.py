@@ -141,6 +141,9 @@ class CookiecutterPluginConfig(AppConfig):
         from . import signals  # pylint: disable=unused-import
         from .waffle import waffle_init
         from .utils import PluginJSONEncoder
+        from .log_queue import install as install_log_queue
+
+        install_log_queue()
 
         log.info("{label} is ready.".format(label=self.label))
         log.info(
@@ -0,0 +1,221 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:
+    event-loop aware signal receivers.
+
+    Django and openedx-events send signals synchronously, so a receiver runs
+    on whichever thread sent the signal. Under WSGI, and for sync views under
+    ASGI, that thread has no running event loop and the receivers in
+    signals.py run inline, exactly as before.
+
+    When a signal is sent from a coroutine, ie an async view or an asyncio
+    based worker, running the receiver inline would block the event loop for
+    the whole of its work (waffle lookup, roster and certificate writes,
+    serialization, sink fan-out), and Django's ORM refuses to run there at
+    all. Instead, @loop_aware receivers schedule their work as a task on the
+    running loop. The task runs the receiver in a small thread pool, at most
+    max_concurrency at a time per process, so only the scheduling itself
+    happens on the loop.
+
+    The pool's threads check their database connections before and after each
+    receiver, as django does around each request.
+
+    At most max_pending events per loop wait for a thread. Beyond that, events
+    are dropped and counted, as with the event sinks' default overflow policy.
+
+    counters are published at /cookiecutter_plugin/async-receivers/
+    configured in settings.COOKIECUTTER_PLUGIN_ASYNC_RECEIVERS. see settings/common.py
+"""
+# python stuff
+import asyncio
+import functools
+import logging
+import os
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+# django stuff
+from django.conf import settings
+from django.db import close_old_connections
+
+log = logging.getLogger(__name__)
+
+DEFAULTS = {
+    "enabled": True,
+    # receivers running at the same time, per process. also the number of threads.
+    "max_concurrency": 8,
+    # events waiting for a thread, per event loop.
+    "max_pending": 10000,
+}
+
+
+def async_receivers_settings() -> dict:
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, "COOKIECUTTER_PLUGIN_ASYNC_RECEIVERS", None) or {})
+    return config
+
+
+def _run_receiver(receiver, args, kwargs):
+    # on a pool thread: replace connections lost to wait_timeout or a server restart.
+    close_old_connections()
+    try:
+        return receiver(*args, **kwargs)
+    finally:
+        close_old_connections()
+
+
+class LoopScheduler:
+    """
+    the receiver tasks of one event loop. Only ever used from that loop's thread.
+    """
+
+    def __init__(self, loop, max_concurrency):
+        self.loop = loop
+        # created on the loop's thread, so that python < 3.10 binds it to this loop.
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        # the loop only keeps weak references to its tasks.
+        self.tasks = set()
+
+
+class AsyncReceivers:
+    def __init__(self, enabled=True, max_concurrency=DEFAULTS["max_concurrency"], max_pending=DEFAULTS["max_pending"]):
+        self.enabled = enabled
+        self.max_concurrency = max_concurrency
+        self.max_pending = max_pending
+        self._schedulers = weakref.WeakKeyDictionary()
+        self._executor = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+        self.scheduled = 0
+        self.completed = 0
+        self.failed = 0
+        self.dropped = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        # threads do not survive fork(); create the pool in each worker process.
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_concurrency, thread_name_prefix="cookiecutter-plugin-receiver"
+                    )
+                    self._pid = os.getpid()
+        return self._executor
+
+    def _scheduler(self, loop) -> LoopScheduler:
+        scheduler = self._schedulers.get(loop)
+        if scheduler is None:
+            scheduler = self._schedulers[loop] = LoopScheduler(loop, self.max_concurrency)
+        return scheduler
+
+    def call(self, receiver, args, kwargs):
+        """
+        run receiver(*args, **kwargs) inline, or schedule it on the running event loop.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is None or not self.enabled:
+            return receiver(*args, **kwargs)
+
+        scheduler = self._scheduler(loop)
+        if len(scheduler.tasks) >= self.max_pending:
+            with self._lock:
+                self.dropped += 1
+            log.warning(
+                "cookiecutter_plugin dropped {receiver}: {n} receiver tasks are already pending".format(
+                    receiver=receiver.__name__, n=len(scheduler.tasks)
+                )
+            )
+            return None
+        task = loop.create_task(self.run(receiver, args, kwargs))
+        scheduler.tasks.add(task)
+        task.add_done_callback(scheduler.tasks.discard)
+        with self._lock:
+            self.scheduled += 1
+        return None
+
+    async def run(self, receiver, args, kwargs):
+        """
+        await receiver(*args, **kwargs) on the thread pool. Never raises.
+        """
+        loop = asyncio.get_running_loop()
+        async with self._scheduler(loop).semaphore:
+            try:
+                await loop.run_in_executor(
+                    self._get_executor(), functools.partial(_run_receiver, receiver, args, kwargs)
+                )
+            except Exception as e:  # noqa: B902
+                with self._lock:
+                    self.failed += 1
+                log.error("cookiecutter_plugin receiver {receiver} failed: {e}".format(receiver=receiver.__name__, e=e))
+                return
+        with self._lock:
+            self.completed += 1
+
+    async def drain(self):
+        """
+        wait for the receiver tasks scheduled on the running loop, ie before the loop is closed.
+        """
+        scheduler = self._schedulers.get(asyncio.get_running_loop())
+        while scheduler is not None and scheduler.tasks:
+            await asyncio.wait(list(scheduler.tasks))
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "max_concurrency": self.max_concurrency,
+                "max_pending": self.max_pending,
+                "pending": sum(len(scheduler.tasks) for scheduler in list(self._schedulers.values())),
+                "scheduled": self.scheduled,
+                "completed": self.completed,
+                "failed": self.failed,
+                "dropped": self.dropped,
+            }
+
+
+_receivers = None
+_receivers_lock = threading.Lock()
+
+
+def async_receivers() -> AsyncReceivers:
+    global _receivers
+
+    if _receivers is None:
+        with _receivers_lock:
+            if _receivers is None:
+                config = async_receivers_settings()
+                _receivers = AsyncReceivers(
+                    enabled=config["enabled"],
+                    max_concurrency=config["max_concurrency"],
+                    max_pending=config["max_pending"],
+                )
+    return _receivers
+
+
+def loop_aware(receiver):
+    """
+    decorator for the receivers in signals.py. see the module docstring.
+
+    receiver.run_async(*args, **kwargs) is the awaitable variant, for asyncio
+    code that wants to wait for the receiver to finish.
+    """
+
+    @functools.wraps(receiver)
+    def _receiver(*args, **kwargs):
+        return async_receivers().call(receiver, args, kwargs)
+
+    async def run_async(*args, **kwargs):
+        await async_receivers().run(receiver, args, kwargs)
+
+    _receiver.run_async = run_async
+    return _receiver
@@ -43,24 +43,42 @@ usage:
 
     An example of the actual location of the same course completion badge when Cloudfront has not been enabled is:
         https://s3.us-east-1.amazonaws.com/smartlikefox-usa-prod-storage/badge_classes/course_complete_badges/badge-icon-png-22.png
+
+    Circuit breaker
+    ------------------------------------------
+    mcdaniel oct-2026: outbound calls to the CDN and to Badgr are wrapped in a
+    per-endpoint circuit breaker (see badges/circuit_breaker.py) so that a degraded
+    third party fails fast instead of tying up an LMS worker for the full timeout.
+
+    Lazy loading
+    ------------------------------------------
+    mcdaniel oct-2026: the platform's BadgrBackend, and requests along with it,
+    are imported when BadgrBoto3Backend is first looked up, ie when the badges
+    app resolves settings.BADGING_BACKEND, rather than when this module is
+    imported. See __getattr__() at the bottom of this module.
 """
 
 # python stuff
 import logging
-import requests
+import threading
+from http import HTTPStatus
 
 # django stuff
 from django.conf import settings
 from django.core.validators import URLValidator
 from django.core.exceptions import ValidationError
 
-# openedx stuff
-from lms.djangoapps.badges.backends.badgr import BadgrBackend
+# our stuff
+from ..circuit_breaker import breakers, breaker_settings
 
 log = logging.getLogger(__name__)
 
 
-class BadgrBoto3Backend(BadgrBackend):
+class BadgrBoto3Mixin:
+    """
+    everything that BadgrBoto3Backend adds to, or overrides in, the platform's BadgrBackend.
+    """
+
     def __init__(self):
         super().__init__()
         log.info("cookiecutter_plugin.badges.backends.badgr_boto3.BadgrBoto3Backend - ready.")
@@ -92,6 +110,20 @@ class BadgrBoto3Backend(BadgrBackend):
             )
             return aws_storage_bucket_name
 
+    def _cookiecutter_request(self, method, url, **kwargs):
+        """
+        requests.get() / requests.post() wrapped in the circuit breaker for the
+        url's endpoint. Raises circuit_breaker.CircuitOpenError without making
+        the call while the endpoint's circuit is open.
+        """
+        if "timeout" not in kwargs:
+            config = breaker_settings()
+            kwargs["timeout"] = (config["connect_timeout"], config["read_timeout"])
+        import requests
+
+        breaker = breakers.get(url)
+        return breaker.call(getattr(requests, method), url, **kwargs)
+
     def _create_badge(self, badge_class):
         """
         Create the badge class on Badgr.
@@ -107,8 +139,8 @@ class BadgrBoto3Backend(BadgrBackend):
         image_filename = badge_class.image.name
 
         boto3_uri = self._cookiecutter_boto3_uri(image_filename)
-        response = requests.get(boto3_uri)
-        if response.status_code != requests.codes.ok:
+        response = self._cookiecutter_request("get", boto3_uri)
+        if response.status_code != HTTPStatus.OK:
             log.error(
                 "received {status_code} response on URI {uri}".format(status_code=response.status_code, uri=boto3_uri)
             )
@@ -128,8 +160,13 @@ class BadgrBoto3Backend(BadgrBackend):
             "criteriaUrl": badge_class.criteria,
             "description": badge_class.description,
         }
-        result = requests.post(
-            self._badge_create_url, headers=self._get_headers(), data=data, files=files, timeout=settings.BADGR_TIMEOUT
+        result = self._cookiecutter_request(
+            "post",
+            self._badge_create_url,
+            headers=self._get_headers(),
+            data=data,
+            files=files,
+            timeout=settings.BADGR_TIMEOUT,
         )
         self._log_if_raised(result, data)
         try:
@@ -145,3 +182,26 @@ class BadgrBoto3Backend(BadgrBackend):
             )
 
         log.info("cookiecutter_plugin.badges.backends.badgr_boto3._create_badge() - finish")
+
+
+_backend_lock = threading.Lock()
+
+
+def __getattr__(name):
+    """
+    PEP 562: builds BadgrBoto3Backend on first access, so that importing this
+    module does not import the LMS badges backend.
+    """
+    global BadgrBoto3Backend
+
+    if name != "BadgrBoto3Backend":
+        raise AttributeError("module {module} has no attribute {name}".format(module=__name__, name=name))
+    with _backend_lock:
+        if "BadgrBoto3Backend" not in globals():
+            # openedx stuff
+            from lms.djangoapps.badges.backends.badgr import BadgrBackend
+
+            class BadgrBoto3Backend(BadgrBoto3Mixin, BadgrBackend):
+                __qualname__ = "BadgrBoto3Backend"
+
+    return BadgrBoto3Backend
@@ -0,0 +1,240 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:
+    per-endpoint circuit breaker for the outbound http calls made by
+    BadgrBoto3Backend (Badgr api and the CDN / S3 badge image location).
+
+    Each endpoint keeps a rolling window of the most recent call outcomes and
+    latencies. The breaker trips to OPEN when either the error rate or the
+    share of slow calls in the window exceeds its threshold. While OPEN, calls
+    fail fast with CircuitOpenError instead of waiting out their timeout.
+    After reset_timeout seconds the breaker moves to HALF_OPEN and lets a
+    limited number of probe calls through; a successful probe closes the
+    circuit, a failed probe re-opens it.
+
+    thresholds are configured in settings.COOKIECUTTER_PLUGIN_CIRCUIT_BREAKER.
+    see settings/common.py
+"""
+# python stuff
+import logging
+import threading
+import time
+from collections import deque
+from urllib.parse import urlsplit
+
+# django stuff
+from django.conf import settings
+
+log = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+DEFAULTS = {
+    # number of most recent calls per endpoint that are considered.
+    "window_size": 20,
+    # the breaker will not trip until the window contains at least this many calls.
+    "min_calls": 5,
+    # trip when this share of calls in the window failed.
+    "error_rate_threshold": 0.5,
+    # a call slower than this many seconds counts as slow.
+    "slow_call_seconds": 2.0,
+    # trip when this share of calls in the window were slow.
+    "slow_call_rate_threshold": 0.8,
+    # seconds to stay OPEN before allowing half-open probes.
+    "reset_timeout": 30,
+    # number of concurrent probe calls allowed while HALF_OPEN.
+    "half_open_max_calls": 1,
+    # timeouts (seconds) for the outbound calls themselves.
+    "connect_timeout": 3.05,
+    "read_timeout": 10,
+}
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of making an outbound call while the endpoint's circuit is open.
+    """
+
+    def __init__(self, endpoint, retry_after):
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+        super().__init__(
+            "circuit for {endpoint} is open. retry in {retry_after:.1f} seconds".format(
+                endpoint=endpoint, retry_after=retry_after
+            )
+        )
+
+
+def breaker_settings() -> dict:
+    """
+    DEFAULTS overlaid with settings.COOKIECUTTER_PLUGIN_CIRCUIT_BREAKER
+    """
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, "COOKIECUTTER_PLUGIN_CIRCUIT_BREAKER", None) or {})
+    return config
+
+
+def endpoint_for(url: str) -> str:
+    """
+    breakers are tracked per scheme://host so that, for example, every badge
+    image on the CDN shares a single breaker.
+    """
+    parts = urlsplit(url)
+    return "{scheme}://{netloc}".format(scheme=parts.scheme, netloc=parts.netloc)
+
+
+class CircuitBreaker:
+    """
+    Rolling error rate and latency tracker for a single endpoint.
+    """
+
+    def __init__(self, endpoint, config=None, clock=time.monotonic):
+        self.endpoint = endpoint
+        self.config = config or breaker_settings()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._window = deque(maxlen=self.config["window_size"])  # (ok, elapsed) tuples
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._half_open_in_flight = 0
+        self.total_calls = 0
+        self.total_failures = 0
+        self.total_rejected = 0
+        self.last_error = None
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == OPEN and self._clock() - self._opened_at >= self.config["reset_timeout"]:
+            self._state = HALF_OPEN
+            self._half_open_in_flight = 0
+            log.info("circuit for {endpoint} is now half-open".format(endpoint=self.endpoint))
+        return self._state
+
+    def before_call(self):
+        """
+        Raise CircuitOpenError if the call must not be attempted.
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return
+            if state == HALF_OPEN and self._half_open_in_flight < self.config["half_open_max_calls"]:
+                self._half_open_in_flight += 1
+                return
+            self.total_rejected += 1
+            retry_after = max(0.0, self.config["reset_timeout"] - (self._clock() - self._opened_at))
+        raise CircuitOpenError(self.endpoint, retry_after)
+
+    def record(self, ok: bool, elapsed: float, error=None):
+        with self._lock:
+            self.total_calls += 1
+            if not ok:
+                self.total_failures += 1
+                self.last_error = str(error) if error is not None else None
+            state = self._current_state()
+            if state == HALF_OPEN:
+                self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+                if ok and elapsed < self.config["slow_call_seconds"]:
+                    self._close()
+                else:
+                    self._open()
+                return
+            self._window.append((ok, elapsed))
+            if state == CLOSED and self._should_trip():
+                self._open()
+
+    def _should_trip(self) -> bool:
+        calls = len(self._window)
+        if calls < self.config["min_calls"]:
+            return False
+        failures = sum(1 for ok, _ in self._window if not ok)
+        slow = sum(1 for _, elapsed in self._window if elapsed >= self.config["slow_call_seconds"])
+        return (
+            failures / calls >= self.config["error_rate_threshold"]
+            or slow / calls >= self.config["slow_call_rate_threshold"]
+        )
+
+    def _open(self):
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self._window.clear()
+        log.warning("circuit for {endpoint} is now open".format(endpoint=self.endpoint))
+
+    def _close(self):
+        self._state = CLOSED
+        self._window.clear()
+        log.info("circuit for {endpoint} is now closed".format(endpoint=self.endpoint))
+
+    def call(self, func, *args, **kwargs):
+        """
+        Invoke func(*args, **kwargs) under the protection of this breaker.
+        Any exception raised by func counts as a failure and is re-raised.
+        """
+        self.before_call()
+        start = self._clock()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:  # noqa: B902
+            self.record(False, self._clock() - start, e)
+            raise
+        status_code = getattr(result, "status_code", 200)
+        # 4xx responses are the caller's problem, not the endpoint's.
+        self.record(status_code < 500, self._clock() - start, "http {code}".format(code=status_code))
+        return result
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            state = self._current_state()
+            calls = len(self._window)
+            elapsed = sorted(e for _, e in self._window)
+            return {
+                "endpoint": self.endpoint,
+                "state": state,
+                "window_calls": calls,
+                "window_error_rate": (sum(1 for ok, _ in self._window if not ok) / calls) if calls else 0.0,
+                "window_p50_seconds": elapsed[len(elapsed) // 2] if elapsed else None,
+                "window_max_seconds": elapsed[-1] if elapsed else None,
+                "total_calls": self.total_calls,
+                "total_failures": self.total_failures,
+                "total_rejected": self.total_rejected,
+                "last_error": self.last_error,
+            }
+
+
+class CircuitBreakerRegistry:
+    """
+    Process-wide collection of breakers, keyed by endpoint.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._breakers = {}
+
+    def get(self, url: str) -> CircuitBreaker:
+        endpoint = endpoint_for(url)
+        breaker = self._breakers.get(endpoint)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(endpoint, CircuitBreaker(endpoint))
+        return breaker
+
+    def snapshot(self) -> list:
+        return [breaker.snapshot() for breaker in list(self._breakers.values())]
+
+    def reset(self):
+        with self._lock:
+            self._breakers = {}
+
+
+breakers = CircuitBreakerRegistry()
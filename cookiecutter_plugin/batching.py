@@ -0,0 +1,124 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:          coalescing write-behind buffer. Receivers put() keyed
+                values; a later value for the same key replaces the earlier
+                one. A daemon thread hands the accumulated batch to a flush
+                function every flush_interval seconds, or sooner once
+                batch_size keys are pending, so that the database sees one
+                batched write per interval instead of one write per event.
+
+                The flusher thread has database connections of its own, which
+                no request cycle ever closes. They are checked before and after
+                every flush, as django does around each request, so that one
+                lost to wait_timeout or a server restart is replaced.
+"""
+# python stuff
+import atexit
+import logging
+import os
+import threading
+
+# django stuff
+from django.db import close_old_connections
+
+log = logging.getLogger(__name__)
+
+
+class CoalescingBuffer:
+    """
+    flush_func(batch: dict) is called from the flusher thread. If it raises,
+    the batch is merged back into the buffer (newer values win) and retried
+    on the next interval, up to max_pending keys; anything beyond that is
+    dropped and counted.
+    """
+
+    def __init__(self, name, flush_func, flush_interval=5.0, batch_size=500, max_pending=100000):
+        self.name = name
+        self.flush_func = flush_func
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self._pending = {}
+        self._lock = threading.Lock()
+        # flushes are serialized so that an older batch can never land after a newer one.
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._pid = None
+        self.flushed = 0
+        self.dropped = 0
+        self.failures = 0
+        atexit.register(self.flush)
+
+    def _ensure_thread(self):
+        # threads do not survive fork(); restart the flusher in each worker process.
+        if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid() and self._thread.is_alive():
+                return
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name="cookiecutter-plugin-" + self.name, daemon=True)
+            self._thread.start()
+
+    def put(self, key, value):
+        self._ensure_thread()
+        with self._lock:
+            if key not in self._pending and len(self._pending) >= self.max_pending:
+                self.dropped += 1
+                return
+            self._pending[key] = value
+            full = len(self._pending) >= self.batch_size
+        if full:
+            self._wakeup.set()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def flush(self):
+        with self._flush_lock:
+            self._flush()
+
+    def _flush(self):
+        with self._lock:
+            batch, self._pending = self._pending, {}
+        if not batch:
+            return
+        try:
+            close_old_connections()
+            try:
+                self.flush_func(batch)
+            finally:
+                close_old_connections()
+            self.flushed += len(batch)
+        except Exception as e:  # noqa: B902
+            self.failures += 1
+            log.error(
+                "cookiecutter_plugin {name} flush of {n} items failed: {e}".format(name=self.name, n=len(batch), e=e)
+            )
+            with self._lock:
+                for key, value in batch.items():
+                    if key in self._pending:
+                        continue
+                    if len(self._pending) >= self.max_pending:
+                        self.dropped += 1
+                        continue
+                    self._pending[key] = value
+
+    def stats(self) -> dict:
+        with self._lock:
+            pending = len(self._pending)
+        return {
+            "pending": pending,
+            "flushed": self.flushed,
+            "dropped": self.dropped,
+            "failures": self.failures,
+        }
@@ -0,0 +1,11 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:          local stand-ins and load harnesses for measuring the plugin's
+                performance without touching real third party services.
+                see management/commands/cookiecutter_plugin_benchmark_*.py
+"""
@@ -0,0 +1,121 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:          size and scan speed of the columnar event archive (see
+                event_archive.py) vs the NDJSON event log it was compacted from.
+"""
+# python stuff
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import time
+
+# our stuff
+from ..event_archive import EventArchiveReader, compact, course_key_columns, flatten_event
+from ..sinks.base import EventRecord
+from .events import DEFAULT_MIX, SyntheticEvents, available_signals
+
+
+def write_event_log(path, events, seed=None):
+    """
+    an NDJSON event log of synthetic events, exactly as sinks.file.FileSink writes it.
+    """
+    synthetic = SyntheticEvents(seed=seed)
+    mix = available_signals(DEFAULT_MIX)
+    names = list(mix.keys())
+    weights = list(mix.values())
+    with open(path, "w", encoding="utf-8") as f:
+        for _ in range(events):
+            event_name = synthetic.random.choices(names, weights)[0]
+            record = EventRecord(event_name, synthetic.metadata(event_name), synthetic.event(event_name))
+            f.write(record.line + "\n")
+    return synthetic, mix
+
+
+def _timed(scan) -> dict:
+    start = time.perf_counter()
+    matched = scan()
+    return {"matched": matched, "seconds": round(time.perf_counter() - start, 4)}
+
+
+def _ndjson_scan(path, keep) -> int:
+    matched = 0
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if keep(json.loads(line)):
+                matched += 1
+    return matched
+
+
+def _in_course(course_key):
+    def _keep(event):
+        flat = flatten_event(event)
+        return any(flat[name] == course_key for name in course_key_columns(flat))
+
+    return _keep
+
+
+def run(events=50000, chunk_size=10000, compresslevel=6, seed=None) -> dict:
+    directory = tempfile.mkdtemp()
+    try:
+        log_path = os.path.join(directory, "events.ndjson")
+        archive_path = os.path.join(directory, "events.ccpa")
+        synthetic, mix = write_event_log(log_path, events, seed)
+        # the rarest event type and the most popular course: the selective scans an archive is for.
+        event_name = min(mix, key=mix.get)
+        course_key = str(synthetic.courses[0].course_key)
+
+        start = time.perf_counter()
+        compacted = compact([log_path], archive_path, chunk_size=chunk_size, compresslevel=compresslevel)
+        compact_seconds = time.perf_counter() - start
+        with open(log_path, "rb") as f:
+            gzip_bytes = len(gzip.compress(f.read(), compresslevel=compresslevel))
+
+        reader = EventArchiveReader(archive_path)
+        results = {
+            "events": events,
+            "chunk_size": chunk_size,
+            "size": {
+                "ndjson_bytes": compacted["bytes_in"],
+                "ndjson_gzip_bytes": gzip_bytes,
+                "archive_bytes": compacted["bytes_out"],
+                "archive_bytes_per_event": round(compacted["bytes_out"] / events, 1) if events else None,
+                "reduction_vs_ndjson": round(compacted["bytes_in"] / compacted["bytes_out"], 1),
+                "reduction_vs_gzip": round(gzip_bytes / compacted["bytes_out"], 2),
+                "compact_seconds": round(compact_seconds, 3),
+            },
+            "scan": {
+                "event_name": event_name,
+                "course_key": course_key,
+                "ndjson_all": _timed(lambda: _ndjson_scan(log_path, lambda event: True)),
+                "archive_all": _timed(lambda: sum(1 for _ in reader.scan())),
+                "ndjson_by_event_name": _timed(
+                    lambda: _ndjson_scan(log_path, lambda event: event.get("event_name") == event_name)
+                ),
+                "archive_by_event_name": _timed(lambda: sum(1 for _ in reader.scan(event_name=event_name))),
+                "archive_by_event_name_two_fields": _timed(
+                    lambda: sum(
+                        1 for _ in reader.scan(event_name=event_name, columns=["event_name", "event_metadata.time"])
+                    )
+                ),
+                "archive_count_by_event_name": _timed(lambda: reader.count(event_name=event_name)),
+                "ndjson_by_course_key": _timed(lambda: _ndjson_scan(log_path, _in_course(course_key))),
+                "archive_by_course_key": _timed(lambda: sum(1 for _ in reader.scan(course_key=course_key))),
+                "archive_count_by_course_key": _timed(lambda: reader.count(course_key=course_key)),
+            },
+        }
+        # the archive must give back exactly the events of the log.
+        with open(log_path, encoding="utf-8") as f:
+            results["identical_events"] = all(
+                json.dumps(event, separators=(",", ":")) == json.dumps(json.loads(line), separators=(",", ":"))
+                for event, line in zip(reader.scan(), f)
+            )
+        return results
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
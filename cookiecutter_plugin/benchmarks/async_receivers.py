@@ -0,0 +1,110 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:          how long the receivers in signals.py hold the event loop when
+                openedx-events are sent from a coroutine (see async_receivers.py),
+                compared with the time they take when run inline.
+"""
+# python stuff
+import asyncio
+import time
+from contextlib import nullcontext
+
+# our stuff
+from ..async_receivers import async_receivers
+from .events import DEFAULT_MIX, SyntheticEvents, _fire, available_signals, isolated_receivers
+from .harness import percentile
+
+# seconds between heartbeats of the loop lag probe.
+HEARTBEAT = 0.001
+
+
+def _summary(seconds) -> dict:
+    seconds = sorted(seconds)
+    ms = 1000.0
+    return {
+        "p50_ms": round(percentile(seconds, 50) * ms, 3) if seconds else None,
+        "p99_ms": round(percentile(seconds, 99) * ms, 3) if seconds else None,
+        "max_ms": round(seconds[-1] * ms, 3) if seconds else None,
+    }
+
+
+def _events(count, seed):
+    synthetic = SyntheticEvents(seed=seed)
+    mix = available_signals(DEFAULT_MIX)
+    names = list(mix.keys())
+    weights = list(mix.values())
+    return synthetic, [(name, synthetic.event(name)) for name in synthetic.random.choices(names, weights, k=count)]
+
+
+def run_inline(events, dispatch, synthetic) -> list:
+    """
+    per-event time of the receivers on a thread with no event loop, ie under WSGI.
+    """
+    latencies = []
+    for event_name, data in events:
+        start = time.perf_counter()
+        _fire(event_name, data, dispatch, synthetic)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+async def run_on_loop(events, dispatch, synthetic):
+    """
+    per-event time that sending the signal holds the loop, and the lag of a heartbeat running alongside.
+    """
+    receivers = async_receivers()
+    on_loop = []
+    lags = []
+    running = True
+
+    async def _heartbeat():
+        while running:
+            start = time.perf_counter()
+            await asyncio.sleep(HEARTBEAT)
+            lags.append(time.perf_counter() - start - HEARTBEAT)
+
+    heartbeat = asyncio.ensure_future(_heartbeat())
+    start = time.perf_counter()
+    for event_name, data in events:
+        sent = time.perf_counter()
+        _fire(event_name, data, dispatch, synthetic)
+        on_loop.append(time.perf_counter() - sent)
+        # yield to the loop between events, as a busy async view does.
+        await asyncio.sleep(0)
+    await receivers.drain()
+    elapsed = time.perf_counter() - start
+    running = False
+    await heartbeat
+    return on_loop, lags, elapsed
+
+
+def run(events=2000, budget_ms=1.0, dispatch="send_event", seed=None, isolate=False) -> dict:
+    """
+    budget_ms: the most that the 99th percentile event may hold the loop.
+    with isolate, the receivers run under events.isolated_receivers().
+    """
+    synthetic, sample = _events(events, seed)
+    receivers = async_receivers()
+    with isolated_receivers() if isolate else nullcontext([]) as isolated:
+        inline = run_inline(sample, dispatch, synthetic)
+        before = receivers.stats()
+        on_loop, lags, elapsed = asyncio.run(run_on_loop(sample, dispatch, synthetic))
+        after = receivers.stats()
+
+    loop_aware = _summary(on_loop)
+    loop_aware["loop_lag"] = _summary(lags)
+    loop_aware["completed_per_second"] = round((after["completed"] - before["completed"]) / elapsed, 1)
+    return {
+        "events": events,
+        "budget_ms": budget_ms,
+        "inline": _summary(inline),
+        "loop_aware": loop_aware,
+        "receivers": {key: after[key] - before[key] for key in ("scheduled", "completed", "failed", "dropped")},
+        "within_budget": loop_aware["p99_ms"] is not None and loop_aware["p99_ms"] <= budget_ms,
+        "isolated": isolated,
+    }
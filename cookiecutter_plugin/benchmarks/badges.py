@@ -0,0 +1,115 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:          end-to-end throughput harness for BadgrBoto3Backend, driven
+                against benchmarks.standins.StandInServer in place of Badgr
+                and the CDN.
+"""
+# python stuff
+import uuid
+
+# django stuff
+from django.test.utils import override_settings
+
+# our stuff
+from ..badges.circuit_breaker import breakers
+from .harness import run_concurrent
+from .standins import StandInServer
+
+
+class StandInImage:
+    def __init__(self, name):
+        self.name = name
+
+
+class StandInBadgeClass:
+    """
+    duck-typed stand-in for lms.djangoapps.badges.models.BadgeClass that
+    does not touch the database.
+    """
+
+    def __init__(self, i):
+        self.slug = "bench_badge_{i}".format(i=i)
+        self.display_name = "Benchmark Badge {i}".format(i=i)
+        self.description = "A badge created by the cookiecutter_plugin benchmark harness."
+        self.criteria = "https://lms.example.com/courses/course-v1:edX+Bench+{i}/about".format(i=i)
+        self.image = StandInImage("badge_classes/course_complete_badges/badge-icon-png-{i}.png".format(i=i))
+        self.badgr_server_slug = None
+
+    def save(self):
+        pass
+
+
+def standin_settings(server) -> dict:
+    """
+    django settings that point BadgrBoto3Backend at the stand-in server.
+    AWS_S3_CUSTOM_DOMAIN is the stand-in's host:port, which passes URLValidator
+    in _cookiecutter_boto3_uri().
+    """
+    from cryptography.fernet import Fernet
+
+    netloc = server.url.split("://", 1)[1]
+    return {
+        "BADGR_BASE_URL": server.url,
+        "BADGR_ISSUER_SLUG": "cookiecutter-bench",
+        "BADGR_USERNAME": "bench@example.com",
+        "BADGR_PASSWORD": uuid.uuid4().hex,
+        "BADGR_TOKENS_CACHE_KEY": Fernet.generate_key().decode("utf-8"),
+        "BADGR_TIMEOUT": 10,
+        "AWS_S3_CUSTOM_DOMAIN": netloc,
+        "AWS_STORAGE_BUCKET_NAME": "cookiecutter-bench",
+    }
+
+
+def backend_class():
+    """
+    BadgrBoto3Backend with the CDN uri rewritten from https to http, since the
+    stand-in does not terminate TLS. _cookiecutter_boto3_uri() itself still runs.
+    """
+    from ..badges.backends.badgr_boto3 import BadgrBoto3Backend
+
+    class StandInBadgrBoto3Backend(BadgrBoto3Backend):
+        def _cookiecutter_boto3_uri(self, filename):
+            uri = super()._cookiecutter_boto3_uri(filename)
+            return uri.replace("https://", "http://", 1)
+
+    return StandInBadgrBoto3Backend
+
+
+def run(iterations=200, concurrency=8, server_kwargs=None, behaviors=None, trace_memory=True):
+    """
+    run each badge-path scenario against a fresh stand-in server.
+    returns a list of harness.LoadResult and the stand-in's request stats.
+    """
+    results = []
+    with StandInServer(behaviors=behaviors, **(server_kwargs or {})) as server:
+        with override_settings(**standin_settings(server)):
+            breakers.reset()
+            backend = backend_class()()
+            # warm the Badgr oauth token cache so that the timed loop measures badge creation only.
+            backend._get_headers()
+
+            results.append(
+                run_concurrent(
+                    "_cookiecutter_boto3_uri",
+                    lambda i: backend._cookiecutter_boto3_uri("badge_classes/badge-icon-png-{i}.png".format(i=i)),
+                    iterations,
+                    concurrency,
+                    trace_memory,
+                )
+            )
+            results.append(
+                run_concurrent(
+                    "_create_badge",
+                    lambda i: backend._create_badge(StandInBadgeClass(i)),
+                    iterations,
+                    concurrency,
+                    trace_memory,
+                )
+            )
+        stats = server.stats.as_dict()
+    return results, stats
@@ -0,0 +1,385 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:          synthetic openedx-events payloads, and a load generator that
+                fires them through the real openedx-events signal objects so
+                that the receivers in signals.py run exactly as they do in the LMS.
+                With isolate, they run without their side effects instead. see
+                isolated_receivers()
+"""
+# python stuff
+import itertools
+import multiprocessing
+import random
+import threading
+import time
+import uuid
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timedelta, timezone
+
+# django stuff
+from django.dispatch import Signal
+from django.test.utils import override_settings
+
+# open edx stuff
+from opaque_keys.edx.keys import CourseKey
+from openedx_events.learning import data as events_data
+from openedx_events.learning import signals as events_signals
+
+# our stuff
+from .. import apps
+from .harness import percentile, peak_rss_kb
+
+MODES = ["audit", "verified", "honor", "professional", "no-id-professional", "masters"]
+MODE_WEIGHTS = [60, 25, 5, 5, 3, 2]
+CERTIFICATE_STATUSES = ["downloadable", "notpassing", "unavailable", "generating", "audit_passing"]
+COHORT_NAMES = ["Default Group", "Group A", "Group B", "Instructors", "Auditors"]
+DISCUSSION_PROVIDERS = ["legacy", "openedx", "piazza", "ed-discuss"]
+SOURCEHOSTS = ["lms-7d9f8b6c5-2xk4q", "lms-7d9f8b6c5-8hj2m", "lms-7d9f8b6c5-tq9zp", "lms-worker-5c6f7-lw2bn"]
+
+# the event mix used when none is specified: roughly the shape of a busy LMS.
+DEFAULT_MIX = {
+    apps.SESSION_LOGIN_COMPLETED: 40,
+    apps.COURSE_ENROLLMENT_CREATED: 15,
+    apps.COURSE_ENROLLMENT_CHANGED: 10,
+    apps.COURSE_UNENROLLMENT_COMPLETED: 3,
+    apps.STUDENT_REGISTRATION_COMPLETED: 5,
+    # PERSISTENT_GRADE_SUMMARY_CHANGED has no receiver connected. see apps.py
+    apps.CERTIFICATE_CREATED: 4,
+    apps.CERTIFICATE_CHANGED: 3,
+    apps.CERTIFICATE_REVOKED: 1,
+    apps.COHORT_MEMBERSHIP_CHANGED: 4,
+}
+
+
+def _zipf_weights(n, s=1.1) -> list:
+    return [1.0 / (i + 1) ** s for i in range(n)]
+
+
+class SyntheticEvents:
+    """
+    a fixed population of users and courses, sampled with a zipf-like skew so
+    that a few courses and users dominate, as they do in production.
+    """
+
+    def __init__(self, users=10000, courses=200, seed=None):
+        self.random = random.Random(seed)
+        self.users = [self.user_data(i + 1) for i in range(users)]
+        self.courses = [self.course_data(i + 1) for i in range(courses)]
+        # cumulative weights, so that each draw is a bisect rather than a scan.
+        self.user_weights = list(itertools.accumulate(_zipf_weights(users, 0.6)))
+        self.course_weights = list(itertools.accumulate(_zipf_weights(courses)))
+
+    # -------------------------------------------------------------------------
+    # data classes
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def user_data(user_id):
+        username = "learner{user_id}".format(user_id=user_id)
+        return events_data.UserData(
+            id=user_id,
+            is_active=True,
+            pii=events_data.UserPersonalData(
+                username=username,
+                email="{username}@example.com".format(username=username),
+                name="Learner {user_id}".format(user_id=user_id),
+            ),
+        )
+
+    @staticmethod
+    def course_data(n):
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc) + timedelta(days=n % 180)
+        return events_data.CourseData(
+            course_key=CourseKey.from_string(
+                "course-v1:CookiecutterX+CS{n:03d}+2026_T{term}".format(n=n, term=n % 3 + 1)
+            ),
+            display_name="Cookiecutter Synthetic Course {n}".format(n=n),
+            start=start,
+            end=start + timedelta(days=90),
+        )
+
+    def metadata(self, event_name):
+        signal = getattr(events_signals, event_name)
+        return events_data.EventsMetadata(
+            event_type=signal.event_type,
+            minorversion=0,
+            id=uuid.uuid1(),
+            source="openedx/lms/web",
+            sourcehost=self.random.choice(SOURCEHOSTS),
+            time=datetime.now(timezone.utc),
+            sourcelib=(0, 6, 0),
+        )
+
+    def user(self):
+        return self.random.choices(self.users, cum_weights=self.user_weights)[0]
+
+    def course(self):
+        return self.random.choices(self.courses, cum_weights=self.course_weights)[0]
+
+    def enrollment(self):
+        return events_data.CourseEnrollmentData(
+            user=self.user(),
+            course=self.course(),
+            mode=self.random.choices(MODES, MODE_WEIGHTS)[0],
+            is_active=True,
+            creation_date=datetime.now(timezone.utc),
+            created_by=None,
+        )
+
+    def certificate(self):
+        return events_data.CertificateData(
+            user=self.user(),
+            course=self.course(),
+            mode=self.random.choices(MODES, MODE_WEIGHTS)[0],
+            grade="{grade:.2f}".format(grade=self.random.uniform(0.5, 1.0)),
+            current_status=self.random.choice(CERTIFICATE_STATUSES),
+            download_url="",
+            name="",
+        )
+
+    def cohort(self):
+        return events_data.CohortData(user=self.user(), course=self.course(), name=self.random.choice(COHORT_NAMES))
+
+    def grade(self):
+        course = self.course()
+        percent = round(self.random.uniform(0.0, 1.0), 2)
+        return events_data.PersistentCourseGradeData(
+            user_id=self.user().id,
+            course=course,
+            course_edited_timestamp=course.start,
+            course_version="",
+            grading_policy_hash=uuid.uuid4().hex[:28],
+            percent_grade=percent,
+            letter_grade="Pass" if percent >= 0.5 else "",
+            passed_timestamp=datetime.now(timezone.utc) if percent >= 0.5 else None,
+        )
+
+    def discussion_configuration(self):
+        course = self.course()
+        return events_data.CourseDiscussionConfigurationData(
+            course_key=course.course_key,
+            provider_type=self.random.choice(DISCUSSION_PROVIDERS),
+            enable_in_context=True,
+            enable_graded_units=False,
+            unit_level_visibility=self.random.random() < 0.5,
+            plugin_configuration={"allow_anonymous": False, "allow_anonymous_to_peers": False},
+            contexts=[
+                events_data.DiscussionTopicContext(
+                    title="Unit {n}".format(n=n + 1),
+                    external_id="{course_key}-unit-{n}".format(course_key=course.course_key, n=n + 1),
+                )
+                for n in range(self.random.randint(1, 20))
+            ],
+        )
+
+    def event(self, event_name) -> dict:
+        """
+        the keyword arguments for signal.send_event() for one event.
+        """
+        if event_name in (apps.STUDENT_REGISTRATION_COMPLETED, apps.SESSION_LOGIN_COMPLETED):
+            return {"user": self.user()}
+        if event_name in (
+            apps.COURSE_ENROLLMENT_CREATED,
+            apps.COURSE_ENROLLMENT_CHANGED,
+            apps.COURSE_UNENROLLMENT_COMPLETED,
+        ):
+            return {"enrollment": self.enrollment()}
+        if event_name in (apps.CERTIFICATE_CREATED, apps.CERTIFICATE_CHANGED, apps.CERTIFICATE_REVOKED):
+            return {"certificate": self.certificate()}
+        if event_name == apps.COHORT_MEMBERSHIP_CHANGED:
+            return {"cohort": self.cohort()}
+        if event_name == apps.PERSISTENT_GRADE_SUMMARY_CHANGED:
+            return {"grade": self.grade()}
+        if event_name == apps.COURSE_DISCUSSIONS_CHANGED:
+            return {"configuration": self.discussion_configuration()}
+        raise ValueError("no synthetic payload for {event_name}".format(event_name=event_name))
+
+
+def available_signals(mix) -> dict:
+    """
+    the subset of mix whose signals exist in the installed openedx-events.
+    """
+    return {name: weight for name, weight in mix.items() if weight > 0 and hasattr(events_signals, name)}
+
+
+# the subsystems that isolated_receivers() switches off.
+ISOLATED_SUBSYSTEMS = [
+    "rosters",
+    "certificates",
+    "active_users",
+    "cohorts",
+    "event_sinks",
+    "shared_counters",
+    "heavy_hitters",
+]
+
+
+@contextmanager
+def isolated_receivers():
+    """
+    run the receivers in signals.py without their side effects: no roster or
+    certificate writes, no active user or cohort cache writes, no event sink
+    fan-out, no host-wide shared counters and no heavy hitter sketches. What
+    is left is the cost of the receivers themselves, not of what they feed.
+
+    Each subsystem reads its settings once, into a lazy singleton, so the
+    singletons are replaced for the duration as well. yields ISOLATED_SUBSYSTEMS.
+    """
+    from .. import active_users, certificates, cohorts, heavy_hitters, rosters, shared_counters
+    from ..sinks import base as sinks
+
+    disabled = {
+        "COOKIECUTTER_PLUGIN_ROSTERS": dict(rosters.rosters_settings(), enabled=False),
+        "COOKIECUTTER_PLUGIN_CERTIFICATES": dict(certificates.certificates_settings(), enabled=False),
+        "COOKIECUTTER_PLUGIN_ACTIVE_USERS": dict(active_users.active_users_settings(), enabled=False),
+        "COOKIECUTTER_PLUGIN_COHORTS": dict(cohorts.cohorts_settings(), enabled=False),
+        "COOKIECUTTER_PLUGIN_EVENT_SINKS": {"sinks": {}},
+        "COOKIECUTTER_PLUGIN_SHARED_COUNTERS": dict(shared_counters.shared_counters_settings(), enabled=False),
+        "COOKIECUTTER_PLUGIN_HEAVY_HITTERS": dict(heavy_hitters.heavy_hitters_settings(), enabled=False),
+    }
+    saved = (
+        rosters._index,
+        certificates._index,
+        active_users._estimator,
+        cohorts._index,
+        sinks._sinks,
+        shared_counters._table,
+        shared_counters._unavailable,
+        heavy_hitters._tracker,
+    )
+    with override_settings(**disabled):
+        rosters._index = rosters.RosterIndex()
+        certificates._index = certificates.CertificateStatusIndex()
+        active_users._estimator = active_users.ActiveUserEstimator()
+        cohorts._index = cohorts.CohortIndex()
+        sinks._sinks = sinks.EventSinks.from_settings()
+        # count_event() skips an unavailable table.
+        shared_counters._table, shared_counters._unavailable = None, True
+        heavy_hitters._tracker = heavy_hitters.HeavyHitters()
+        try:
+            yield list(ISOLATED_SUBSYSTEMS)
+        finally:
+            (
+                rosters._index,
+                certificates._index,
+                active_users._estimator,
+                cohorts._index,
+                sinks._sinks,
+                shared_counters._table,
+                shared_counters._unavailable,
+                heavy_hitters._tracker,
+            ) = saved
+
+
+def _fire(event_name, data, dispatch, synthetic):
+    signal = getattr(events_signals, event_name)
+    if dispatch == "send_event":
+        # validates the payload and generates EventsMetadata, exactly as the LMS does.
+        signal.send_event(**data)
+    else:
+        # skip payload validation: django Signal.send() with pre-built EventsMetadata. OpenEdxPublicSignal
+        # overrides send() to raise NotImplementedError, so call django's implementation unbound.
+        Signal.send(signal, sender=None, metadata=synthetic.metadata(event_name), **data)
+
+
+def _worker(worker_id, events, rate, mix, users, courses, dispatch, seed):
+    """
+    fire `events` events at up to `rate` events/sec (0 = unthrottled).
+    returns the list of per-event latencies in seconds.
+    """
+    synthetic = SyntheticEvents(users=users, courses=courses, seed=None if seed is None else seed + worker_id)
+    names = list(mix.keys())
+    weights = list(mix.values())
+    latencies = []
+    interval = 1.0 / rate if rate else 0.0
+    next_due = time.perf_counter()
+    for event_name in synthetic.random.choices(names, weights, k=events):
+        data = synthetic.event(event_name)
+        if interval:
+            delay = next_due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            next_due += interval
+        start = time.perf_counter()
+        _fire(event_name, data, dispatch, synthetic)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def _process_worker(result_queue, *args):
+    result_queue.put(_worker(*args))
+
+
+def generate(
+    events=10000,
+    rate=0,
+    mix=None,
+    users=10000,
+    courses=200,
+    workers=1,
+    processes=False,
+    dispatch="send_event",
+    seed=None,
+    isolate=False,
+) -> dict:
+    """
+    run the load generator and summarize the results.
+    events and rate are totals, divided evenly across workers.
+    with isolate, the receivers run under isolated_receivers().
+    """
+    mix = available_signals(mix or DEFAULT_MIX)
+    per_worker = max(1, events // workers)
+    per_worker_rate = rate / workers if rate else 0
+    args = [(i, per_worker, per_worker_rate, mix, users, courses, dispatch, seed) for i in range(workers)]
+    latencies = []
+
+    with isolated_receivers() if isolate else nullcontext([]) as isolated:
+        start = time.perf_counter()
+        if processes:
+            # fork, so that children inherit django setup and the connected receivers.
+            context = multiprocessing.get_context("fork")
+            result_queue = context.Queue()
+            children = [context.Process(target=_process_worker, args=(result_queue,) + a) for a in args]
+            for child in children:
+                child.start()
+            for _ in children:
+                latencies.extend(result_queue.get())
+            for child in children:
+                child.join()
+        else:
+            lock = threading.Lock()
+
+            def _run(a):
+                result = _worker(*a)
+                with lock:
+                    latencies.extend(result)
+
+            threads = [threading.Thread(target=_run, args=(a,)) for a in args]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    ms = 1000.0
+    return {
+        "events": len(latencies),
+        "elapsed_seconds": round(elapsed, 3),
+        "events_per_second": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * ms, 3) if latencies else None,
+        "p90_ms": round(percentile(latencies, 90) * ms, 3) if latencies else None,
+        "p99_ms": round(percentile(latencies, 99) * ms, 3) if latencies else None,
+        "max_ms": round(latencies[-1] * ms, 3) if latencies else None,
+        "peak_rss_kb": peak_rss_kb(),
+        "peak_rss_children_kb": peak_rss_kb(children=True) if processes else None,
+        "mix": mix,
+        "workers": workers,
+        "mode": "processes" if processes else "threads",
+        "dispatch": dispatch,
+        "isolated": isolated,
+    }
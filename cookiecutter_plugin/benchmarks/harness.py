@@ -0,0 +1,119 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:          drive a callable under concurrent load and report throughput,
+                latency percentiles and memory.
+"""
+# python stuff
+import math
+import resource
+import sys
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+
+def percentile(sorted_values, pct):
+    """
+    nearest-rank percentile of an already sorted list. pct is 0 - 100.
+    """
+    if not sorted_values:
+        return None
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(pct / 100.0 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def peak_rss_kb(children=False) -> int:
+    """
+    peak resident set size of this process (or of its reaped children) in KB.
+    """
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF)
+    # ru_maxrss is reported in bytes on macOS and in KB everywhere else.
+    return usage.ru_maxrss // 1024 if sys.platform == "darwin" else usage.ru_maxrss
+
+
+class LoadResult:
+    def __init__(self, name, latencies, errors, elapsed, tracemalloc_peak, rss_kb):
+        self.name = name
+        self.latencies = sorted(latencies)
+        self.errors = errors
+        self.elapsed = elapsed
+        self.tracemalloc_peak = tracemalloc_peak
+        self.rss_kb = rss_kb
+
+    @property
+    def calls(self) -> int:
+        return len(self.latencies)
+
+    @property
+    def throughput(self) -> float:
+        return self.calls / self.elapsed if self.elapsed else 0.0
+
+    def as_dict(self) -> dict:
+        ms = 1000.0
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "errors": self.errors,
+            "elapsed_seconds": round(self.elapsed, 3),
+            "throughput_per_second": round(self.throughput, 1),
+            "p50_ms": round(percentile(self.latencies, 50) * ms, 3) if self.latencies else None,
+            "p90_ms": round(percentile(self.latencies, 90) * ms, 3) if self.latencies else None,
+            "p99_ms": round(percentile(self.latencies, 99) * ms, 3) if self.latencies else None,
+            "max_ms": round(self.latencies[-1] * ms, 3) if self.latencies else None,
+            "tracemalloc_peak_kb": self.tracemalloc_peak // 1024 if self.tracemalloc_peak is not None else None,
+            "peak_rss_kb": self.rss_kb,
+        }
+
+    def __str__(self):
+        d = self.as_dict()
+        return (
+            "{name}: {calls} calls, {errors} errors in {elapsed_seconds}s = {throughput_per_second}/s | "
+            "p50 {p50_ms}ms p90 {p90_ms}ms p99 {p99_ms}ms max {max_ms}ms | "
+            "tracemalloc peak {tracemalloc_peak_kb}KB, peak rss {peak_rss_kb}KB".format(**d)
+        )
+
+
+def run_concurrent(name, func, iterations, concurrency=1, trace_memory=False):
+    """
+    call func(i) for i in range(iterations) from `concurrency` threads.
+    any exception raised by func is counted as an error; its latency is still recorded.
+    """
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+
+    def _one(i):
+        start = time.perf_counter()
+        failed = False
+        try:
+            func(i)
+        except Exception:  # noqa: B902
+            failed = True
+        elapsed = time.perf_counter() - start
+        with lock:
+            latencies.append(elapsed)
+            if failed:
+                errors[0] += 1
+
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        if concurrency <= 1:
+            for i in range(iterations):
+                _one(i)
+        else:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                list(executor.map(_one, range(iterations)))
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] if trace_memory else None
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+    return LoadResult(name, latencies, errors[0], elapsed, peak, peak_rss_kb())
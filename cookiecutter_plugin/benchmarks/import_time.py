@@ -0,0 +1,143 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:          the import-time cost of the plugin, from python -X importtime.
+
+                Each run is a fresh interpreter that runs django.setup(), which
+                imports the plugin's app config, settings and signals along with
+                the rest of the LMS, and then imports MODULES. The cost of the
+                plugin is the cumulative import time of every plugin module that
+                was not itself imported by another plugin module: its own code,
+                plus whatever else it was first to import.
+"""
+# python stuff
+import os
+import subprocess
+import sys
+
+# our stuff
+from ..settings.common import ENV_FILE_READ
+
+PACKAGE = "cookiecutter_plugin"
+
+# plugin modules that django.setup() does not import, but that are loaded in every LMS process.
+MODULES = [
+    "cookiecutter_plugin.urls",
+    "cookiecutter_plugin.badges.backends.badgr_boto3",
+]
+
+# milliseconds. The sum over the plugin's top-level imports, the best of repeat runs.
+DEFAULT_BUDGET_MS = 150
+
+
+class ImportNode:
+    def __init__(self, name, self_us, cumulative_us, children):
+        self.name = name
+        self.self_us = self_us
+        self.cumulative_us = cumulative_us
+        self.children = children
+
+    @property
+    def is_plugin(self) -> bool:
+        return self.name == PACKAGE or self.name.startswith(PACKAGE + ".")
+
+
+def parse_importtime(stderr) -> list:
+    """
+    the import tree from the stderr of python -X importtime. Lines are written
+    after a module finishes importing, so children come before their parent,
+    one level of indentation (2 spaces) deeper.
+    """
+    pending = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        fields = line[len("import time:") :].split("|")
+        try:
+            self_us, cumulative_us = int(fields[0]), int(fields[1])
+        except ValueError:
+            # the column header.
+            continue
+        name = fields[2].rstrip()
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        node = ImportNode(name.strip(), self_us, cumulative_us, pending.pop(depth + 1, []))
+        pending.setdefault(depth, []).append(node)
+    return pending.get(0, [])
+
+
+def plugin_imports(roots) -> list:
+    """
+    the plugin modules that were not imported by another plugin module.
+    """
+    found = []
+    stack = list(roots)
+    while stack:
+        node = stack.pop()
+        if node.is_plugin:
+            found.append(node)
+        else:
+            stack.extend(node.children)
+    return found
+
+
+def heaviest_dependencies(nodes, limit=10) -> list:
+    """
+    the modules outside the plugin that were first imported by a plugin module, slowest first.
+    """
+    found = []
+    stack = list(nodes)
+    while stack:
+        node = stack.pop()
+        for child in node.children:
+            if child.is_plugin:
+                stack.append(child)
+            else:
+                found.append(child)
+    found.sort(key=lambda node: node.cumulative_us, reverse=True)
+    return [{"module": node.name, "cumulative_ms": round(node.cumulative_us / 1000.0, 2)} for node in found[:limit]]
+
+
+def measure(modules=None, setup=True) -> list:
+    """
+    the plugin's top-level import nodes in a fresh interpreter.
+    """
+    code = "import django\ndjango.setup()\n" if setup else ""
+    code += "".join("import {module}\n".format(module=module) for module in (MODULES if modules is None else modules))
+    env = dict(os.environ)
+    # measure the .env parse too, as a process started without this marker would pay it.
+    env.pop(ENV_FILE_READ, None)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(
+            "import time measurement failed: {stderr}".format(stderr=result.stderr.strip().splitlines()[-1:])
+        )
+    return plugin_imports(parse_importtime(result.stderr))
+
+
+def run(budget_ms=DEFAULT_BUDGET_MS, repeat=3, modules=None, setup=True) -> dict:
+    runs = [measure(modules, setup) for _ in range(repeat)]
+    totals = [sum(node.cumulative_us for node in nodes) for nodes in runs]
+    best = runs[totals.index(min(totals))]
+    total_ms = min(totals) / 1000.0
+    return {
+        "budget_ms": budget_ms,
+        "total_ms": round(total_ms, 2),
+        "runs_ms": [round(total / 1000.0, 2) for total in totals],
+        "within_budget": total_ms <= budget_ms,
+        "modules": sorted(
+            ({"module": node.name, "cumulative_ms": round(node.cumulative_us / 1000.0, 2)} for node in best),
+            key=lambda module: module["cumulative_ms"],
+            reverse=True,
+        ),
+        "heaviest_dependencies": heaviest_dependencies(best),
+    }
@@ -0,0 +1,92 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:          memory and time per event of rendering openedx-events payloads,
+                eager attrs.asdict() copies vs payloads.PayloadView.
+"""
+# python stuff
+import json
+import time
+import tracemalloc
+
+# our stuff
+from ..payloads import BoundedJSONWriter, EventPayload
+from ..utils import PluginJSONEncoder, masked_dict
+from .events import DEFAULT_MIX, SyntheticEvents, available_signals
+
+
+class _NullWriter:
+    """
+    file-like sink for json.dump(), so that the measurements exclude the rendered string.
+    """
+
+    def write(self, chunk):
+        pass
+
+
+def render_eager(payload):
+    json.dump(masked_dict(payload.as_dict()), _NullWriter(), cls=PluginJSONEncoder, indent=4)
+
+
+def render_view(payload):
+    BoundedJSONWriter(_NullWriter().write, indent=4).dump(payload.view())
+
+
+STRATEGIES = {
+    "asdict": render_eager,
+    "view": render_view,
+}
+
+
+def _measure(render, payloads) -> dict:
+    peaks = []
+    for payload in payloads:
+        # restarting tracemalloc resets its peak; tracemalloc.reset_peak() needs python 3.9
+        tracemalloc.start()
+        try:
+            baseline = tracemalloc.get_traced_memory()[0]
+            render(payload)
+            peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+        finally:
+            tracemalloc.stop()
+
+    start = time.perf_counter()
+    for payload in payloads:
+        render(payload)
+    elapsed = time.perf_counter() - start
+
+    peaks.sort()
+    return {
+        "events": len(payloads),
+        "mean_peak_bytes_per_event": round(sum(peaks) / len(peaks), 1) if peaks else None,
+        "max_peak_bytes_per_event": peaks[-1] if peaks else None,
+        "mean_us_per_event": round(elapsed / len(payloads) * 1000000, 2) if payloads else None,
+    }
+
+
+def run(events=2000, mix=None, seed=None) -> dict:
+    synthetic = SyntheticEvents(seed=seed)
+    mix = available_signals(mix or DEFAULT_MIX)
+    names = list(mix.keys())
+    weights = list(mix.values())
+    payloads = []
+    for _ in range(events):
+        event_name = synthetic.random.choices(names, weights)[0]
+        payloads.append(EventPayload(synthetic.metadata(event_name), **synthetic.event(event_name)))
+
+    results = {name: _measure(render, payloads) for name, render in STRATEGIES.items()}
+    eager, view = results["asdict"], results["view"]
+    if eager["mean_peak_bytes_per_event"]:
+        results["peak_bytes_reduction_pct"] = round(
+            100.0 * (1 - view["mean_peak_bytes_per_event"] / eager["mean_peak_bytes_per_event"]), 1
+        )
+    # both strategies must render the same document.
+    results["identical_output"] = all(
+        json.dumps(masked_dict(payload.as_dict()), cls=PluginJSONEncoder, indent=4) == str(payload)
+        for payload in payloads[:100]
+    )
+    return results
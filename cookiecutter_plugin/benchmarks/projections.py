@@ -0,0 +1,69 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:          bytes and time per event of the json line written to the event
+                sinks, whole openedx-events payloads vs the fields configured
+                in settings.COOKIECUTTER_PLUGIN_PROJECTIONS. see projections.py
+"""
+# python stuff
+import time
+
+# our stuff
+from ..projections import Projections, projection_settings
+from ..sinks.base import EventRecord
+from .events import DEFAULT_MIX, SyntheticEvents, available_signals
+
+
+def render_whole(projections, event_name, metadata, data) -> str:
+    return EventRecord(event_name, metadata, data).line
+
+
+def render_projected(projections, event_name, metadata, data) -> str:
+    return EventRecord(event_name, metadata, projections.project(event_name, data)).line
+
+
+STRATEGIES = {
+    "whole": render_whole,
+    "projected": render_projected,
+}
+
+
+def _measure(render, projections, events) -> dict:
+    size = sum(len(render(projections, *event).encode("utf-8")) for event in events)
+    start = time.perf_counter()
+    for event in events:
+        render(projections, *event)
+    elapsed = time.perf_counter() - start
+    return {
+        "events": len(events),
+        "mean_bytes_per_event": round(size / len(events), 1) if events else None,
+        "mean_us_per_event": round(elapsed / len(events) * 1000000, 2) if events else None,
+    }
+
+
+def run(events=2000, mix=None, seed=None) -> dict:
+    synthetic = SyntheticEvents(seed=seed)
+    mix = available_signals(mix or DEFAULT_MIX)
+    names = list(mix.keys())
+    weights = list(mix.values())
+    sample = []
+    for event_name in synthetic.random.choices(names, weights, k=events):
+        sample.append((event_name, synthetic.metadata(event_name), synthetic.event(event_name)))
+
+    # the configured paths, whether or not projection is enabled in this process.
+    projections = Projections(projection_settings()["events"])
+    results = {name: _measure(render, projections, sample) for name, render in STRATEGIES.items()}
+    whole, projected = results["whole"], results["projected"]
+    if whole["mean_bytes_per_event"]:
+        results["bytes_reduction_pct"] = round(
+            100.0 * (1 - projected["mean_bytes_per_event"] / whole["mean_bytes_per_event"]), 1
+        )
+        results["time_reduction_pct"] = round(
+            100.0 * (1 - projected["mean_us_per_event"] / whole["mean_us_per_event"]), 1
+        )
+    results["projections"] = {name: projection.paths for name, projection in projections.projections.items()}
+    return results
@@ -0,0 +1,84 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:          drive the event sinks with synthetic events: a local NDJSON
+                file and SQLite database in a temporary directory, and the
+                http stand-in's collector route with injectable latency.
+                Reports the receiver-side cost of emit() and each sink's metrics.
+"""
+# python stuff
+import os
+import tempfile
+import time
+
+# our stuff
+from ..sinks.base import EventSinks
+from ..sinks.file import FileSink
+from ..sinks.http import HTTPCollectorSink
+from ..sinks.sqlite import SQLiteSink
+from .events import DEFAULT_MIX, SyntheticEvents, available_signals
+from .harness import percentile
+from .standins import RouteBehavior, StandInServer
+
+
+def run(events=20000, rate=0, collector_latency=0.05, sink_options=None, seed=None) -> dict:
+    """
+    sink_options: keyword arguments for every sink, ie {"batch_size": 200, "overflow": "drop_oldest"}
+    """
+    sink_options = sink_options or {}
+    synthetic = SyntheticEvents(seed=seed)
+    mix = available_signals(DEFAULT_MIX)
+    names = list(mix.keys())
+    weights = list(mix.values())
+    interval = 1.0 / rate if rate else 0.0
+
+    with tempfile.TemporaryDirectory() as directory, StandInServer(
+        behaviors={"collector": RouteBehavior(latency=collector_latency)}
+    ) as server:
+        sinks = EventSinks(
+            [
+                FileSink("file", os.path.join(directory, "events.ndjson"), **sink_options),
+                SQLiteSink("sqlite", os.path.join(directory, "events.sqlite3"), **sink_options),
+                HTTPCollectorSink("http", server.url + "/events", **sink_options),
+            ]
+        )
+        latencies = []
+        start = time.perf_counter()
+        for i in range(events):
+            event_name = synthetic.random.choices(names, weights)[0]
+            data = synthetic.event(event_name)
+            metadata = synthetic.metadata(event_name)
+            emitted = time.perf_counter()
+            sinks.emit(event_name, metadata, data)
+            latencies.append(time.perf_counter() - emitted)
+            if interval:
+                delay = start + (i + 1) * interval - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+        elapsed = time.perf_counter() - start
+
+        # what each sink managed to keep up with, before the final drain.
+        during = sinks.stats()
+        sinks.shutdown()
+        after = sinks.stats()
+        file_bytes = os.path.getsize(os.path.join(directory, "events.ndjson"))
+        collector = server.stats.as_dict()
+
+    latencies.sort()
+    us = 1000000.0
+    return {
+        "events": events,
+        "elapsed_seconds": round(elapsed, 3),
+        "emitted_per_second": round(events / elapsed, 1) if elapsed else None,
+        "emit_p50_us": round(percentile(latencies, 50) * us, 2) if latencies else None,
+        "emit_p99_us": round(percentile(latencies, 99) * us, 2) if latencies else None,
+        "emit_max_us": round(latencies[-1] * us, 2) if latencies else None,
+        "sinks_at_end_of_load": during,
+        "sinks_after_drain": after,
+        "file_bytes": file_bytes,
+        "collector": collector,
+    }
@@ -0,0 +1,215 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:
+    in-process http stand-in for the third party services that the plugin
+    talks to. The server listens on an ephemeral localhost port in a daemon
+    thread, and each route has injectable latency, error rate and response
+    payload size.
+
+    routes
+    ------------------------------------------
+    POST /o/token                                   Badgr oauth token endpoint
+    POST /v2/issuers/<issuer>/badgeclasses          Badgr badge-class create endpoint
+    GET  /<anything else>                           CDN / S3 image path
+    POST /<anything else>                           event collector. accepts NDJSON, optionally gzipped
+
+    example
+    ------------------------------------------
+    with StandInServer(latency=0.05, error_rate=0.01, payload_size=20000) as server:
+        server.url       # http://127.0.0.1:54321
+"""
+# python stuff
+import gzip
+import json
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# a minimal, valid png signature followed by padding up to payload_size.
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+class RouteBehavior:
+    """
+    latency and error injection for a single route.
+
+    latency:        seconds added to every response
+    jitter:         up to this many additional seconds, uniformly distributed
+    error_rate:     share of requests answered with error_status
+    payload_size:   size in bytes of the response body, where that is meaningful
+    """
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, error_status=503, payload_size=1024):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.payload_size = payload_size
+
+    def delay(self):
+        seconds = self.latency + (random.random() * self.jitter if self.jitter else 0.0)
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def should_fail(self) -> bool:
+        return self.error_rate > 0 and random.random() < self.error_rate
+
+
+class StandInStats:
+    """
+    thread-safe request counters, kept per route.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = {}
+        self.errors = {}
+        self.bytes_received = 0
+        self.bytes_sent = 0
+        self.events_received = 0
+
+    def record_events(self, count):
+        with self._lock:
+            self.events_received += count
+
+    def record(self, route, received, sent, error):
+        with self._lock:
+            self.requests[route] = self.requests.get(route, 0) + 1
+            if error:
+                self.errors[route] = self.errors.get(route, 0) + 1
+            self.bytes_received += received
+            self.bytes_sent += sent
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {
+                "requests": dict(self.requests),
+                "errors": dict(self.errors),
+                "bytes_received": self.bytes_received,
+                "bytes_sent": self.bytes_sent,
+                "events_received": self.events_received,
+            }
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # headers and body are separate writes. with nagle enabled, keep-alive
+    # clients see the body only after a ~40ms delayed ack.
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        # keep benchmark output clean.
+        pass
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _respond(self, route, status, body, content_type, received):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.server.stats.record(route, received, len(body), status >= 400)
+
+    def _count_events(self, body) -> int:
+        if self.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        return body.count(b"\n")
+
+    def _dispatch(self, route, body_factory, content_type):
+        body = self._read_body()
+        behavior = self.server.behaviors.get(route) or self.server.default_behavior
+        behavior.delay()
+        if behavior.should_fail():
+            self._respond(route, behavior.error_status, b"{}", "application/json", len(body))
+            return
+        if route == "collector":
+            self.server.stats.record_events(self._count_events(body))
+        self._respond(route, 200, body_factory(behavior), content_type, len(body))
+
+    def do_GET(self):
+        self._dispatch("cdn", self.server.image_body, "image/png")
+
+    def do_POST(self):
+        if self.path.rstrip("/").endswith("/o/token"):
+            self._dispatch("token", self.server.token_body, "application/json")
+        elif self.path.rstrip("/").endswith("/badgeclasses"):
+            self._dispatch("badgeclasses", self.server.badgeclass_body, "application/json")
+        else:
+            self._dispatch("collector", self.server.collector_body, "application/json")
+
+
+class StandInServer(ThreadingHTTPServer):
+    """
+    localhost-only http server emulating Badgr and the CDN.
+    behaviors: optional dict of route name ("token", "badgeclasses", "cdn", "collector")
+    to RouteBehavior. Routes without an entry use default_behavior.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, behaviors=None, default_behavior=None, **kwargs):
+        super().__init__(("127.0.0.1", 0), StandInHandler)
+        self.behaviors = behaviors or {}
+        self.default_behavior = default_behavior or RouteBehavior(**kwargs)
+        self.stats = StandInStats()
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return "http://{host}:{port}".format(host=host, port=port)
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, name="cookiecutter-plugin-standin", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    # -------------------------------------------------------------------------
+    # response bodies
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def token_body(behavior) -> bytes:
+        return json.dumps(
+            {
+                "access_token": uuid.uuid4().hex,
+                "refresh_token": uuid.uuid4().hex,
+                "expires_in": 86400,
+                "token_type": "Bearer",
+            }
+        ).encode("utf-8")
+
+    @staticmethod
+    def badgeclass_body(behavior) -> bytes:
+        return json.dumps({"status": {"success": True}, "result": [{"entityId": uuid.uuid4().hex[:22]}]}).encode(
+            "utf-8"
+        )
+
+    @staticmethod
+    def image_body(behavior) -> bytes:
+        return PNG_SIGNATURE + b"\0" * max(0, behavior.payload_size - len(PNG_SIGNATURE))
+
+    @staticmethod
+    def collector_body(behavior) -> bytes:
+        return b"{}"
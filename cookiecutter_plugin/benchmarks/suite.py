@@ -0,0 +1,358 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:
+    regression suite for the plugin's hot paths: every receiver in signals.py,
+    the helpers in utils.py, waffle_init() and BadgrBoto3Backend._create_badge()
+    against benchmarks.standins.StandInServer.
+
+    Each case is measured for time per call (the median of `rounds` rounds of
+    `number` calls) and for peak traced allocation per call (the median of
+    ALLOCATION_SAMPLES single calls). Receivers are fed synthetic openedx-events
+    payloads from benchmarks.events.SyntheticEvents, always without their side
+    effects, so that a run changes nothing outside its own process and
+    measures the receivers alone. see benchmarks.events.isolated_receivers()
+
+    Results are recorded in a versioned baselines file, by default
+    benchmarks/baselines.json next to this module, and later runs are compared
+    with it. The committed file starts with no cases, every one of which is
+    reported as "new" until `make benchmark-baselines` records it on the
+    machine that runs `make check-benchmarks`. A case regresses when it is slower, or allocates more, than its
+    baseline by more than the given threshold.
+
+    see management/commands/cookiecutter_plugin_benchmark_suite.py
+"""
+# python stuff
+import json
+import os
+import platform
+import statistics
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+# django stuff
+from django.test.utils import override_settings
+
+# our stuff
+from .. import apps
+from ..utils import PluginJSONEncoder, flatten_dict, masked_dict, parse_date_string, serialize_course_key
+from ..waffle import SIGNALS, waffle_init, waffle_switches
+from .events import SyntheticEvents, available_signals, isolated_receivers
+
+BASELINES_VERSION = 1
+DEFAULT_BASELINES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+ROUNDS = 5
+ALLOCATION_SAMPLES = 20
+# differences below these are measurement noise, whatever the threshold.
+MIN_TIME_DELTA_US = 0.5
+MIN_ALLOCATION_DELTA_BYTES = 256
+# distinct payloads per case, cycled through by the timed calls.
+SAMPLE_SIZE = 500
+
+# receiver function name: the event whose payload it receives.
+OPENEDX_RECEIVERS = {
+    "student_registration_completed": apps.STUDENT_REGISTRATION_COMPLETED,
+    "session_login_completed": apps.SESSION_LOGIN_COMPLETED,
+    "course_enrollment_created": apps.COURSE_ENROLLMENT_CREATED,
+    "course_enrollment_changed": apps.COURSE_ENROLLMENT_CHANGED,
+    "course_unenrollment_completed": apps.COURSE_UNENROLLMENT_COMPLETED,
+    "certificate_created": apps.CERTIFICATE_CREATED,
+    "certificate_changed": apps.CERTIFICATE_CHANGED,
+    "certificate_revoked": apps.CERTIFICATE_REVOKED,
+    "persistent_grade_summary_changed": apps.PERSISTENT_GRADE_SUMMARY_CHANGED,
+    "cohort_membership_changed": apps.COHORT_MEMBERSHIP_CHANGED,
+    "course_discussions_changed": apps.COURSE_DISCUSSIONS_CHANGED,
+}
+LEGACY_RECEIVERS = ["post_login", "post_logout", "register_user"]
+
+
+class StandInUser:
+    """
+    the attributes of a django User that the legacy receivers read.
+    """
+
+    def __init__(self, user_data):
+        self.id = user_data.id
+        self.username = user_data.pii.username
+
+
+# -----------------------------------------------------------------------------
+# cases. each is a context manager that sets up its inputs and yields func(i)
+# -----------------------------------------------------------------------------
+@contextmanager
+def _signals_enabled():
+    enabled = waffle_switches[SIGNALS]
+    waffle_switches[SIGNALS] = True
+    try:
+        yield
+    finally:
+        waffle_switches[SIGNALS] = enabled
+
+
+@contextmanager
+def openedx_receiver_case(receiver_name, event_name, seed=None):
+    from .. import signals
+
+    synthetic = SyntheticEvents(seed=seed)
+    receiver = getattr(signals, receiver_name)
+    calls = [dict(synthetic.event(event_name), metadata=synthetic.metadata(event_name)) for _ in range(SAMPLE_SIZE)]
+    with _signals_enabled(), isolated_receivers():
+        yield lambda i: receiver(**calls[i % SAMPLE_SIZE])
+
+
+@contextmanager
+def legacy_receiver_case(receiver_name, seed=None):
+    from .. import signals
+
+    synthetic = SyntheticEvents(seed=seed)
+    receiver = getattr(signals, receiver_name)
+    users = [StandInUser(synthetic.user()) for _ in range(SAMPLE_SIZE)]
+    if receiver_name == "register_user":
+        calls = [{"sender": None, "user": user, "registration": None} for user in users]
+    else:
+        calls = [{"sender": None, "request": None, "user": user} for user in users]
+    with _signals_enabled(), isolated_receivers():
+        yield lambda i: receiver(**calls[i % SAMPLE_SIZE])
+
+
+def _payloads(seed) -> list:
+    """
+    attrs payloads of every openedx-events receiver in turn, ie {"enrollment": CourseEnrollmentData}
+    """
+    synthetic = SyntheticEvents(seed=seed)
+    names = list(available_signals({name: 1 for name in OPENEDX_RECEIVERS.values()}).keys())
+    return [synthetic.event(names[i % len(names)]) for i in range(SAMPLE_SIZE)]
+
+
+def _asdicts(seed) -> list:
+    from attr import asdict
+
+    return [
+        {name: asdict(value, value_serializer=serialize_course_key) for name, value in payload.items()}
+        for payload in _payloads(seed)
+    ]
+
+
+@contextmanager
+def serialize_course_key_case(seed=None):
+    """
+    as the value_serializer of attrs.asdict(), the way payloads.build_payload() calls it.
+    """
+    from attr import asdict
+
+    payloads = _payloads(seed)
+    yield lambda i: {
+        name: asdict(value, value_serializer=serialize_course_key) for name, value in payloads[i % SAMPLE_SIZE].items()
+    }
+
+
+@contextmanager
+def flatten_dict_case(seed=None):
+    dicts = _asdicts(seed)
+    yield lambda i: flatten_dict(dicts[i % SAMPLE_SIZE])
+
+
+@contextmanager
+def masked_dict_case(seed=None):
+    dicts = [dict(flatten_dict(d), token="synthetic-token") for d in _asdicts(seed)]
+    yield lambda i: masked_dict(dicts[i % SAMPLE_SIZE])
+
+
+@contextmanager
+def json_encoder_case(seed=None):
+    dicts = [masked_dict(d) for d in _asdicts(seed)]
+    yield lambda i: json.dumps(dicts[i % SAMPLE_SIZE], cls=PluginJSONEncoder, indent=4)
+
+
+@contextmanager
+def parse_date_string_case(seed=None):
+    synthetic = SyntheticEvents(seed=seed)
+    strings = [synthetic.metadata(apps.SESSION_LOGIN_COMPLETED).time.isoformat() for _ in range(SAMPLE_SIZE)]
+    yield lambda i: parse_date_string(strings[i % SAMPLE_SIZE])
+
+
+@contextmanager
+def waffle_init_case(seed=None):
+    yield lambda i: waffle_init()
+
+
+@contextmanager
+def create_badge_case(seed=None):
+    from ..badges.circuit_breaker import breakers
+    from .badges import StandInBadgeClass, backend_class, standin_settings
+    from .standins import StandInServer
+
+    with StandInServer() as server:
+        with override_settings(**standin_settings(server)):
+            breakers.reset()
+            backend = backend_class()()
+            # warm the Badgr oauth token cache so that the timed calls measure badge creation only.
+            backend._get_headers()
+            yield lambda i: backend._create_badge(StandInBadgeClass(i))
+
+
+def cases() -> dict:
+    """
+    {case name: (context manager factory, calls per round)}
+    """
+    result = {}
+    for receiver_name, event_name in OPENEDX_RECEIVERS.items():
+        if available_signals({event_name: 1}):
+            result["signals." + receiver_name] = (
+                lambda seed, r=receiver_name, e=event_name: openedx_receiver_case(r, e, seed),
+                200,
+            )
+    for receiver_name in LEGACY_RECEIVERS:
+        result["signals." + receiver_name] = (lambda seed, r=receiver_name: legacy_receiver_case(r, seed), 1000)
+    result.update(
+        {
+            "utils.masked_dict": (masked_dict_case, 2000),
+            "utils.flatten_dict": (flatten_dict_case, 2000),
+            "utils.PluginJSONEncoder": (json_encoder_case, 1000),
+            "utils.serialize_course_key": (serialize_course_key_case, 1000),
+            "utils.parse_date_string": (parse_date_string_case, 2000),
+            "waffle.waffle_init": (waffle_init_case, 20),
+            "BadgrBoto3Backend._create_badge": (create_badge_case, 20),
+        }
+    )
+    return result
+
+
+# -----------------------------------------------------------------------------
+# measurement
+# -----------------------------------------------------------------------------
+def measure(func, number, rounds=ROUNDS) -> dict:
+    for i in range(min(number, 20)):
+        func(i)
+
+    per_call = []
+    for r in range(rounds):
+        start = time.perf_counter()
+        for i in range(r * number, (r + 1) * number):
+            func(i)
+        per_call.append((time.perf_counter() - start) / number)
+
+    peaks = []
+    for i in range(ALLOCATION_SAMPLES):
+        # restarting tracemalloc resets its peak; tracemalloc.reset_peak() needs python 3.9
+        tracemalloc.start()
+        try:
+            baseline = tracemalloc.get_traced_memory()[0]
+            func(i)
+            peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+        finally:
+            tracemalloc.stop()
+
+    return {
+        "us_per_call": round(statistics.median(per_call) * 1000000, 2),
+        "min_us_per_call": round(min(per_call) * 1000000, 2),
+        "alloc_bytes_per_call": int(statistics.median(peaks)),
+    }
+
+
+def run(only=None, rounds=ROUNDS, seed=0) -> dict:
+    """
+    only: measure just the cases whose names contain one of these strings.
+    """
+    results = {}
+    for name, (case, number) in cases().items():
+        if only and not any(pattern in name for pattern in only):
+            continue
+        try:
+            with case(seed) as func:
+                results[name] = measure(func, number, rounds)
+        except Exception as e:  # noqa: B902
+            results[name] = {"error": "{kind}: {e}".format(kind=type(e).__name__, e=e)}
+    return results
+
+
+# -----------------------------------------------------------------------------
+# baselines
+# -----------------------------------------------------------------------------
+def environment() -> dict:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+    }
+
+
+def save_baselines(results, path=DEFAULT_BASELINES, merge=True):
+    """
+    write the results that did not fail. with merge, cases not measured this time keep their baseline.
+    """
+    recorded = {}
+    if merge and os.path.exists(path):
+        recorded = load_baselines(path)["cases"]
+    recorded.update({name: result for name, result in results.items() if "error" not in result})
+    document = {
+        "version": BASELINES_VERSION,
+        "recorded": datetime.now(timezone.utc).isoformat(),
+        "environment": environment(),
+        "cases": dict(sorted(recorded.items())),
+    }
+    with open(path + ".tmp", "w") as f:
+        json.dump(document, f, indent=4)
+        f.write("\n")
+    os.replace(path + ".tmp", path)
+    return document
+
+
+def load_baselines(path=DEFAULT_BASELINES) -> dict:
+    with open(path) as f:
+        document = json.load(f)
+    if document.get("version") != BASELINES_VERSION:
+        raise ValueError(
+            "{path} is baselines version {found}, expected {expected}. record new baselines.".format(
+                path=path, found=document.get("version"), expected=BASELINES_VERSION
+            )
+        )
+    return document
+
+
+def _regressed(current, baseline, threshold, min_delta) -> bool:
+    return current > baseline * (1 + threshold) and current - baseline > min_delta
+
+
+def compare(results, baselines, threshold=0.25, alloc_threshold=0.10) -> dict:
+    """
+    {case name: {"status": "ok" | "regressed" | "failed" | "new", ...}} for every measured case.
+    """
+    report = {}
+    for name, result in results.items():
+        baseline = baselines["cases"].get(name)
+        if "error" in result:
+            report[name] = dict(result, status="failed")
+            continue
+        if baseline is None:
+            report[name] = dict(result, status="new")
+            continue
+        regressions = []
+        if _regressed(result["us_per_call"], baseline["us_per_call"], threshold, MIN_TIME_DELTA_US):
+            regressions.append("time")
+        if _regressed(
+            result["alloc_bytes_per_call"],
+            baseline["alloc_bytes_per_call"],
+            alloc_threshold,
+            MIN_ALLOCATION_DELTA_BYTES,
+        ):
+            regressions.append("allocation")
+        report[name] = {
+            "status": "regressed" if regressions else "ok",
+            "regressions": regressions,
+            "us_per_call": result["us_per_call"],
+            "baseline_us_per_call": baseline["us_per_call"],
+            "time_change_pct": round(100.0 * (result["us_per_call"] / baseline["us_per_call"] - 1), 1)
+            if baseline["us_per_call"]
+            else None,
+            "alloc_bytes_per_call": result["alloc_bytes_per_call"],
+            "baseline_alloc_bytes_per_call": baseline["alloc_bytes_per_call"],
+        }
+    return report
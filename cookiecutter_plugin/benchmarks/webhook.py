@@ -0,0 +1,91 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:          drive sinks.webhook.WebhookForwarder with synthetic events
+                against the http stand-in's collector route, and report
+                delivered events/sec and bytes on the wire.
+"""
+# python stuff
+import tempfile
+import time
+
+# our stuff
+from ..sinks.base import EventSinks
+from ..sinks.webhook import WebhookForwarder
+from .events import DEFAULT_MIX, SyntheticEvents, available_signals
+from .standins import RouteBehavior, StandInServer
+
+# name: WebhookForwarder options. "per_event" approximates posting from the receivers, one request per event.
+CONFIGURATIONS = {
+    "gzip_batched": {},
+    "plain_batched": {"compresslevel": 0},
+    "per_event": {"batch_size": 1, "max_in_flight": 1, "compresslevel": 0},
+}
+
+
+def _events(count, seed):
+    synthetic = SyntheticEvents(seed=seed)
+    mix = available_signals(DEFAULT_MIX)
+    names = list(mix.keys())
+    weights = list(mix.values())
+    events = []
+    for _ in range(count):
+        event_name = synthetic.random.choices(names, weights)[0]
+        events.append((event_name, synthetic.metadata(event_name), synthetic.event(event_name)))
+    return events
+
+
+def run_one(name, events, options, collector_latency=0.0, error_rate=0.0) -> dict:
+    behavior = RouteBehavior(latency=collector_latency, error_rate=error_rate)
+    with tempfile.TemporaryDirectory() as spill_directory, StandInServer(behaviors={"collector": behavior}) as server:
+        options = dict({"spill_directory": spill_directory, "max_buffer": len(events), "backoff_base": 0.05}, **options)
+        forwarder = WebhookForwarder(name, server.url + "/events", **options)
+        sinks = EventSinks([forwarder])
+        start = time.perf_counter()
+        for event_name, metadata, data in events:
+            sinks.emit(event_name, metadata, data)
+        # shutdown() drains the buffer and waits for every in-flight batch, retries included.
+        sinks.shutdown()
+        elapsed = time.perf_counter() - start
+        collector = server.stats.as_dict()
+
+    stats = forwarder.stats()
+    delivered = collector["events_received"]
+    return {
+        "name": name,
+        "options": {key: value for key, value in options.items() if key != "spill_directory"},
+        "events": len(events),
+        "delivered": delivered,
+        "spilled": stats["spilled"],
+        "dropped": stats["dropped"],
+        "elapsed_seconds": round(elapsed, 3),
+        "delivered_per_second": round(delivered / elapsed, 1) if elapsed else None,
+        "requests": stats["requests"],
+        "retries": stats["retries"],
+        "bytes_raw": stats["bytes_raw"],
+        "bytes_on_wire": collector["bytes_received"],
+        "bytes_on_wire_per_event": round(collector["bytes_received"] / delivered, 1) if delivered else None,
+        "compression_ratio": stats["compression_ratio"],
+    }
+
+
+def run(events=20000, per_event_events=1000, collector_latency=0.005, error_rate=0.0, options=None, seed=None):
+    """
+    options: WebhookForwarder options applied to the batched configurations.
+    """
+    synthetic_events = _events(events, seed)
+    results = []
+    for name, configuration in CONFIGURATIONS.items():
+        if name == "per_event":
+            # unbatched delivery is slow by design; a smaller sample is enough to compare rates.
+            sample = synthetic_events[:per_event_events]
+            configuration = dict(configuration)
+        else:
+            sample = synthetic_events
+            configuration = dict(options or {}, **configuration)
+        results.append(run_one(name, sample, configuration, collector_latency, error_rate))
+    return results
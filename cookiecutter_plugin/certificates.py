@@ -0,0 +1,180 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:
+    materialized certificate status table, models.CertificateStatus.
+
+    certificate_created, certificate_changed and certificate_revoked in
+    signals.py report the latest status of a (user, course) certificate.
+    Statuses are coalesced in memory and written in bulk upserts by a timer
+    (see batching.py) rather than one write per event. Rows only move
+    forward in time: an event older than the stored row is ignored.
+
+    ./manage.py lms cookiecutter_plugin_backfill_certificates loads the table from certificates_generatedcertificate.
+    read api: /cookiecutter_plugin/api/v1/certificates/<course_key>/?status=downloadable&after=<user_id>&limit=100
+
+    configured in settings.COOKIECUTTER_PLUGIN_CERTIFICATES. see settings/common.py
+"""
+# python stuff
+import functools
+import logging
+import operator
+import threading
+
+# django stuff
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+# our stuff
+from .batching import CoalescingBuffer
+
+log = logging.getLogger(__name__)
+
+DEFAULTS = {
+    "enabled": True,
+    "flush_interval": 5,
+    "batch_size": 1000,
+    "max_pending": 100000,
+}
+
+# see lms.djangoapps.certificates.data.CertificateStatuses
+DOWNLOADABLE = "downloadable"
+VALID_STATUSES = (DOWNLOADABLE,)
+REVOKED_STATUS = "unavailable"
+
+MAX_PAGE_SIZE = 1000
+
+
+def certificates_settings() -> dict:
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, "COOKIECUTTER_PLUGIN_CERTIFICATES", None) or {})
+    return config
+
+
+def write_rows(rows: dict):
+    """
+    bulk upsert of {(user_id, course_key): (mode, status, updated)}
+    """
+    from .models import CertificateStatus
+
+    if not rows:
+        return
+    # exactly the rows of this batch, so that concurrent flushes only contend for the pairs they share.
+    pairs = functools.reduce(
+        operator.or_, (Q(user_id=user_id, course_key=course_key) for user_id, course_key in sorted(rows))
+    )
+
+    for attempt in (1, 2):
+        try:
+            with transaction.atomic():
+                # locked in primary key order, the same order in every worker.
+                existing = {
+                    (row.user_id, str(row.course_key)): row
+                    for row in CertificateStatus.objects.select_for_update().filter(pairs).order_by("pk")
+                }
+                updates = []
+                creates = []
+                for (user_id, course_key), (mode, status, updated) in rows.items():
+                    row = existing.get((user_id, course_key))
+                    if row is None:
+                        creates.append(
+                            CertificateStatus(
+                                user_id=user_id, course_key=course_key, mode=mode, status=status, updated=updated
+                            )
+                        )
+                    elif row.updated <= updated:
+                        row.mode, row.status, row.updated = mode, status, updated
+                        updates.append(row)
+                if updates:
+                    CertificateStatus.objects.bulk_update(updates, ["mode", "status", "updated"])
+                if creates:
+                    CertificateStatus.objects.bulk_create(creates)
+            return
+        except IntegrityError:
+            # another worker inserted one of these rows first. retry once as an update.
+            if attempt == 2:
+                raise
+
+
+class CertificateStatusIndex:
+    def __init__(self, config=None):
+        self.config = config or certificates_settings()
+        self.buffer = CoalescingBuffer(
+            "certificates",
+            write_rows,
+            flush_interval=self.config["flush_interval"],
+            batch_size=self.config["batch_size"],
+            max_pending=self.config["max_pending"],
+        )
+
+    def record(self, user_id, course_key, mode, status, updated=None):
+        if not self.config["enabled"] or user_id is None or course_key is None:
+            return
+        key = (user_id, str(course_key))
+        if updated is None:
+            updated = timezone.now()
+        elif timezone.is_naive(updated):
+            # EventsMetadata.time is utc, but older openedx-events releases leave it naive.
+            updated = timezone.make_aware(updated, timezone.utc)
+        self.buffer.put(key, (mode or "", status or "", updated))
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def certificate_index() -> CertificateStatusIndex:
+    global _index
+
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = CertificateStatusIndex()
+    return _index
+
+
+def record_certificate(certificate, metadata=None, revoked=False):
+    """
+    called from the certificate receivers in signals.py with a CertificateData
+    """
+    status = certificate.current_status
+    if revoked and status in VALID_STATUSES:
+        status = REVOKED_STATUS
+    certificate_index().record(
+        certificate.user.id,
+        certificate.course.course_key,
+        certificate.mode,
+        status,
+        updated=getattr(metadata, "time", None),
+    )
+
+
+def list_certificates(course_key, status=DOWNLOADABLE, after=0, limit=100) -> dict:
+    """
+    keyset-paginated certificate statuses of a course, ordered by user_id.
+    status=None returns every status.
+    """
+    from .models import CertificateStatus
+
+    limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+    queryset = CertificateStatus.objects.filter(course_key=course_key, user_id__gt=after)
+    if status:
+        queryset = queryset.filter(status=status)
+    rows = list(queryset.order_by("user_id").values_list("user_id", "mode", "status", "updated")[: limit + 1])
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    return {
+        "course_key": str(course_key),
+        "status": status,
+        "results": [
+            {"user_id": user_id, "mode": mode, "status": row_status, "updated": updated.isoformat()}
+            for user_id, mode, row_status, updated in rows
+        ],
+        "next_after": rows[-1][0] if has_more else None,
+    }
@@ -0,0 +1,346 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:
+    incrementally maintained user-to-cohort index, one cohort per user per course.
+
+    get_user_cohort(course_key, user_id) answers from a process-local LRU,
+    then from a shared django cache entry, and only on a miss in both from
+    course_groups' CohortMembership, whose answer is then cached.
+
+    cohort_membership_changed in signals.py writes each new membership
+    through to the shared cache and appends the (course, user) pair to a
+    short change log, also in the shared cache. Every process polls the log's
+    sequence number at most once per sync_interval seconds and evicts exactly
+    the changed entries from its LRU. If it has fallen more than max_changes
+    behind, or a change record has expired, it clears its whole LRU instead.
+
+    CohortMembership deletions do not send COHORT_MEMBERSHIP_CHANGED. the shared
+    entry of a user removed from every cohort of a course lasts until its timeout
+    or until ./manage.py lms cookiecutter_plugin_rebuild_cohorts. Every shared
+    entry's key carries two generation numbers, one for the whole index and one
+    for its course. A rebuild increments the first, or with --course-key only
+    that course's, before it caches the memberships again. Entries of earlier
+    generations are never read again, and expire with their timeout.
+
+    read api: /cookiecutter_plugin/api/v1/cohorts/<course_key>/<user_id>/
+
+    configured in settings.COOKIECUTTER_PLUGIN_COHORTS. see settings/common.py
+"""
+# python stuff
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+# django stuff
+from django.conf import settings
+from django.core.cache import caches
+
+log = logging.getLogger(__name__)
+
+DEFAULTS = {
+    "enabled": True,
+    "cache_alias": "default",
+    # seconds that a shared cache entry lives, ie the longest that a deleted membership is reported.
+    "timeout": 86400,
+    # (course, user) pairs held by each process.
+    "max_entries": 100000,
+    # seconds between checks of the shared change log.
+    "sync_interval": 1.0,
+    # change records kept in the shared cache.
+    "max_changes": 1000,
+}
+
+CACHE_KEY_PREFIX = "cookiecutter_plugin.cohort"
+SEQUENCE_KEY = CACHE_KEY_PREFIX + ".changes"
+GENERATION_KEY = CACHE_KEY_PREFIX + ".generation"
+# cached for a user who is in none of a course's cohorts.
+NO_COHORT = ""
+# a change record that evicts every entry, ie after a rebuild.
+ALL = "*"
+_MISSING = object()
+
+
+def cohorts_settings() -> dict:
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, "COOKIECUTTER_PLUGIN_COHORTS", None) or {})
+    return config
+
+
+def cache_key(course_key, user_id, generation=0, course_generation=0) -> str:
+    return "{prefix}.{generation}.{course_generation}.{course_key}.{user_id}".format(
+        prefix=CACHE_KEY_PREFIX,
+        generation=generation,
+        course_generation=course_generation,
+        course_key=course_key,
+        user_id=user_id,
+    )
+
+
+def generation_key(course_key) -> str:
+    return "{key}.{course_key}".format(key=GENERATION_KEY, course_key=course_key)
+
+
+def change_key(sequence) -> str:
+    return "{key}.{sequence}".format(key=SEQUENCE_KEY, sequence=sequence)
+
+
+def load_membership(course_key, user_id) -> str:
+    """
+    the user's cohort name, or NO_COHORT, from course_groups' CohortMembership.
+    """
+    from opaque_keys.edx.keys import CourseKey
+    from openedx.core.djangoapps.course_groups.models import CohortMembership
+
+    name = (
+        CohortMembership.objects.filter(course_id=CourseKey.from_string(course_key), user_id=user_id)
+        .values_list("course_user_group__name", flat=True)
+        .first()
+    )
+    return name or NO_COHORT
+
+
+class CohortIndex:
+    def __init__(self, config=None, clock=time.monotonic):
+        self.config = config or cohorts_settings()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._sequence = None
+        self._generation = 0
+        # {course_key: generation}, read from the shared cache on first use.
+        self._course_generations = {}
+        self._last_sync = None
+
+        self.local_hits = 0
+        self.shared_hits = 0
+        self.loads = 0
+        self.evictions = 0
+        self.resets = 0
+
+    def _cache(self):
+        return caches[self.config["cache_alias"]]
+
+    # -------------------------------------------------------------------------
+    # process-local LRU
+    # -------------------------------------------------------------------------
+    def _remember(self, key, name):
+        with self._lock:
+            self._entries[key] = name
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.config["max_entries"]:
+                self._entries.popitem(last=False)
+
+    def _forget(self, keys):
+        """
+        keys: ALL, or (course_key, user_id) pairs, where a user_id of ALL is every entry of the course.
+        """
+        with self._lock:
+            if keys is ALL:
+                self._entries.clear()
+                self._course_generations.clear()
+                self.resets += 1
+                return
+            for key in keys:
+                if key[1] == ALL:
+                    self._course_generations.pop(key[0], None)
+                    stale = [entry for entry in self._entries if entry[0] == key[0]]
+                    for entry in stale:
+                        del self._entries[entry]
+                    self.evictions += len(stale)
+                elif self._entries.pop(key, None) is not None:
+                    self.evictions += 1
+
+    def sync(self, force=False):
+        """
+        evict the entries changed by other processes since the last sync, or
+        every entry if the whole index has moved to a new generation.
+        """
+        now = self._clock()
+        if not force and self._last_sync is not None and now - self._last_sync < self.config["sync_interval"]:
+            return
+        self._last_sync = now
+        try:
+            cache = self._cache()
+            # 0: nothing was ever logged or rebuilt, or the cache lost the counter.
+            counters = cache.get_many([SEQUENCE_KEY, GENERATION_KEY])
+            sequence = counters.get(SEQUENCE_KEY, 0)
+            generation = counters.get(GENERATION_KEY, 0)
+            seen = self._sequence
+            if sequence == seen and generation == self._generation:
+                return
+            if seen is None or generation != self._generation:
+                # first sync, or the whole index was rebuilt.
+                changes = [ALL]
+            elif sequence < seen or sequence - seen > self.config["max_changes"]:
+                # too far behind to replay the log.
+                changes = [ALL]
+            else:
+                keys = [change_key(n) for n in range(seen + 1, sequence + 1)]
+                records = cache.get_many(keys)
+                changes = [ALL] if len(records) < len(keys) else [records[key] for key in keys]
+        except Exception as e:  # noqa: B902
+            log.warning("cookiecutter_plugin could not read the cohort change log: %s", e)
+            return
+        self._forget(ALL if ALL in changes else [tuple(change) for change in changes])
+        self._sequence = sequence
+        self._generation = generation
+
+    def _key(self, cache, course_key, user_id) -> str:
+        course_generation = self._course_generations.get(course_key)
+        if course_generation is None:
+            course_generation = cache.get(generation_key(course_key), 0)
+            self._course_generations[course_key] = course_generation
+        return cache_key(course_key, user_id, self._generation, course_generation)
+
+    # -------------------------------------------------------------------------
+    # reads
+    # -------------------------------------------------------------------------
+    def get(self, course_key, user_id):
+        """
+        the name of the user's cohort in the course, or None if they are in none.
+        """
+        key = (str(course_key), user_id)
+        if not self.config["enabled"]:
+            return load_membership(*key) or None
+        self.sync()
+        with self._lock:
+            name = self._entries.get(key, _MISSING)
+            if name is not _MISSING:
+                self._entries.move_to_end(key)
+                self.local_hits += 1
+                return name or None
+
+        try:
+            cache = self._cache()
+            shared_key = self._key(cache, *key)
+            name = cache.get(shared_key)
+        except Exception as e:  # noqa: B902
+            log.warning("cookiecutter_plugin could not read the cohort index: %s", e)
+            name = None
+            shared_key = None
+        if name is not None:
+            self.shared_hits += 1
+        else:
+            name = load_membership(*key)
+            self.loads += 1
+            try:
+                # add(), not set(): never overwrite a membership written by the receiver meanwhile.
+                if shared_key is not None:
+                    self._cache().add(shared_key, name, timeout=self.config["timeout"])
+            except Exception as e:  # noqa: B902
+                log.warning("cookiecutter_plugin could not write the cohort index: %s", e)
+        self._remember(key, name)
+        return name or None
+
+    # -------------------------------------------------------------------------
+    # writes
+    # -------------------------------------------------------------------------
+    def store(self, memberships: dict):
+        """
+        write {(course_key, user_id): cohort name or NO_COHORT} to the shared cache.
+        """
+        cache = self._cache()
+        cache.set_many(
+            {self._key(cache, str(course_key), user_id): name for (course_key, user_id), name in memberships.items()},
+            timeout=self.config["timeout"],
+        )
+
+    def publish(self, memberships: dict):
+        """
+        write memberships through to the shared cache, and log the change so
+        that other processes evict them.
+        """
+        memberships = {(str(course_key), user_id): name for (course_key, user_id), name in memberships.items()}
+        # writes go to the current generation.
+        self.sync()
+        for key, name in memberships.items():
+            self._remember(key, name)
+        try:
+            self.store(memberships)
+            self._log_changes(self._cache(), list(memberships.keys()))
+        except Exception as e:  # noqa: B902
+            log.warning("cookiecutter_plugin could not update the cohort index: %s", e)
+
+    def reset(self, course_key=None):
+        """
+        start a new generation of shared entries, empty until they are read or
+        stored again, and make every process drop the matching entries of its
+        LRU. ie before a rebuild. Only the course's entries if course_key is given.
+        """
+        if course_key is None:
+            key, change = GENERATION_KEY, ALL
+        else:
+            course_key = str(course_key)
+            key, change = generation_key(course_key), (course_key, ALL)
+        self._forget(ALL if change is ALL else [change])
+        try:
+            cache = self._cache()
+            cache.add(key, 0, timeout=None)
+            generation = cache.incr(key)
+            if course_key is None:
+                self._generation = generation
+            else:
+                self._course_generations[course_key] = generation
+            self._log_changes(cache, [change])
+        except Exception as e:  # noqa: B902
+            log.warning("cookiecutter_plugin could not reset the cohort index: %s", e)
+
+    def _log_changes(self, cache, changes):
+        cache.add(SEQUENCE_KEY, 0, timeout=None)
+        # the change log's lifetime is measured in sync intervals, not in entry timeouts.
+        timeout = max(60, int(self.config["sync_interval"] * self.config["max_changes"]))
+        if len(changes) > self.config["max_changes"]:
+            changes = [ALL]
+        for change in changes:
+            cache.set(change_key(cache.incr(SEQUENCE_KEY)), change, timeout=timeout)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.config["max_entries"],
+                "sequence": self._sequence,
+                "generation": self._generation,
+                "local_hits": self.local_hits,
+                "shared_hits": self.shared_hits,
+                "loads": self.loads,
+                "evictions": self.evictions,
+                "resets": self.resets,
+            }
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def cohort_index() -> CohortIndex:
+    global _index
+
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = CohortIndex()
+    return _index
+
+
+def record_cohort_membership(cohort):
+    """
+    called from the cohort receiver in signals.py with a CohortData
+    """
+    index = cohort_index()
+    if not index.config["enabled"] or cohort.user is None or cohort.course is None:
+        return
+    index.publish({(cohort.course.course_key, cohort.user.id): cohort.name or NO_COHORT})
+
+
+def get_user_cohort(course_key, user_id):
+    """
+    the name of the user's cohort in the course, or None if they are in none.
+    """
+    return cohort_index().get(course_key, user_id)
@@ -0,0 +1,124 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:
+    the single path by which the openedx-events receivers in signals.py
+    hand off an event for processing: logging, and fan-out to the
+    configured event sinks (see sinks/base.py).
+
+    settings.COOKIECUTTER_PLUGIN_EVENT_EXECUTION["mode"] selects where that
+    processing happens:
+
+    inline          in the receiver, on the request thread. the default.
+    process_pool    in a pool of separate worker processes, sharded by
+                    user id so that each user's events are processed in
+                    the order they were received. see workers.py
+
+    Before either, the payload is reduced to the fields configured for its
+    event type in settings.COOKIECUTTER_PLUGIN_PROJECTIONS. see projections.py
+"""
+# python stuff
+import logging
+
+# django stuff
+from django.conf import settings
+
+# our stuff
+from .heavy_hitters import track_event
+from .payloads import EventPayload
+from .projections import project_event
+from .shared_counters import count_event
+from .sinks.base import event_sinks
+
+log = logging.getLogger("cookiecutter_plugin.signals")
+
+INLINE = "inline"
+PROCESS_POOL = "process_pool"
+
+DEFAULTS = {
+    "mode": INLINE,
+    "processes": 2,
+    # maximum number of events waiting for each worker process.
+    "queue_size": 10000,
+    # seconds between supervisor checks for dead worker processes.
+    "supervise_interval": 1.0,
+    # seconds to wait for the workers to drain their queues at shutdown.
+    "drain_timeout": 5.0,
+}
+
+
+def execution_settings() -> dict:
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, "COOKIECUTTER_PLUGIN_EVENT_EXECUTION", None) or {})
+    return config
+
+
+def event_user_id(data: dict):
+    """
+    the user id of an openedx-events payload, ie {"enrollment": CourseEnrollmentData}
+
+    {"user": UserData}                          UserData.id
+    {"grade": PersistentCourseGradeData}        .user_id
+    enrollment, certificate and cohort data     .user.id
+    {"configuration": ...}                      None: course-wide, not a user's event
+    """
+    for value in data.values():
+        if getattr(value, "pii", None) is not None:
+            # UserData itself, ie STUDENT_REGISTRATION_COMPLETED and SESSION_LOGIN_COMPLETED
+            return getattr(value, "id", None)
+        user_id = getattr(value, "user_id", None)
+        if user_id is not None:
+            return user_id
+        user = getattr(value, "user", None)
+        if user is not None:
+            return getattr(user, "id", None)
+    return None
+
+
+def event_course_key(data: dict):
+    """
+    the course key of an openedx-events payload, ie {"enrollment": CourseEnrollmentData}
+    """
+    for value in data.values():
+        course = getattr(value, "course", None)
+        if course is not None:
+            return getattr(course, "course_key", None)
+        course_key = getattr(value, "course_key", None)
+        if course_key is not None:
+            return course_key
+    return None
+
+
+def handle_event(signal_name, metadata, data: dict):
+    """
+    process one event. Runs in the receiver or in a worker process.
+    """
+    if log.isEnabledFor(logging.INFO):
+        log.info("cookiecutter_plugin received %s signal for %s", signal_name, EventPayload(metadata, **data))
+    event_sinks().emit(signal_name, metadata, data)
+
+
+_mode = None
+
+
+def dispatch_event(signal_name, metadata, **data):
+    global _mode
+
+    count_event(signal_name)
+    user_id = event_user_id(data)
+    track_event(signal_name, event_course_key(data), user_id)
+    if _mode is None:
+        _mode = execution_settings()["mode"]
+    projected = project_event(signal_name, data)
+    if _mode == PROCESS_POOL:
+        from .workers import worker_pool
+
+        # shard by the user id of the whole payload: a projection may leave it out.
+        if worker_pool().submit(signal_name, metadata, projected, user_id):
+            return
+        # the pool is shutting down. process the event here instead.
+    handle_event(signal_name, metadata, projected)
@@ -0,0 +1,614 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:
+    compact, columnar archives of the NDJSON event logs written by the event
+    sinks (see sinks/file.py), and a reader that scans them by event type or
+    course without decoding everything.
+
+    ./manage.py lms cookiecutter_plugin_compact_events /openedx/data/events.ndjson --output events.ccpa
+    ./manage.py lms cookiecutter_plugin_scan_events events.ccpa --event-name COURSE_ENROLLMENT_CREATED
+
+    Events are read one line at a time and written in chunks of chunk_size
+    events. Within a chunk each event is flattened to dotted column names,
+    ie enrollment.course.course_key, and every column is stored on its own:
+
+    string      dictionary-encoded: the distinct values once, then one small integer per event
+    int         frame-of-reference packed: the minimum, then each value's offset from
+                it in the narrowest of 1, 2, 4 or 8 bytes
+    timestamp   iso 8601 strings as microseconds since the epoch, delta-encoded then packed as int
+    uuid        16 bytes per value
+    float       8 bytes per value
+    bool        1 byte per value
+    json        anything else (lists, mixed types), dictionary-encoded as json
+
+    plus one byte per event for missing / null / present. Each column is
+    compressed separately with zlib. Dictionaries of up to INLINE_DICTIONARY
+    values, ie event names, hosts, enrollment modes and course keys, are
+    kept in the chunk header, so a scan for one event type or course skips
+    every chunk that does not contain it after reading only the header.
+
+    file layout, little-endian:
+
+    magic
+    chunk       header length (uint32), body length (uint32), zlib(json header), column blobs
+    chunk       ...
+"""
+# python stuff
+import gzip
+import itertools
+import json
+import os
+import struct
+import sys
+import uuid
+import zlib
+from array import array
+from datetime import datetime, timedelta, timezone
+
+MAGIC = b"CCPEVA1\n"
+CHUNK_HEADER = struct.Struct("<II")
+
+CHUNK_SIZE = 10000
+COMPRESSLEVEL = 6
+# dictionaries of at most this many values are stored in the chunk header.
+INLINE_DICTIONARY = 256
+
+STRING = "string"
+INT = "int"
+TIMESTAMP = "timestamp"
+UUID = "uuid"
+FLOAT = "float"
+BOOL = "bool"
+JSON = "json"
+
+# the state of a column in one event.
+MISSING = 0
+NULL = 1
+PRESENT = 2
+
+INT64_MIN = -(1 << 63)
+INT64_MAX = (1 << 63) - 1
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+NAIVE_EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+
+_missing = object()
+
+
+class ArchiveError(Exception):
+    pass
+
+
+def flatten_event(event, prefix="", flat=None) -> dict:
+    """
+    {"enrollment": {"mode": "audit"}} -> {"enrollment.mode": "audit"}. Empty dicts are kept as values.
+    """
+    flat = {} if flat is None else flat
+    for key, value in event.items():
+        name = prefix + key
+        if isinstance(value, dict) and value:
+            flatten_event(value, name + ".", flat)
+        else:
+            flat[name] = value
+    return flat
+
+
+def event_template(names) -> list:
+    """
+    the nesting of flattened fields, ie ["a.b", "a.c", "d"] -> [("a", [("b", 0), ("c", 1)]), ("d", 2)]
+    with each leaf the position of its field in names. The inverse of flatten_event(), see build_event().
+    """
+    tree = {}
+    for i, name in enumerate(names):
+        node = tree
+        keys = name.split(".")
+        for key in keys[:-1]:
+            node = node.setdefault(key, {})
+        node[keys[-1]] = i
+
+    def _items(node):
+        return [(key, value if isinstance(value, int) else _items(value)) for key, value in node.items()]
+
+    return _items(tree)
+
+
+def build_event(template, values) -> dict:
+    """
+    the event of a template from event_template(), with values[i] the value of the i-th field.
+    """
+    return {key: values[leaf] if leaf.__class__ is int else build_event(leaf, values) for key, leaf in template}
+
+
+# -----------------------------------------------------------------------------
+# integer packing
+# -----------------------------------------------------------------------------
+def _to_bytes(values: array) -> bytes:
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_bytes(typecode, data) -> array:
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def pack_ints(values):
+    """
+    frame of reference: (base, typecode, bytes) where each value is base + an unsigned offset.
+    """
+    if not values:
+        return 0, "B", b""
+    base = min(values)
+    span = max(values) - base
+    for typecode in "BHIQ":
+        if span < 1 << (8 * array(typecode).itemsize):
+            break
+    return base, typecode, _to_bytes(array(typecode, [value - base for value in values]))
+
+
+def unpack_ints(base, typecode, data) -> list:
+    offsets = _from_bytes(typecode, data)
+    if not base:
+        return offsets.tolist()
+    return [base + offset for offset in offsets]
+
+
+# -----------------------------------------------------------------------------
+# column types
+# -----------------------------------------------------------------------------
+def _timestamp_offset(value):
+    """
+    the utc offset of an iso 8601 timestamp, 0 for naive timestamps, or _missing if
+    value is not a timestamp that datetime.isoformat() would render identically.
+    """
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return _missing
+    if parsed.isoformat() != value:
+        return _missing
+    offset = parsed.utcoffset()
+    return None if offset is None else offset.total_seconds()
+
+
+def _is_uuid(value) -> bool:
+    try:
+        return str(uuid.UUID(value)) == value
+    except ValueError:
+        return False
+
+
+def column_type(values) -> tuple:
+    """
+    (type, utc offset) of the present values of one column. The offset applies to timestamps only.
+    """
+    kinds = {type(value) for value in values}
+    if kinds == {bool}:
+        return BOOL, None
+    if kinds == {int}:
+        if INT64_MIN <= min(values) and max(values) <= INT64_MAX:
+            return INT, None
+        return JSON, None
+    if kinds == {float}:
+        return FLOAT, None
+    if kinds != {str}:
+        return JSON, None
+    if all(len(value) == 36 and _is_uuid(value) for value in values):
+        return UUID, None
+    offsets = {_timestamp_offset(value) for value in values}
+    if len(offsets) == 1 and _missing not in offsets:
+        return TIMESTAMP, offsets.pop()
+    return STRING, None
+
+
+def _timestamp_micros(value, naive) -> int:
+    parsed = datetime.fromisoformat(value)
+    return (parsed - (NAIVE_EPOCH if naive else EPOCH)) // MICROSECOND
+
+
+def _encode_values(kind, values, utc_offset, meta):
+    """
+    the blob of the present values of a column of type kind. Adds whatever the reader needs to meta.
+    """
+    if kind in (STRING, JSON):
+        positions = {}
+        dictionary = []
+        indices = []
+        for value in values:
+            key = value if kind == STRING else json.dumps(value)
+            position = positions.get(key)
+            if position is None:
+                position = positions[key] = len(dictionary)
+                dictionary.append(value)
+            indices.append(position)
+        if len(dictionary) <= INLINE_DICTIONARY:
+            meta["dictionary"] = dictionary
+        else:
+            meta["dictionary_blob"] = json.dumps(dictionary, separators=(",", ":")).encode("utf-8")
+        meta["base"], meta["typecode"], data = pack_ints(indices)
+        return data
+    if kind == INT:
+        meta["base"], meta["typecode"], data = pack_ints(values)
+        return data
+    if kind == TIMESTAMP:
+        naive = utc_offset is None
+        micros = [_timestamp_micros(value, naive) for value in values]
+        meta["utc_offset"] = utc_offset
+        meta["first"] = micros[0]
+        # events are logged roughly in time order, so the deltas pack far narrower than the timestamps.
+        meta["base"], meta["typecode"], data = pack_ints([b - a for a, b in zip(micros, micros[1:])])
+        return data
+    if kind == UUID:
+        return b"".join(uuid.UUID(value).bytes for value in values)
+    if kind == FLOAT:
+        return _to_bytes(array("d", values))
+    if kind == BOOL:
+        return bytes(bytearray(values))
+    raise ArchiveError("unknown column type {kind}".format(kind=kind))
+
+
+def _decode_values(meta, data, positions) -> list:
+    """
+    the present values of a column at the given positions among its present values.
+    """
+    kind = meta["type"]
+    if kind in (STRING, JSON, INT):
+        base = meta["base"]
+        offsets = _from_bytes(meta["typecode"], data)
+        if kind == INT:
+            return [base + offsets[i] for i in positions]
+        dictionary = meta["dictionary"]
+        return [dictionary[base + offsets[i]] for i in positions]
+    if kind == TIMESTAMP:
+        micros = list(itertools.accumulate(itertools.chain([meta["first"]], _from_bytes(meta["typecode"], data))))
+        # each delta is base + its packed offset; the i-th timestamp is the sum of i deltas.
+        if meta["base"]:
+            micros = [value + i * meta["base"] for i, value in enumerate(micros)]
+        if meta["utc_offset"] is None:
+            return [(NAIVE_EPOCH + timedelta(microseconds=micros[i])).isoformat() for i in positions]
+        tz = timezone(timedelta(seconds=meta["utc_offset"]))
+        return [(EPOCH + timedelta(microseconds=micros[i])).astimezone(tz).isoformat() for i in positions]
+    if kind == UUID:
+        return [str(uuid.UUID(bytes=data[i * 16 : i * 16 + 16])) for i in positions]
+    if kind == FLOAT:
+        values = _from_bytes("d", data)
+        return [values[i] for i in positions]
+    if kind == BOOL:
+        return [bool(data[i]) for i in positions]
+    raise ArchiveError("unknown column type {kind}".format(kind=kind))
+
+
+# -----------------------------------------------------------------------------
+# writer
+# -----------------------------------------------------------------------------
+class EventArchiveWriter:
+    """
+    writes events, as json-decoded dicts, to a binary file object in chunks of chunk_size events.
+    """
+
+    def __init__(self, f, chunk_size=CHUNK_SIZE, compresslevel=COMPRESSLEVEL):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.compresslevel = compresslevel
+        self._rows = []
+        # column names in order of first appearance.
+        self._columns = {}
+        self.events = 0
+        self.chunks = 0
+        self.f.write(MAGIC)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write(self, event: dict):
+        row = flatten_event(event)
+        for name in row:
+            if name not in self._columns:
+                self._columns[name] = None
+        self._rows.append(row)
+        if len(self._rows) >= self.chunk_size:
+            self.flush()
+
+    def _compress(self, data) -> bytes:
+        return zlib.compress(data, self.compresslevel)
+
+    def flush(self):
+        if not self._rows:
+            return
+        rows = self._rows
+        blobs = []
+        body_length = 0
+
+        def _add_blob(data):
+            nonlocal body_length
+            blob = self._compress(data)
+            blobs.append(blob)
+            body_length += len(blob)
+            return [body_length - len(blob), len(blob)]
+
+        # the order of each event's fields, so that events are read back exactly as they were written.
+        index = {name: i for i, name in enumerate(self._columns)}
+        shapes = {}
+        shape_ids = []
+        for row in rows:
+            shape = tuple(index[name] for name in row)
+            shape_id = shapes.get(shape)
+            if shape_id is None:
+                shape_id = shapes[shape] = len(shapes)
+            shape_ids.append(shape_id)
+        shape_meta = {"shapes": [list(shape) for shape in shapes]}
+        shape_meta["base"], shape_meta["typecode"], data = pack_ints(shape_ids)
+        shape_meta["values"] = _add_blob(data)
+
+        columns = []
+        for name in self._columns:
+            states = bytearray(len(rows))
+            values = []
+            for i, row in enumerate(rows):
+                value = row.get(name, _missing)
+                if value is None:
+                    states[i] = NULL
+                elif value is not _missing:
+                    states[i] = PRESENT
+                    values.append(value)
+            kind, utc_offset = column_type(values) if values else (JSON, None)
+            meta = {"name": name, "type": kind}
+            data = _encode_values(kind, values, utc_offset, meta)
+            dictionary_blob = meta.pop("dictionary_blob", None)
+            if dictionary_blob is not None:
+                meta["dictionary_blob"] = _add_blob(dictionary_blob)
+            meta["states"] = _add_blob(bytes(states))
+            meta["values"] = _add_blob(data)
+            columns.append(meta)
+
+        header = self._compress(
+            json.dumps({"rows": len(rows), "columns": columns, "shape": shape_meta}, separators=(",", ":")).encode(
+                "utf-8"
+            )
+        )
+        self.f.write(CHUNK_HEADER.pack(len(header), body_length))
+        self.f.write(header)
+        for blob in blobs:
+            self.f.write(blob)
+        self.events += len(rows)
+        self.chunks += 1
+        self._rows = []
+        self._columns = {}
+
+    def close(self):
+        self.flush()
+
+
+def read_ndjson(path):
+    """
+    yield the json-decoded lines of an NDJSON file, gzip-compressed or not, and None for each undecodable line.
+    """
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                # ie the partly written last line of a live log.
+                yield None
+
+
+def compact(paths, output, chunk_size=CHUNK_SIZE, compresslevel=COMPRESSLEVEL) -> dict:
+    """
+    compact the NDJSON event logs at paths into a single archive at output.
+    """
+    skipped = 0
+    tmp = output + ".tmp"
+    try:
+        with open(tmp, "wb") as f, EventArchiveWriter(f, chunk_size, compresslevel) as writer:
+            for path in paths:
+                for event in read_ndjson(path):
+                    if isinstance(event, dict):
+                        writer.write(event)
+                    else:
+                        skipped += 1
+        os.replace(tmp, output)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    return {
+        "events": writer.events,
+        "skipped": skipped,
+        "chunks": writer.chunks,
+        "bytes_in": sum(os.path.getsize(path) for path in paths),
+        "bytes_out": os.path.getsize(output),
+    }
+
+
+# -----------------------------------------------------------------------------
+# reader
+# -----------------------------------------------------------------------------
+class ArchiveChunk:
+    def __init__(self, header, body=None):
+        self.rows = header["rows"]
+        self.names = [column["name"] for column in header["columns"]]
+        self.columns = dict(zip(self.names, header["columns"]))
+        self.shape = header["shape"]
+        self.body = body
+
+    def _blob(self, location) -> bytes:
+        offset, length = location
+        return zlib.decompress(self.body[offset : offset + length])
+
+    def _dictionary(self, meta) -> list:
+        if "dictionary" not in meta:
+            meta["dictionary"] = json.loads(self._blob(meta["dictionary_blob"]))
+        return meta["dictionary"]
+
+    def column(self, name, rows=None) -> dict:
+        """
+        {row number: value} of a column, for those of rows (default all) that have the field.
+        Only the values of those rows are decoded.
+        """
+        meta = self.columns[name]
+        if meta["type"] in (STRING, JSON):
+            self._dictionary(meta)
+        states = self._blob(meta["states"])
+        if states.count(PRESENT) == self.rows:
+            # the usual case: every event has a value.
+            rows = list(range(self.rows)) if rows is None else rows
+            return dict(zip(rows, _decode_values(meta, self._blob(meta["values"]), rows)))
+        # the number of present values up to and including each row.
+        present = list(itertools.accumulate(state == PRESENT for state in states))
+        rows = [row for row in (range(self.rows) if rows is None else rows) if states[row] != MISSING]
+        values = iter(
+            _decode_values(
+                meta, self._blob(meta["values"]), [present[row] - 1 for row in rows if states[row] == PRESENT]
+            )
+        )
+        return {row: next(values) if states[row] == PRESENT else None for row in rows}
+
+    def match(self, name, wanted) -> list:
+        """
+        for each event, whether column name equals one of the strings in wanted.
+        Compares dictionary positions, so no string is decoded.
+        """
+        meta = self.columns.get(name)
+        if meta is None or meta["type"] != STRING:
+            return [False] * self.rows
+        dictionary = self._dictionary(meta)
+        positions = {meta["base"] + i for i, value in enumerate(dictionary) if value in wanted}
+        if not positions:
+            return [False] * self.rows
+        offsets = iter(_from_bytes(meta["typecode"], self._blob(meta["values"])))
+        return [state == PRESENT and next(offsets) in positions for state in self._blob(meta["states"])]
+
+    def events(self, rows=None, columns=None):
+        """
+        yield the events at the given row numbers (default all), limited to the
+        fields that are, or are nested under, one of columns (default all).
+        """
+        rows = range(self.rows) if rows is None else rows
+        names = [
+            name
+            for name in self.names
+            if columns is None or any(name == column or name.startswith(column + ".") for column in columns)
+        ]
+        values = [self.column(name, rows) for name in names]
+        selected = {self.names.index(name): i for i, name in enumerate(names)}
+        templates = [
+            event_template([names[selected[i]] for i in shape if i in selected]) for shape in self.shape["shapes"]
+        ]
+        # the fields of each shape, as positions in values.
+        fields = [[selected[i] for i in shape if i in selected] for shape in self.shape["shapes"]]
+        shape_ids = unpack_ints(self.shape["base"], self.shape["typecode"], self._blob(self.shape["values"]))
+        for row in rows:
+            shape_id = shape_ids[row]
+            yield build_event(templates[shape_id], [values[i][row] for i in fields[shape_id]])
+
+
+def course_key_columns(names) -> list:
+    return [name for name in names if name == "course_key" or name.endswith(".course_key")]
+
+
+def _may_contain(chunk, names, wanted) -> bool:
+    """
+    False when the header alone shows that none of the columns can hold a wanted value.
+    """
+    for name in names:
+        meta = chunk.columns.get(name)
+        if meta is None:
+            continue
+        if meta["type"] != STRING or "dictionary" not in meta or wanted.intersection(meta["dictionary"]):
+            return True
+    return False
+
+
+class EventArchiveReader:
+    def __init__(self, path):
+        self.path = path
+
+    def chunks(self, event_names=None, course_keys=None):
+        """
+        yield the chunks of the archive, skipping without reading its body each
+        chunk whose header shows it has none of event_names or course_keys.
+        """
+        with open(self.path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ArchiveError("{path} is not an event archive".format(path=self.path))
+            while True:
+                prefix = f.read(CHUNK_HEADER.size)
+                if not prefix:
+                    return
+                if len(prefix) < CHUNK_HEADER.size:
+                    raise ArchiveError("{path} is truncated".format(path=self.path))
+                header_length, body_length = CHUNK_HEADER.unpack(prefix)
+                header = json.loads(zlib.decompress(f.read(header_length)))
+                chunk = ArchiveChunk(header)
+                if (event_names and not _may_contain(chunk, ["event_name"], event_names)) or (
+                    course_keys and not _may_contain(chunk, course_key_columns(chunk.columns), course_keys)
+                ):
+                    f.seek(body_length, os.SEEK_CUR)
+                    continue
+                chunk.body = f.read(body_length)
+                if len(chunk.body) < body_length:
+                    raise ArchiveError("{path} is truncated".format(path=self.path))
+                yield chunk
+
+    def _rows(self, chunk, event_names, course_keys):
+        if not event_names and not course_keys:
+            return None
+        selected = [True] * chunk.rows
+        if event_names:
+            selected = chunk.match("event_name", event_names)
+        if course_keys:
+            in_course = [False] * chunk.rows
+            for name in course_key_columns(chunk.columns):
+                in_course = [a or b for a, b in zip(in_course, chunk.match(name, course_keys))]
+            selected = [a and b for a, b in zip(selected, in_course)]
+        return [row for row, keep in enumerate(selected) if keep]
+
+    def scan(self, event_name=None, course_key=None, columns=None):
+        """
+        yield the events, as dicts, of one or more event types and / or courses.
+
+        event_name, course_key: a string or a collection of strings. None matches everything.
+        columns: only these fields, ie ["event_name", "event_metadata.time", "enrollment.user.id"]
+        """
+        event_names = _as_set(event_name)
+        course_keys = _as_set(course_key)
+        for chunk in self.chunks(event_names, course_keys):
+            rows = self._rows(chunk, event_names, course_keys)
+            if rows is None or rows:
+                yield from chunk.events(rows, columns)
+
+    def count(self, event_name=None, course_key=None) -> int:
+        """
+        the number of matching events, without decoding any of them.
+        """
+        event_names = _as_set(event_name)
+        course_keys = _as_set(course_key)
+        total = 0
+        for chunk in self.chunks(event_names, course_keys):
+            rows = self._rows(chunk, event_names, course_keys)
+            total += chunk.rows if rows is None else len(rows)
+        return total
+
+
+def _as_set(value):
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return {value}
+    return set(value)
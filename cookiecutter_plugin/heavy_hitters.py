@@ -0,0 +1,247 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:
+    fixed-memory detection of the courses, users and event types that
+    generate the most events, ie a runaway rescoring job or an enrollment bot.
+
+    Every receiver in signals.py reports its event here. Time is divided into
+    buckets of bucket_seconds, kept in a ring of `buckets`. Each bucket holds,
+    per dimension (course_key, user_id, event_type), a Count-Min sketch of
+    width x depth counters and the top_k keys with the highest estimates seen
+    in that bucket. Recording an event costs one hash per dimension; the depth
+    row indexes are slices of that hash, remixed with splitmix64. Memory does
+    not depend on the number of distinct courses or users.
+
+    The top keys of a sliding window are the candidates of the window's
+    buckets, ranked by the sum of their per-bucket estimates. Estimates never
+    undercount, and overcount by at most error_bound with high probability.
+
+    The counts are those of the process serving the request. Under a load
+    balancer every worker sees a proportional share of a storm.
+
+    published at /cookiecutter_plugin/heavy-hitters/?window=60&k=10 (staff only)
+    configured in settings.COOKIECUTTER_PLUGIN_HEAVY_HITTERS. see settings/common.py
+"""
+# python stuff
+import math
+import threading
+import time
+from array import array
+
+# django stuff
+from django.conf import settings
+
+DEFAULTS = {
+    "enabled": True,
+    "bucket_seconds": 10,
+    # 30 buckets of 10 seconds: windows of up to 5 minutes.
+    "buckets": 30,
+    # window lengths, in seconds, reported when none is requested.
+    "windows": [60, 300],
+    "top_k": 20,
+    # Count-Min counters per row, and rows. error_bound is e / width of the events in the window.
+    "width": 1024,
+    "depth": 4,
+}
+
+DIMENSIONS = ("course_key", "user_id", "event_type")
+MASK64 = (1 << 64) - 1
+GOLDEN64 = 0x9E3779B97F4A7C15
+
+
+def heavy_hitters_settings() -> dict:
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, "COOKIECUTTER_PLUGIN_HEAVY_HITTERS", None) or {})
+    return config
+
+
+def _mix64(value) -> int:
+    """
+    splitmix64: a 64-bit word whose every bit depends on every bit of value.
+    """
+    z = (value + GOLDEN64) & MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK64
+    return z ^ (z >> 31)
+
+
+class CountMinTopK:
+    """
+    a Count-Min sketch, and the top_k keys with the highest estimates added to it.
+    """
+
+    __slots__ = ("width", "bits", "depth", "top_k", "table", "candidates", "floor")
+
+    def __init__(self, width, depth, top_k):
+        self.width = width
+        self.bits = max(1, (width - 1).bit_length())
+        self.depth = depth
+        self.top_k = top_k
+        self.table = array("I", bytes(4 * width * depth))
+        self.candidates = {}
+        # the lowest estimate among the candidates, once there are top_k of them.
+        self.floor = 0
+
+    def clear(self):
+        self.table = array("I", bytes(4 * self.width * self.depth))
+        self.candidates = {}
+        self.floor = 0
+
+    def _indexes(self, key):
+        # one hash of the key. each row takes its own slice of bits from a mixed 64-bit word,
+        # so that two keys colliding in one row are unlikely to collide in any other.
+        width = self.width
+        bits = self.bits
+        mask = (1 << bits) - 1
+        word = hash(key) & MASK64
+        indexes = []
+        for row in range(self.depth):
+            offset = row * bits % (64 - 64 % bits)
+            if offset == 0:
+                word = _mix64(word)
+            indexes.append(row * width + (word >> offset & mask) % width)
+        return indexes
+
+    def add(self, key, n=1) -> int:
+        table = self.table
+        estimate = None
+        for i in self._indexes(key):
+            count = table[i] + n
+            table[i] = count
+            if estimate is None or count < estimate:
+                estimate = count
+
+        candidates = self.candidates
+        if key in candidates:
+            candidates[key] = estimate
+        elif len(candidates) < self.top_k:
+            candidates[key] = estimate
+            if len(candidates) == self.top_k:
+                self.floor = min(candidates.values())
+        elif estimate > self.floor:
+            # the floor only ever lags behind the candidates' estimates; refresh it before evicting.
+            victim = min(candidates, key=candidates.get)
+            if estimate > candidates[victim]:
+                del candidates[victim]
+                candidates[key] = estimate
+            self.floor = min(candidates.values())
+        return estimate
+
+    def estimate(self, key) -> int:
+        table = self.table
+        return min(table[i] for i in self._indexes(key))
+
+
+class Bucket:
+    __slots__ = ("number", "events", "sketches")
+
+    def __init__(self, number, width, depth, top_k):
+        self.number = number
+        self.events = 0
+        self.sketches = {dimension: CountMinTopK(width, depth, top_k) for dimension in DIMENSIONS}
+
+    def reset(self, number):
+        self.number = number
+        self.events = 0
+        for sketch in self.sketches.values():
+            sketch.clear()
+
+
+class HeavyHitters:
+    def __init__(self, config=None, clock=time.time):
+        self.config = config or heavy_hitters_settings()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.bucket_seconds = self.config["bucket_seconds"]
+        # allocated on first use, then reused as the ring turns.
+        self.ring = [None] * self.config["buckets"]
+
+    def record(self, event_type, course_key=None, user_id=None):
+        number = int(self._clock() // self.bucket_seconds)
+        with self._lock:
+            slot = number % len(self.ring)
+            bucket = self.ring[slot]
+            if bucket is None:
+                bucket = self.ring[slot] = Bucket(
+                    number, self.config["width"], self.config["depth"], self.config["top_k"]
+                )
+            elif bucket.number != number:
+                bucket.reset(number)
+            bucket.events += 1
+            sketches = bucket.sketches
+            sketches["event_type"].add(event_type)
+            if course_key is not None:
+                sketches["course_key"].add(str(course_key))
+            if user_id is not None:
+                sketches["user_id"].add(user_id)
+
+    def top(self, window, k=None) -> dict:
+        """
+        the k keys of each dimension with the most events in the last `window` seconds.
+        """
+        k = k or self.config["top_k"]
+        span = max(1, min(len(self.ring), int(math.ceil(window / self.bucket_seconds))))
+        current = int(self._clock() // self.bucket_seconds)
+        numbers = set(range(current - span + 1, current + 1))
+        with self._lock:
+            buckets = [bucket for bucket in self.ring if bucket is not None and bucket.number in numbers]
+            events = sum(bucket.events for bucket in buckets)
+            result = {
+                "window": span * self.bucket_seconds,
+                "events": events,
+                "error_bound": int(math.ceil(math.e / self.config["width"] * events)),
+            }
+            for dimension in DIMENSIONS:
+                sketches = [bucket.sketches[dimension] for bucket in buckets]
+                keys = set()
+                for sketch in sketches:
+                    keys.update(sketch.candidates)
+                counts = sorted(
+                    ((sum(sketch.estimate(key) for sketch in sketches), key) for key in keys),
+                    key=lambda item: item[0],
+                    reverse=True,
+                )
+                result[dimension] = [
+                    {
+                        "key": key,
+                        "events": count,
+                        "share_pct": round(100.0 * count / events, 1) if events else None,
+                    }
+                    for count, key in counts[:k]
+                ]
+        return result
+
+    def stats(self, windows=None, k=None) -> dict:
+        return {
+            "enabled": self.config["enabled"],
+            "bucket_seconds": self.bucket_seconds,
+            "windows": [self.top(window, k) for window in (windows or self.config["windows"])],
+        }
+
+
+_tracker = None
+_tracker_lock = threading.Lock()
+
+
+def heavy_hitters() -> HeavyHitters:
+    global _tracker
+
+    if _tracker is None:
+        with _tracker_lock:
+            if _tracker is None:
+                _tracker = HeavyHitters()
+    return _tracker
+
+
+def track_event(event_type, course_key=None, user_id=None):
+    """
+    called for every event received by signals.py
+    """
+    tracker = _tracker or heavy_hitters()
+    if tracker.config["enabled"]:
+        tracker.record(event_type, course_key, user_id)
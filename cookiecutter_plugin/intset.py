@@ -0,0 +1,76 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:          compact binary encoding for sets of non-negative integers,
+                ie user ids. The sorted values are delta-encoded as LEB128
+                varints and the result is zlib-compressed, which typically
+                takes 1 - 2 bytes per member for dense id ranges.
+"""
+import zlib
+
+
+def write_varint(value: int, out: bytearray):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data, pos: int):
+    """
+    returns (value, next position)
+    """
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def encode_deltas(values, out: bytearray):
+    """
+    append varint(count) followed by the varint deltas of sorted(values).
+    """
+    ordered = sorted(values)
+    write_varint(len(ordered), out)
+    previous = 0
+    for value in ordered:
+        if value < 0:
+            raise ValueError("intset values must be non-negative")
+        write_varint(value - previous, out)
+        previous = value
+
+
+def decode_deltas(data, pos: int = 0):
+    """
+    returns (list of values, next position)
+    """
+    count, pos = read_varint(data, pos)
+    values = []
+    previous = 0
+    for _ in range(count):
+        delta, pos = read_varint(data, pos)
+        previous += delta
+        values.append(previous)
+    return values, pos
+
+
+def encode(values) -> bytes:
+    out = bytearray()
+    encode_deltas(values, out)
+    return zlib.compress(bytes(out))
+
+
+def decode(data) -> set:
+    if not data:
+        return set()
+    values, _ = decode_deltas(zlib.decompress(bytes(data)))
+    return set(values)
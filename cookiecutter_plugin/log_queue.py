@@ -0,0 +1,174 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:
+    optional non-blocking logging pipeline for the plugin's own loggers.
+
+    When enabled, the "cookiecutter_plugin" logger hands its records to a
+    bounded in-memory queue and stops propagating them. A QueueListener
+    thread drains the queue into the handlers that would otherwise have
+    received the records (the root logger's handlers), so string
+    formatting, handler locks and blocking i/o move off of the request
+    thread. When the queue is full the record is dropped and counted
+    rather than blocking the caller.
+
+    enable with settings.COOKIECUTTER_PLUGIN_LOG_QUEUE = {"enabled": True, "maxsize": 10000}
+"""
+# python stuff
+import atexit
+import itertools
+import logging
+import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+# django stuff
+from django.conf import settings
+
+PLUGIN_LOGGER = "cookiecutter_plugin"
+DEFAULTS = {
+    "enabled": False,
+    "maxsize": 10000,
+}
+
+log = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_handler = None
+_listener = None
+# the plugin logger's own handlers and propagate flag, restored by uninstall().
+_original = None
+_fork_hook_registered = False
+
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    QueueHandler that never blocks and that leaves formatting to the listener.
+    """
+
+    def __init__(self, record_queue):
+        super().__init__(record_queue)
+        self._enqueued = itertools.count()
+        self._dropped = itertools.count()
+        self.enqueued = 0
+        self.dropped = 0
+
+    def prepare(self, record):
+        # the stock implementation formats the message here, on the calling
+        # thread. our queue never leaves the process, so the record can be
+        # passed along as-is and formatted by the listener's handlers, if at all.
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+            self.enqueued = next(self._enqueued) + 1
+        except queue.Full:
+            self.dropped = next(self._dropped) + 1
+
+    def stats(self) -> dict:
+        return {
+            "enqueued": self.enqueued,
+            "dropped": self.dropped,
+            "depth": self.queue.qsize(),
+            "maxsize": self.queue.maxsize,
+        }
+
+
+def log_queue_settings() -> dict:
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, "COOKIECUTTER_PLUGIN_LOG_QUEUE", None) or {})
+    return config
+
+
+def install(force=False) -> bool:
+    """
+    route the plugin's loggers through a QueueHandler. Called once from
+    apps.CookiecutterPluginConfig.ready(). Returns True if the pipeline is
+    active.
+    """
+    global _handler, _listener, _original, _fork_hook_registered
+
+    config = log_queue_settings()
+    if not (config["enabled"] or force):
+        return False
+
+    with _lock:
+        if _handler is not None:
+            return True
+
+        plugin_logger = logging.getLogger(PLUGIN_LOGGER)
+        downstream = list(plugin_logger.handlers) or list(logging.getLogger().handlers)
+        if not downstream:
+            log.warning("{logger}: no handlers found. queue logging not installed.".format(logger=PLUGIN_LOGGER))
+            return False
+
+        _handler = DroppingQueueHandler(queue.Queue(maxsize=config["maxsize"]))
+        _listener = QueueListener(_handler.queue, *downstream, respect_handler_level=True)
+        _listener.start()
+
+        _original = (list(plugin_logger.handlers), plugin_logger.propagate)
+        for handler in list(plugin_logger.handlers):
+            plugin_logger.removeHandler(handler)
+        plugin_logger.addHandler(_handler)
+        plugin_logger.propagate = False
+        atexit.register(uninstall)
+        if not _fork_hook_registered:
+            os.register_at_fork(after_in_child=_after_fork_in_child)
+            _fork_hook_registered = True
+
+    log.info(
+        "{logger} logging now routed through a queue of {maxsize} records.".format(
+            logger=PLUGIN_LOGGER, maxsize=config["maxsize"]
+        )
+    )
+    return True
+
+
+def _after_fork_in_child():
+    """
+    the listener thread does not survive fork(), and the parent may have held
+    the queue's mutex at the moment of the fork. give the child process (ie a
+    preforked gunicorn worker) a fresh queue and listener.
+    """
+    global _listener
+
+    if _handler is None:
+        return
+    fresh = queue.Queue(maxsize=_handler.queue.maxsize)
+    _handler.queue = fresh
+    _listener = QueueListener(fresh, *_listener.handlers, respect_handler_level=_listener.respect_handler_level)
+    _listener.start()
+
+
+def uninstall():
+    """
+    drain the queue and restore the original handlers.
+    """
+    global _handler, _listener, _original
+
+    with _lock:
+        if _handler is None:
+            return
+        plugin_logger = logging.getLogger(PLUGIN_LOGGER)
+        plugin_logger.removeHandler(_handler)
+        _listener.stop()
+        handlers, propagate = _original
+        for handler in handlers:
+            plugin_logger.addHandler(handler)
+        plugin_logger.propagate = propagate
+        _handler = None
+        _listener = None
+        _original = None
+
+
+def stats() -> dict:
+    handler = _handler
+    if handler is None:
+        return {"enabled": False}
+    return dict(enabled=True, **handler.stats())
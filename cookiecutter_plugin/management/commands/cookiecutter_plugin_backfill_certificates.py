@@ -0,0 +1,55 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:          load the certificate status table from certificates_generatedcertificate.
+
+                ./manage.py lms cookiecutter_plugin_backfill_certificates
+                ./manage.py lms cookiecutter_plugin_backfill_certificates --course-key course-v1:edX+DemoX+Demo_Course
+"""
+from django.core.management.base import BaseCommand
+
+from opaque_keys.edx.keys import CourseKey
+
+from cookiecutter_plugin.certificates import write_rows
+
+
+class Command(BaseCommand):
+    help = "Backfill the cookiecutter_plugin certificate status table in chunks."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--course-key", default=None, help="backfill a single course")
+        parser.add_argument("--chunk-size", type=int, default=5000, help="certificates read and upserted per chunk")
+
+    def handle(self, *args, **options):
+        from lms.djangoapps.certificates.models import GeneratedCertificate
+
+        queryset = GeneratedCertificate.objects.all()
+        if options["course_key"]:
+            queryset = queryset.filter(course_id=CourseKey.from_string(options["course_key"]))
+
+        # keyset pagination on the primary key. each chunk is one bulk upsert.
+        last_id = 0
+        total = 0
+        while True:
+            chunk = list(
+                queryset.filter(id__gt=last_id)
+                .order_by("id")
+                .values_list("id", "user_id", "course_id", "mode", "status", "modified_date")[: options["chunk_size"]]
+            )
+            if not chunk:
+                break
+            write_rows(
+                {
+                    (user_id, str(course_id)): (mode or "", status, modified_date)
+                    for _id, user_id, course_id, mode, status, modified_date in chunk
+                }
+            )
+            last_id = chunk[-1][0]
+            total += len(chunk)
+            self.stdout.write("upserted {total} certificates".format(total=total))
+
+        self.stdout.write("backfill complete. {total} certificates.".format(total=total))
@@ -0,0 +1,36 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:          size reduction and scan speed of the columnar event archive
+                vs the NDJSON event log it was compacted from
+
+                ./manage.py lms cookiecutter_plugin_benchmark_archive --events 100000
+"""
+import json
+
+from django.core.management.base import BaseCommand
+
+from cookiecutter_plugin.benchmarks import archive
+
+
+class Command(BaseCommand):
+    help = "Compare the size and scan speed of columnar event archives and NDJSON event logs."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--events", type=int, default=50000, help="number of synthetic events to log")
+        parser.add_argument("--chunk-size", type=int, default=10000, help="events per archive chunk")
+        parser.add_argument("--compresslevel", type=int, default=6)
+        parser.add_argument("--seed", type=int, default=None)
+
+    def handle(self, *args, **options):
+        results = archive.run(
+            events=options["events"],
+            chunk_size=options["chunk_size"],
+            compresslevel=options["compresslevel"],
+            seed=options["seed"],
+        )
+        self.stdout.write(json.dumps(results, indent=4))
@@ -0,0 +1,61 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:          fail if sending openedx-events from a coroutine holds the event
+                loop longer than a budget per event. see async_receivers.py
+
+                ./manage.py lms cookiecutter_plugin_benchmark_async_receivers --events 5000 --force-enable
+                ./manage.py lms cookiecutter_plugin_benchmark_async_receivers --budget-ms 0.5
+                ./manage.py lms cookiecutter_plugin_benchmark_async_receivers --isolate
+"""
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from cookiecutter_plugin.benchmarks import async_receivers
+from cookiecutter_plugin.waffle import waffle_switches, SIGNALS
+
+
+class Command(BaseCommand):
+    help = "Measure how long the plugin's receivers block a running event loop, and fail beyond a budget."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--events", type=int, default=2000)
+        parser.add_argument("--budget-ms", type=float, default=1.0, help="p99 time an event may hold the loop")
+        parser.add_argument(
+            "--dispatch",
+            choices=["send_event", "send"],
+            default="send_event",
+            help="send_event: validated openedx-events path. send: django Signal.send() with pre-built EventsMetadata",
+        )
+        parser.add_argument("--seed", type=int, default=None)
+        parser.add_argument(
+            "--force-enable", action="store_true", help="run the receivers even if the signals waffle switch is off"
+        )
+        parser.add_argument(
+            "--isolate",
+            action="store_true",
+            help="switch off the receivers' side effects: database, cache and sink writes, shared counters, heavy hitters",
+        )
+
+    def handle(self, *args, **options):
+        if options["force_enable"]:
+            waffle_switches[SIGNALS] = True
+        results = async_receivers.run(
+            events=options["events"],
+            budget_ms=options["budget_ms"],
+            dispatch=options["dispatch"],
+            seed=options["seed"],
+            isolate=options["isolate"],
+        )
+        self.stdout.write(json.dumps(results, indent=4))
+        if not results["within_budget"]:
+            raise CommandError(
+                "p99 {p99_ms}ms on the event loop exceeds the budget of {budget_ms}ms".format(
+                    p99_ms=results["loop_aware"]["p99_ms"], budget_ms=results["budget_ms"]
+                )
+            )
@@ -0,0 +1,66 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:          measure BadgrBoto3Backend throughput against a local stand-in
+                for Badgr and the CDN.
+
+                ./manage.py lms cookiecutter_plugin_benchmark_badges --iterations 500 --concurrency 16 --latency-ms 40
+"""
+import json
+
+from django.core.management.base import BaseCommand
+
+from cookiecutter_plugin.benchmarks import badges
+from cookiecutter_plugin.benchmarks.standins import RouteBehavior
+
+
+class Command(BaseCommand):
+    help = "Benchmark BadgrBoto3Backend._create_badge() against an in-process Badgr / CDN stand-in."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=200)
+        parser.add_argument("--concurrency", type=int, default=8)
+        parser.add_argument("--latency-ms", type=float, default=0.0, help="latency added to every stand-in response")
+        parser.add_argument("--jitter-ms", type=float, default=0.0, help="additional random latency, 0 - jitter")
+        parser.add_argument("--error-rate", type=float, default=0.0, help="share of stand-in responses that are 503s")
+        parser.add_argument("--cdn-latency-ms", type=float, default=None, help="override --latency-ms for the CDN")
+        parser.add_argument("--cdn-error-rate", type=float, default=None, help="override --error-rate for the CDN")
+        parser.add_argument("--payload-bytes", type=int, default=20000, help="size of the badge image on the CDN")
+        parser.add_argument("--no-tracemalloc", action="store_true", help="skip tracemalloc peak measurement")
+        parser.add_argument("--json", action="store_true", help="print results as json")
+
+    def handle(self, *args, **options):
+        default = RouteBehavior(
+            latency=options["latency_ms"] / 1000.0,
+            jitter=options["jitter_ms"] / 1000.0,
+            error_rate=options["error_rate"],
+            payload_size=options["payload_bytes"],
+        )
+        cdn = RouteBehavior(
+            latency=(options["cdn_latency_ms"] if options["cdn_latency_ms"] is not None else options["latency_ms"])
+            / 1000.0,
+            jitter=options["jitter_ms"] / 1000.0,
+            error_rate=options["cdn_error_rate"] if options["cdn_error_rate"] is not None else options["error_rate"],
+            payload_size=options["payload_bytes"],
+        )
+        # the oauth token is fetched once during warm-up and must not fail.
+        behaviors = {"cdn": cdn, "token": RouteBehavior()}
+
+        results, stats = badges.run(
+            iterations=options["iterations"],
+            concurrency=options["concurrency"],
+            server_kwargs={"default_behavior": default},
+            behaviors=behaviors,
+            trace_memory=not options["no_tracemalloc"],
+        )
+
+        if options["json"]:
+            self.stdout.write(json.dumps({"results": [r.as_dict() for r in results], "standin": stats}, indent=4))
+            return
+        for result in results:
+            self.stdout.write(str(result))
+        self.stdout.write("stand-in: {stats}".format(stats=json.dumps(stats)))
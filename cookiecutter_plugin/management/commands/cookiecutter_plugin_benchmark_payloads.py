@@ -0,0 +1,29 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:          per-event memory and time of rendering event payloads with
+                attrs.asdict() copies vs the lazy payloads.PayloadView
+
+                ./manage.py lms cookiecutter_plugin_benchmark_payloads --events 5000
+"""
+import json
+
+from django.core.management.base import BaseCommand
+
+from cookiecutter_plugin.benchmarks import payloads
+
+
+class Command(BaseCommand):
+    help = "Compare per-event allocations of eager attrs.asdict() payloads and lazy PayloadViews."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--events", type=int, default=2000, help="number of synthetic events to render")
+        parser.add_argument("--seed", type=int, default=None)
+
+    def handle(self, *args, **options):
+        results = payloads.run(events=options["events"], seed=options["seed"])
+        self.stdout.write(json.dumps(results, indent=4))
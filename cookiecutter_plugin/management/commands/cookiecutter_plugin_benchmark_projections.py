@@ -0,0 +1,29 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:          compare the size and render time of event sink lines with and
+                without the configured field projections. see projections.py
+
+                ./manage.py lms cookiecutter_plugin_benchmark_projections --events 5000
+"""
+import json
+
+from django.core.management.base import BaseCommand
+
+from cookiecutter_plugin.benchmarks import projections
+
+
+class Command(BaseCommand):
+    help = "Measure bytes and microseconds per event sink line, whole payloads vs projected payloads."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--events", type=int, default=2000)
+        parser.add_argument("--seed", type=int, default=None)
+
+    def handle(self, *args, **options):
+        results = projections.run(events=options["events"], seed=options["seed"])
+        self.stdout.write(json.dumps(results, indent=4))
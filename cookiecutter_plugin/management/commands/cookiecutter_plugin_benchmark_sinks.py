@@ -0,0 +1,50 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:          fan synthetic events out to local file, SQLite and http
+                stand-in sinks, and report the per-sink metrics.
+
+                ./manage.py lms cookiecutter_plugin_benchmark_sinks --events 50000 --collector-latency-ms 50
+                ./manage.py lms cookiecutter_plugin_benchmark_sinks --max-buffer 1000 --overflow drop_oldest
+"""
+import json
+
+from django.core.management.base import BaseCommand
+
+from cookiecutter_plugin.benchmarks import sinks
+from cookiecutter_plugin.sinks.base import OVERFLOW_POLICIES, SINK_DEFAULTS
+
+
+class Command(BaseCommand):
+    help = "Benchmark the event sinks against local stand-ins: a file, a SQLite database and an http collector."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--events", type=int, default=20000)
+        parser.add_argument("--rate", type=float, default=0, help="target events/sec. 0 = unthrottled")
+        parser.add_argument(
+            "--collector-latency-ms", type=float, default=50.0, help="latency of each stand-in collector response"
+        )
+        parser.add_argument("--batch-size", type=int, default=SINK_DEFAULTS["batch_size"])
+        parser.add_argument("--flush-interval", type=float, default=SINK_DEFAULTS["flush_interval"])
+        parser.add_argument("--max-buffer", type=int, default=SINK_DEFAULTS["max_buffer"])
+        parser.add_argument("--overflow", choices=OVERFLOW_POLICIES, default=SINK_DEFAULTS["overflow"])
+        parser.add_argument("--seed", type=int, default=None)
+
+    def handle(self, *args, **options):
+        result = sinks.run(
+            events=options["events"],
+            rate=options["rate"],
+            collector_latency=options["collector_latency_ms"] / 1000.0,
+            sink_options={
+                "batch_size": options["batch_size"],
+                "flush_interval": options["flush_interval"],
+                "max_buffer": options["max_buffer"],
+                "overflow": options["overflow"],
+            },
+            seed=options["seed"],
+        )
+        self.stdout.write(json.dumps(result, indent=4))
@@ -0,0 +1,73 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:          time and allocation regression suite for the plugin's hot paths.
+                see benchmarks/suite.py
+
+                ./manage.py lms cookiecutter_plugin_benchmark_suite
+                ./manage.py lms cookiecutter_plugin_benchmark_suite --record
+                ./manage.py lms cookiecutter_plugin_benchmark_suite --compare --threshold 0.25
+                ./manage.py lms cookiecutter_plugin_benchmark_suite --compare --only signals. utils.masked_dict
+"""
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from cookiecutter_plugin.benchmarks import suite
+
+
+class Command(BaseCommand):
+    help = "Benchmark the plugin's hot paths, record baselines, or fail on regressions against them."
+
+    def add_arguments(self, parser):
+        mode = parser.add_mutually_exclusive_group()
+        mode.add_argument("--record", action="store_true", help="write the results to the baselines file")
+        mode.add_argument("--compare", action="store_true", help="fail if any case regressed from its baseline")
+        parser.add_argument("--baselines", default=suite.DEFAULT_BASELINES, help="path of the baselines file")
+        parser.add_argument("--only", nargs="*", default=None, help="cases whose names contain any of these")
+        parser.add_argument("--rounds", type=int, default=suite.ROUNDS)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--threshold", type=float, default=0.25, help="time regression allowed, ie 0.25 = 25%%")
+        parser.add_argument("--alloc-threshold", type=float, default=0.10, help="allocation regression allowed")
+
+    def handle(self, *args, **options):
+        baselines = None
+        if options["compare"]:
+            try:
+                baselines = suite.load_baselines(options["baselines"])
+            except (OSError, ValueError) as e:
+                raise CommandError("cannot compare: {e}".format(e=e))
+
+        results = suite.run(only=options["only"], rounds=options["rounds"], seed=options["seed"])
+
+        if options["record"]:
+            document = suite.save_baselines(results, options["baselines"])
+            self.stdout.write(json.dumps(results, indent=4))
+            self.stdout.write(
+                "recorded {n} baselines in {path}".format(n=len(document["cases"]), path=options["baselines"])
+            )
+            return
+
+        if baselines is None:
+            self.stdout.write(json.dumps(results, indent=4))
+            return
+
+        report = suite.compare(results, baselines, options["threshold"], options["alloc_threshold"])
+        self.stdout.write(json.dumps(report, indent=4))
+        if baselines.get("environment") != suite.environment():
+            self.stderr.write(
+                "warning: the baselines were recorded on {recorded}, this is {current}".format(
+                    recorded=baselines.get("environment"), current=suite.environment()
+                )
+            )
+        failed = sorted(name for name, row in report.items() if row["status"] in ("regressed", "failed"))
+        if failed:
+            raise CommandError(
+                "{n} of {total} cases regressed or failed: {names}".format(
+                    n=len(failed), total=len(report), names=", ".join(failed)
+                )
+            )
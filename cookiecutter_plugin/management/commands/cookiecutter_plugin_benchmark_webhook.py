@@ -0,0 +1,51 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:          benchmark the batched gzip NDJSON webhook forwarder against a
+                local stand-in collector: delivered events/sec and bytes on the wire.
+
+                ./manage.py lms cookiecutter_plugin_benchmark_webhook --events 50000 --collector-latency-ms 20
+                ./manage.py lms cookiecutter_plugin_benchmark_webhook --error-rate 0.2 --max-in-flight 8
+"""
+import json
+
+from django.core.management.base import BaseCommand
+
+from cookiecutter_plugin.benchmarks import webhook
+
+
+class Command(BaseCommand):
+    help = "Benchmark WebhookForwarder against an in-process stand-in collector."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--events", type=int, default=20000)
+        parser.add_argument(
+            "--per-event-events", type=int, default=1000, help="sample size of the unbatched, one POST per event run"
+        )
+        parser.add_argument("--collector-latency-ms", type=float, default=5.0)
+        parser.add_argument("--error-rate", type=float, default=0.0, help="share of collector responses that are 503s")
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--linger", type=float, default=0.5, help="seconds to wait for a partial batch")
+        parser.add_argument("--max-in-flight", type=int, default=4)
+        parser.add_argument("--compresslevel", type=int, default=6, help="gzip level of the gzip_batched run")
+        parser.add_argument("--seed", type=int, default=None)
+
+    def handle(self, *args, **options):
+        results = webhook.run(
+            events=options["events"],
+            per_event_events=options["per_event_events"],
+            collector_latency=options["collector_latency_ms"] / 1000.0,
+            error_rate=options["error_rate"],
+            options={
+                "batch_size": options["batch_size"],
+                "linger": options["linger"],
+                "max_in_flight": options["max_in_flight"],
+                "compresslevel": options["compresslevel"],
+            },
+            seed=options["seed"],
+        )
+        self.stdout.write(json.dumps(results, indent=4))
@@ -0,0 +1,43 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:          fail if the plugin's import-time cost, measured with
+                python -X importtime, exceeds a budget. Every management
+                command and worker process pays this cost at boot.
+
+                ./manage.py lms cookiecutter_plugin_check_import_time
+                ./manage.py lms cookiecutter_plugin_check_import_time --budget-ms 100 --repeat 5
+"""
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from cookiecutter_plugin.benchmarks import import_time
+
+
+class Command(BaseCommand):
+    help = "Measure the plugin's import time with python -X importtime and fail if it exceeds a budget."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--budget-ms", type=float, default=import_time.DEFAULT_BUDGET_MS)
+        parser.add_argument("--repeat", type=int, default=3, help="fresh interpreters to run. the best is kept")
+        parser.add_argument(
+            "--module", action="append", default=None, help="modules to import after django.setup(). may be repeated"
+        )
+
+    def handle(self, *args, **options):
+        try:
+            results = import_time.run(
+                budget_ms=options["budget_ms"], repeat=options["repeat"], modules=options["module"]
+            )
+        except RuntimeError as e:
+            raise CommandError(str(e))
+        self.stdout.write(json.dumps(results, indent=4))
+        if not results["within_budget"]:
+            raise CommandError(
+                "cookiecutter_plugin import time {total_ms}ms exceeds the budget of {budget_ms}ms".format(**results)
+            )
@@ -0,0 +1,40 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:          compact NDJSON event logs into a columnar event archive. see event_archive.py
+
+                ./manage.py lms cookiecutter_plugin_compact_events /openedx/data/events.ndjson --output events.ccpa
+                ./manage.py lms cookiecutter_plugin_compact_events spill/*.ndjson.gz --output spill.ccpa
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from cookiecutter_plugin.event_archive import CHUNK_SIZE, COMPRESSLEVEL, compact
+
+
+class Command(BaseCommand):
+    help = "Compact NDJSON event logs, plain or gzip-compressed, into a columnar, dictionary-encoded event archive."
+
+    def add_arguments(self, parser):
+        parser.add_argument("paths", nargs="+", help="NDJSON event logs, read in the order given")
+        parser.add_argument("--output", required=True, help="the archive to write")
+        parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="events per chunk")
+        parser.add_argument("--compresslevel", type=int, default=COMPRESSLEVEL, help="zlib level, 1 - 9")
+
+    def handle(self, *args, **options):
+        try:
+            result = compact(
+                options["paths"],
+                options["output"],
+                chunk_size=options["chunk_size"],
+                compresslevel=options["compresslevel"],
+            )
+        except OSError as e:
+            raise CommandError(str(e))
+        self.stdout.write(
+            "compacted {events} events ({skipped} unreadable lines skipped) into {chunks} chunks: "
+            "{bytes_in} -> {bytes_out} bytes".format(**result)
+        )
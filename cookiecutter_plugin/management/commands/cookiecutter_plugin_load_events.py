@@ -0,0 +1,89 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:          synthetic openedx-events load generator for the receivers in signals.py
+
+                ./manage.py lms cookiecutter_plugin_load_events --events 50000 --workers 8
+                ./manage.py lms cookiecutter_plugin_load_events --processes --workers 4 --rate 2000
+                ./manage.py lms cookiecutter_plugin_load_events --mix SESSION_LOGIN_COMPLETED=3,COURSE_ENROLLMENT_CREATED=1
+                ./manage.py lms cookiecutter_plugin_load_events --isolate
+"""
+import json
+import logging
+
+from django.core.management.base import BaseCommand, CommandError
+
+from cookiecutter_plugin.benchmarks import events
+from cookiecutter_plugin.waffle import waffle_switches, SIGNALS
+
+
+def parse_mix(value) -> dict:
+    mix = {}
+    for item in value.split(","):
+        try:
+            name, weight = item.split("=")
+            mix[name.strip().upper()] = float(weight)
+        except ValueError:
+            raise CommandError("invalid --mix entry {item}. expected EVENT_NAME=weight".format(item=item))
+    return mix
+
+
+class Command(BaseCommand):
+    help = "Fire synthetic openedx-events through the real signal objects and report sustained throughput."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--events", type=int, default=10000, help="total number of events to fire")
+        parser.add_argument(
+            "--rate", type=float, default=0, help="target events/sec across all workers. 0 = unthrottled"
+        )
+        parser.add_argument(
+            "--mix", type=parse_mix, default=None, help="EVENT_NAME=weight,... default: a typical LMS mix"
+        )
+        parser.add_argument("--users", type=int, default=10000, help="number of distinct synthetic users")
+        parser.add_argument("--courses", type=int, default=200, help="number of distinct synthetic courses")
+        parser.add_argument("--workers", type=int, default=1, help="number of threads, or processes with --processes")
+        parser.add_argument("--processes", action="store_true", help="use forked processes instead of threads")
+        parser.add_argument(
+            "--dispatch",
+            choices=["send_event", "send"],
+            default="send_event",
+            help="send_event: validated openedx-events path. send: django Signal.send() with pre-built EventsMetadata",
+        )
+        parser.add_argument("--seed", type=int, default=None)
+        parser.add_argument(
+            "--force-enable", action="store_true", help="run the receivers even if the signals waffle switch is off"
+        )
+        parser.add_argument(
+            "--isolate",
+            action="store_true",
+            help="switch off the receivers' side effects: database, cache and sink writes, shared counters, heavy hitters",
+        )
+        parser.add_argument("--quiet-logs", action="store_true", help="raise the plugin's log level to WARNING")
+
+    def handle(self, *args, **options):
+        if options["force_enable"]:
+            waffle_switches[SIGNALS] = True
+        if options["quiet_logs"]:
+            logging.getLogger("cookiecutter_plugin").setLevel(logging.WARNING)
+
+        mix = events.available_signals(options["mix"] or events.DEFAULT_MIX)
+        if not mix:
+            raise CommandError("none of the requested events exist in the installed openedx-events.")
+
+        result = events.generate(
+            events=options["events"],
+            rate=options["rate"],
+            mix=mix,
+            users=options["users"],
+            courses=options["courses"],
+            workers=options["workers"],
+            processes=options["processes"],
+            dispatch=options["dispatch"],
+            seed=options["seed"],
+            isolate=options["isolate"],
+        )
+        self.stdout.write(json.dumps(result, indent=4))
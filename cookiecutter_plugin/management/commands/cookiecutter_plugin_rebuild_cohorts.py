@@ -0,0 +1,56 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:          rebuild the cohort membership index from course_groups_cohortmembership.
+
+                ./manage.py lms cookiecutter_plugin_rebuild_cohorts
+                ./manage.py lms cookiecutter_plugin_rebuild_cohorts --course-key course-v1:edX+DemoX+Demo_Course
+"""
+from django.core.management.base import BaseCommand
+
+from opaque_keys.edx.keys import CourseKey
+
+from cookiecutter_plugin.cohorts import cohort_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the cookiecutter_plugin user-to-cohort index in the shared cache."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--course-key", default=None, help="rebuild a single course")
+        parser.add_argument("--chunk-size", type=int, default=5000, help="memberships read and cached per query")
+
+    def handle(self, *args, **options):
+        from openedx.core.djangoapps.course_groups.models import CohortMembership
+
+        index = cohort_index()
+        queryset = CohortMembership.objects.all()
+        if options["course_key"]:
+            queryset = queryset.filter(course_id=CourseKey.from_string(options["course_key"]))
+
+        # a new generation of shared entries, of the one course or of all of them: the entries
+        # cached so far, including those of users since removed from every cohort, are no longer read.
+        index.reset(options["course_key"])
+
+        # keyset pagination on the primary key: every chunk is an index range scan,
+        # and is written to the cache before the next one is read.
+        last_id = 0
+        rows = 0
+        while True:
+            chunk = list(
+                queryset.filter(id__gt=last_id)
+                .order_by("id")
+                .values_list("id", "course_id", "user_id", "course_user_group__name")[: options["chunk_size"]]
+            )
+            if not chunk:
+                break
+            index.store({(str(course_id), user_id): name for _id, course_id, user_id, name in chunk})
+            last_id = chunk[-1][0]
+            rows += len(chunk)
+            self.stdout.write("cached {rows} cohort memberships".format(rows=rows))
+
+        self.stdout.write("rebuilt the cohort index from {rows} cohort memberships.".format(rows=rows))
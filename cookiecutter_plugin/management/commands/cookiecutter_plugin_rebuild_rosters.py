@@ -0,0 +1,115 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:          rebuild the enrollment roster index from student_courseenrollment.
+
+                ./manage.py lms cookiecutter_plugin_rebuild_rosters
+                ./manage.py lms cookiecutter_plugin_rebuild_rosters --course-key course-v1:edX+DemoX+Demo_Course
+"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Q
+
+from opaque_keys.edx.keys import CourseKey
+
+from cookiecutter_plugin.models import CourseEnrollmentRoster
+from cookiecutter_plugin.rosters import populate
+
+
+def write_rosters(courses: dict, batch_size):
+    """
+    replace the rosters of {course_key: {mode: set(user ids)}}, batch_size rosters per transaction.
+    """
+    course_keys = list(courses)
+    for start in range(0, len(course_keys), batch_size):
+        _write_rosters({key: courses[key] for key in course_keys[start : start + batch_size]})
+
+
+def _write_rosters(courses: dict):
+    with transaction.atomic():
+        existing = {
+            str(roster.course_key): roster
+            for roster in CourseEnrollmentRoster.objects.select_for_update().filter(course_key__in=list(courses))
+        }
+        updates = [populate(existing[key], modes) for key, modes in courses.items() if key in existing]
+        creates = [
+            populate(CourseEnrollmentRoster(course_key=key), modes)
+            for key, modes in courses.items()
+            if key not in existing
+        ]
+        # the rebuilt rosters start a new ordering window: populate() clears their event times.
+        CourseEnrollmentRoster.objects.bulk_update(
+            updates, ["active_users", "event_times", "mode_counts", "total_active", "updated"]
+        )
+        CourseEnrollmentRoster.objects.bulk_create(creates)
+
+
+class Command(BaseCommand):
+    help = "Rebuild the cookiecutter_plugin per-course enrollment roster index from scratch."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--course-key", default=None, help="rebuild a single course")
+        parser.add_argument("--chunk-size", type=int, default=10000, help="enrollment rows read per query")
+        parser.add_argument("--write-batch-size", type=int, default=500, help="roster rows written per transaction")
+
+    def handle(self, *args, **options):
+        from common.djangoapps.student.models import CourseEnrollment
+
+        queryset = CourseEnrollment.objects.filter(is_active=True)
+        if options["course_key"]:
+            queryset = queryset.filter(course_id=CourseKey.from_string(options["course_key"]))
+
+        # enrollments are read course by course, and the rosters of the courses completed by each
+        # chunk are written before the next chunk is read: only one chunk's courses are held in memory.
+        # keyset pagination on (course_id, id): every chunk is a range scan of the course_id index.
+        completed = {}
+        current_key, current = None, {}
+        course_keys = []
+        last = None
+        rows = 0
+        while True:
+            chunk_queryset = queryset
+            if last is not None:
+                last_course_id, last_id = last
+                chunk_queryset = queryset.filter(
+                    Q(course_id__gt=last_course_id) | Q(course_id=last_course_id, id__gt=last_id)
+                )
+            chunk = list(
+                chunk_queryset.order_by("course_id", "id").values_list("id", "course_id", "user_id", "mode")[
+                    : options["chunk_size"]
+                ]
+            )
+            if not chunk:
+                break
+            for _id, course_id, user_id, mode in chunk:
+                key = str(course_id)
+                if key != current_key:
+                    if current_key is not None:
+                        completed[current_key] = current
+                    current_key, current = key, {}
+                    course_keys.append(key)
+                current.setdefault(mode, set()).add(user_id)
+            write_rosters(completed, options["write_batch_size"])
+            completed = {}
+            last = (chunk[-1][1], chunk[-1][0])
+            rows += len(chunk)
+            self.stdout.write("read {rows} active enrollments".format(rows=rows))
+        if current_key is not None:
+            completed[current_key] = current
+        write_rosters(completed, options["write_batch_size"])
+
+        # courses that no longer have any active enrollments.
+        stale = CourseEnrollmentRoster.objects.exclude(course_key__in=course_keys)
+        if options["course_key"]:
+            stale = stale.filter(course_key=CourseKey.from_string(options["course_key"]))
+        deleted, _ = stale.delete()
+
+        self.stdout.write(
+            "rebuilt {courses} course rosters from {rows} active enrollments. removed {deleted} stale rosters.".format(
+                courses=len(course_keys), rows=rows, deleted=deleted
+            )
+        )
@@ -0,0 +1,43 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:          print the events of a columnar event archive as NDJSON, or count them.
+
+                ./manage.py lms cookiecutter_plugin_scan_events events.ccpa --event-name COURSE_ENROLLMENT_CREATED
+                ./manage.py lms cookiecutter_plugin_scan_events events.ccpa --course-key course-v1:edX+DemoX+Demo_Course --count
+                ./manage.py lms cookiecutter_plugin_scan_events events.ccpa --columns event_name,event_metadata.time
+"""
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from cookiecutter_plugin.event_archive import ArchiveError, EventArchiveReader
+
+
+class Command(BaseCommand):
+    help = "Scan a columnar event archive by event type and / or course."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="an archive written by cookiecutter_plugin_compact_events")
+        parser.add_argument("--event-name", action="append", default=None, help="may be repeated")
+        parser.add_argument("--course-key", action="append", default=None, help="may be repeated")
+        parser.add_argument(
+            "--columns", default=None, help="comma separated fields to print, ie event_name,enrollment.user.id"
+        )
+        parser.add_argument("--count", action="store_true", help="print the number of matching events only")
+
+    def handle(self, *args, **options):
+        reader = EventArchiveReader(options["path"])
+        try:
+            if options["count"]:
+                self.stdout.write(str(reader.count(options["event_name"], options["course_key"])))
+                return
+            columns = options["columns"].split(",") if options["columns"] else None
+            for event in reader.scan(options["event_name"], options["course_key"], columns):
+                self.stdout.write(json.dumps(event))
+        except (ArchiveError, OSError) as e:
+            raise CommandError(str(e))
@@ -0,0 +1,29 @@
+# coding=utf-8
+# Generated by Django 3.2.19 on 2026-10-19 09:00
+
+from django.db import migrations, models
+import opaque_keys.edx.django.models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="CourseEnrollmentRoster",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("course_key", opaque_keys.edx.django.models.CourseKeyField(max_length=255, unique=True)),
+                ("total_active", models.PositiveIntegerField(default=0)),
+                ("mode_counts", models.JSONField(default=dict)),
+                ("active_users", models.BinaryField(default=b"")),
+                ("event_times", models.BinaryField(default=b"")),
+                ("updated", models.DateTimeField(auto_now=True, db_index=True)),
+            ],
+            options={
+                "verbose_name": "course enrollment roster",
+            },
+        ),
+    ]
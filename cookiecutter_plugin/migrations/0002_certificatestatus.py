@@ -0,0 +1,34 @@
+# coding=utf-8
+# Generated by Django 3.2.19 on 2026-10-19 10:00
+
+from django.db import migrations, models
+import opaque_keys.edx.django.models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("cookiecutter_plugin", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CertificateStatus",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("user_id", models.PositiveIntegerField()),
+                ("course_key", opaque_keys.edx.django.models.CourseKeyField(max_length=255)),
+                ("mode", models.CharField(blank=True, default="", max_length=32)),
+                ("status", models.CharField(max_length=32)),
+                ("updated", models.DateTimeField()),
+            ],
+            options={
+                "verbose_name": "certificate status",
+                "verbose_name_plural": "certificate statuses",
+                "unique_together": {("user_id", "course_key")},
+            },
+        ),
+        migrations.AddIndex(
+            model_name="certificatestatus",
+            index=models.Index(fields=["course_key", "status", "user_id"], name="cc_certstatus_course_status"),
+        ),
+    ]
@@ -0,0 +1,66 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:          plugin-owned tables. These are maintained incrementally by
+                the receivers in signals.py so that reporting does not need
+                to scan the large edx-platform tables.
+"""
+# django stuff
+from django.db import models
+
+# open edx stuff
+from opaque_keys.edx.django.models import CourseKeyField
+
+
+class CourseEnrollmentRoster(models.Model):
+    """
+    active enrollments of a single course.
+
+    mode_counts:    {"audit": 1200, "verified": 87, ...}
+    active_users:   per-mode sets of active user ids. see rosters.encode_roster()
+    event_times:    event time of each user's last applied state. see rosters.encode_event_times()
+    """
+
+    course_key = CourseKeyField(max_length=255, unique=True)
+    total_active = models.PositiveIntegerField(default=0)
+    mode_counts = models.JSONField(default=dict)
+    active_users = models.BinaryField(default=b"")
+    event_times = models.BinaryField(default=b"")
+    updated = models.DateTimeField(auto_now=True, db_index=True)
+
+    class Meta:
+        verbose_name = "course enrollment roster"
+
+    def __str__(self):
+        return "{course_key}: {total_active} active".format(course_key=self.course_key, total_active=self.total_active)
+
+
+class CertificateStatus(models.Model):
+    """
+    current certificate status of each (user, course), maintained from the
+    certificate events. A narrow stand-in for certificates_generatedcertificate.
+    """
+
+    user_id = models.PositiveIntegerField()
+    course_key = CourseKeyField(max_length=255)
+    mode = models.CharField(max_length=32, blank=True, default="")
+    status = models.CharField(max_length=32)
+    updated = models.DateTimeField()
+
+    class Meta:
+        verbose_name = "certificate status"
+        verbose_name_plural = "certificate statuses"
+        unique_together = (("user_id", "course_key"),)
+        indexes = [
+            # "who holds a valid certificate in course X", paginated by user_id.
+            models.Index(fields=["course_key", "status", "user_id"], name="cc_certstatus_course_status"),
+        ]
+
+    def __str__(self):
+        return "{user_id} {course_key}: {status}".format(
+            user_id=self.user_id, course_key=self.course_key, status=self.status
+        )
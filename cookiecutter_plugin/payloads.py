@@ -0,0 +1,442 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:          deferred serialization of openedx-events payloads for log
+                records. Nothing is converted or formatted until the logging
+                framework actually renders the record, so receivers pay
+                nothing for payloads of disabled log levels, and with the
+                queue logging pipeline enabled (see log_queue.py) the cost
+                moves off of the request thread.
+
+                PayloadView renders without attrs.asdict(): it is a read-only
+                mapping over the original attrs instances that resolves nested
+                fields as the encoder reaches them, redacting SENSITIVE_KEYS
+                and serializing course keys on the way out. dump_view() streams
+                it as json without building any intermediate dicts.
+
+                EventPayload is rendered by a BoundedJSONWriter, which also
+                streams, within a byte budget: collections of more than
+                max_items entries are summarized as their count, their first
+                max_items entries and a hash of the whole, long strings are
+                cut, and once the budget is spent the document is closed
+                early. Limits are set in settings.COOKIECUTTER_PLUGIN_SERIALIZATION
+"""
+# python stuff
+import hashlib
+import io
+import itertools
+import json
+from collections.abc import Mapping, Sequence
+
+# django stuff
+from django.conf import settings
+
+import attr
+from attr import asdict
+
+# our stuff
+from .utils import SENSITIVE_KEYS, serialize_course_key, PluginJSONEncoder
+
+REDACTED = "*** -- REDACTED -- ***"
+_SENSITIVE_KEYS = frozenset(SENSITIVE_KEYS)
+
+# attrs class -> tuple of its field names
+_field_names = {}
+
+_encode_string = json.encoder.encode_basestring_ascii
+_encoder_default = PluginJSONEncoder().default
+
+DEFAULTS = {
+    # maximum size of one rendered payload.
+    "max_bytes": 65536,
+    # collections with more entries than this are summarized.
+    "max_items": 50,
+    # strings longer than this are cut.
+    "max_string": 2048,
+}
+
+TRUNCATED = "__truncated__"
+
+
+def serialization_settings() -> dict:
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, "COOKIECUTTER_PLUGIN_SERIALIZATION", None) or {})
+    return config
+
+
+def build_payload(metadata, **data) -> dict:
+    """
+    {"<name>": asdict(data[name]), ..., "event_metadata": asdict(metadata)}
+    """
+    payload = {name: asdict(value, value_serializer=serialize_course_key) for name, value in data.items()}
+    payload["event_metadata"] = asdict(metadata) if metadata is not None else None
+    return payload
+
+
+def _field_names_of(cls) -> tuple:
+    names = _field_names.get(cls)
+    if names is None:
+        names = _field_names[cls] = tuple(field.name for field in attr.fields(cls))
+    return names
+
+
+def payload_view(value):
+    """
+    wrap attrs instances and dicts in a PayloadView, and lists, tuples and
+    sets in a PayloadListView. Anything else is serialized as by asdict().
+    """
+    if attr.has(type(value)) or isinstance(value, dict):
+        return PayloadView(value)
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return PayloadListView(value)
+    return serialize_course_key(None, None, value)
+
+
+class PayloadListView(Sequence):
+    """
+    read-only sequence over a list, tuple or set whose items are wrapped
+    by payload_view() as they are reached.
+    """
+
+    __slots__ = ("_items",)
+
+    def __init__(self, items):
+        self._items = items if isinstance(items, (list, tuple)) else list(items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [payload_view(item) for item in self._items[index]]
+        return payload_view(self._items[index])
+
+    def __iter__(self):
+        for item in self._items:
+            yield payload_view(item)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __repr__(self):
+        return "PayloadListView({items!r})".format(items=self._items)
+
+
+class PayloadView(Mapping):
+    """
+    read-only mapping over an attrs instance, or a dict, that resolves
+    nested values on access. Nothing is copied: two PayloadViews over the
+    same object see the same, current, values. PluginJSONEncoder encodes it
+    as a json object.
+    """
+
+    __slots__ = ("_obj",)
+
+    def __init__(self, obj):
+        self._obj = obj
+
+    def _keys(self):
+        if isinstance(self._obj, dict):
+            return self._obj.keys()
+        return _field_names_of(type(self._obj))
+
+    def _items(self):
+        if isinstance(self._obj, dict):
+            items = self._obj.items()
+        else:
+            items = ((name, getattr(self._obj, name)) for name in _field_names_of(type(self._obj)))
+        for key, value in items:
+            yield key, REDACTED if key in _SENSITIVE_KEYS else payload_view(value)
+
+    def __getitem__(self, key):
+        if isinstance(self._obj, dict):
+            value = self._obj[key]
+        elif key in self._keys():
+            value = getattr(self._obj, key)
+        else:
+            raise KeyError(key)
+        if key in _SENSITIVE_KEYS:
+            return REDACTED
+        return payload_view(value)
+
+    def __iter__(self):
+        return iter(self._keys())
+
+    def __len__(self):
+        return len(self._keys())
+
+    def __repr__(self):
+        return "PayloadView({obj!r})".format(obj=self._obj)
+
+
+def _key_string(key) -> str:
+    # the same coercion as json.dumps()
+    if isinstance(key, str):
+        return key
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, float):
+        return _float_string(key)
+    return str(key)
+
+
+def _float_string(value) -> str:
+    if value != value:
+        return "NaN"
+    if value in (float("inf"), float("-inf")):
+        return "Infinity" if value > 0 else "-Infinity"
+    return float.__repr__(value)
+
+
+def dump_view(value, write, indent=None, default=None, _level=0):
+    """
+    stream value as json to write(), ie io.StringIO().write. PayloadViews are
+    walked in place. The output is that of
+    json.dumps(value, cls=PluginJSONEncoder, indent=indent), or of
+    json.dumps(value, default=default, indent=indent) if default is given.
+    """
+    if isinstance(value, str):
+        write(_encode_string(value))
+    elif value is None:
+        write("null")
+    elif value is True:
+        write("true")
+    elif value is False:
+        write("false")
+    elif isinstance(value, int):
+        write(int.__repr__(value))
+    elif isinstance(value, float):
+        write(_float_string(value))
+    elif isinstance(value, (Mapping, list, tuple, PayloadListView)):
+        is_mapping = isinstance(value, Mapping)
+        if is_mapping:
+            items = value._items() if isinstance(value, PayloadView) else value.items()
+        else:
+            items = value
+        opening, closing = ("{", "}") if is_mapping else ("[", "]")
+        if indent is None:
+            separator = ", "
+            newline = closing_newline = ""
+        else:
+            separator = ","
+            newline = "\n" + " " * (indent * (_level + 1))
+            closing_newline = "\n" + " " * (indent * _level)
+        empty = True
+        for item in items:
+            write(separator + newline if not empty else opening + newline)
+            empty = False
+            if is_mapping:
+                key, item = item
+                write(_encode_string(_key_string(key)))
+                write(": ")
+            dump_view(item, write, indent, default, _level + 1)
+        write(opening + closing if empty else closing_newline + closing)
+    else:
+        dump_view((default or _encoder_default)(value), write, indent, default, _level)
+
+
+class _BudgetSpent(Exception):
+    pass
+
+
+class BoundedJSONWriter:
+    """
+    streams a value as json to write(), as dump_view() does, but never
+    writes more than max_bytes, and never holds more than one collection
+    entry of the output in memory.
+
+    - a collection of more than max_items entries is written as
+      {"__count__": n, "__first__": <its first max_items entries>, "__blake2b__": <hash of all of it>}
+    - a string longer than max_string characters is cut, and its remaining
+      length noted
+    - when the next entry would not fit, "__truncated__" is written in its
+      place and every open collection is closed, so the output is always
+      valid json.
+
+    dump() returns True if the value was written in full, ie without
+    summaries, cuts or truncation.
+    """
+
+    def __init__(self, write, max_bytes=None, max_items=None, max_string=None, indent=None, default=None):
+        config = serialization_settings()
+        self.write = write
+        self.max_bytes = max_bytes if max_bytes is not None else config["max_bytes"]
+        self.max_items = max_items if max_items is not None else config["max_items"]
+        self.max_string = max_string if max_string is not None else config["max_string"]
+        self.indent = indent
+        self.default = default or _encoder_default
+        self.written = 0
+        self.complete = True
+        # [closing text, is_mapping, level, has_entries, marker room] of each open collection, innermost last.
+        # marker room is the length of the longest truncation marker of this or any enclosing collection:
+        # the collection that is innermost when the budget runs out may be any of them.
+        self._open = []
+        # bytes needed to close every open collection.
+        self._reserved = 0
+
+    # -------------------------------------------------------------------------
+    # layout
+    # -------------------------------------------------------------------------
+    def _newline(self, level) -> str:
+        return "" if self.indent is None else "\n" + " " * (self.indent * level)
+
+    def _separator(self, first, level) -> str:
+        if first:
+            return self._newline(level)
+        return ("," if self.indent is not None else ", ") + self._newline(level)
+
+    def _marker(self, is_mapping, level, first=False) -> str:
+        # what is written in place of an entry that does not fit.
+        text = _encode_string(TRUNCATED)
+        return self._separator(first, level) + (text + ": true" if is_mapping else text)
+
+    # -------------------------------------------------------------------------
+    # budget
+    # -------------------------------------------------------------------------
+    def _emit(self, text, reserve=0):
+        """
+        write text if it fits, leaving room for everything that closing the
+        document would take, plus reserve.
+        """
+        if self._open:
+            reserve += self._open[-1][4]
+        if self.written + len(text) + self._reserved + reserve > self.max_bytes:
+            raise _BudgetSpent()
+        self.write(text)
+        self.written += len(text)
+        if self._open:
+            self._open[-1][3] = True
+
+    def _write(self, text):
+        # text whose room has already been reserved.
+        self.write(text)
+        self.written += len(text)
+
+    def _summary(self, value, count, is_mapping):
+        digest = hashlib.blake2b(digest_size=16)
+        dump_view(value, lambda chunk: digest.update(chunk.encode("utf-8")), default=self.default)
+        if is_mapping:
+            items = value._items() if isinstance(value, PayloadView) else value.items()
+            first = dict(itertools.islice(items, self.max_items))
+        else:
+            first = list(itertools.islice(iter(value), self.max_items))
+        return {"__count__": count, "__first__": first, "__blake2b__": digest.hexdigest()}
+
+    # -------------------------------------------------------------------------
+    # writing
+    # -------------------------------------------------------------------------
+    def _scalar(self, value):
+        """
+        the json text of a scalar, or None if value is a collection.
+        """
+        if isinstance(value, str):
+            if len(value) > self.max_string:
+                self.complete = False
+                value = "{head}...(+{more} characters)".format(
+                    head=value[: self.max_string], more=len(value) - self.max_string
+                )
+            return _encode_string(value)
+        if value is None:
+            return "null"
+        if value is True:
+            return "true"
+        if value is False:
+            return "false"
+        if isinstance(value, int):
+            return int.__repr__(value)
+        if isinstance(value, float):
+            return _float_string(value)
+        return None
+
+    def _value(self, prefix, value, level):
+        """
+        write prefix (separator and key) followed by value.
+        """
+        while True:
+            text = self._scalar(value)
+            if text is not None:
+                self._emit(prefix + text)
+                return
+            if isinstance(value, (Mapping, list, tuple, PayloadListView)):
+                break
+            value = self.default(value)
+
+        is_mapping = isinstance(value, Mapping)
+        count = len(value)
+        if count > self.max_items:
+            self.complete = False
+            value = self._summary(value, count, is_mapping)
+            is_mapping = True
+        opening, closing = ("{", "}") if is_mapping else ("[", "]")
+        if not count:
+            self._emit(prefix + opening + closing)
+            return
+
+        closer = self._newline(level) + closing
+        # room to close this collection, and to mark it truncated, must remain once it is open.
+        marker_room = len(self._marker(is_mapping, level + 1))
+        if self._open:
+            marker_room = max(marker_room, self._open[-1][4])
+        self._emit(prefix + opening, reserve=len(closer) + marker_room)
+        self._open.append([closer, is_mapping, level + 1, False, marker_room])
+        self._reserved += len(closer)
+
+        items = value._items() if isinstance(value, PayloadView) else value.items() if is_mapping else value
+        first = True
+        for item in items:
+            separator = self._separator(first, level + 1)
+            if is_mapping:
+                key, item = item
+                self._value(separator + _encode_string(_key_string(key)) + ": ", item, level + 1)
+            else:
+                self._value(separator, item, level + 1)
+            first = False
+
+        self._open.pop()
+        self._reserved -= len(closer)
+        self._write(closer)
+
+    def dump(self, value) -> bool:
+        try:
+            self._value("", value, 0)
+        except _BudgetSpent:
+            self.complete = False
+            if self._open:
+                _, is_mapping, level, has_entries, _ = self._open[-1]
+                self._write(self._marker(is_mapping, level, first=not has_entries))
+            else:
+                self._write(_encode_string(TRUNCATED))
+            while self._open:
+                closer = self._open.pop()[0]
+                self._write(closer)
+            self._reserved = 0
+        return self.complete
+
+
+class EventPayload:
+    """
+    log argument that renders an openedx-events payload as indented json
+    when, and only when, str() is called on it.
+    """
+
+    __slots__ = ("metadata", "data")
+
+    def __init__(self, metadata, **data):
+        self.metadata = metadata
+        self.data = data
+
+    def as_dict(self) -> dict:
+        return build_payload(self.metadata, **self.data)
+
+    def view(self) -> PayloadView:
+        return PayloadView(dict(self.data, event_metadata=self.metadata))
+
+    def __str__(self):
+        buffer = io.StringIO()
+        BoundedJSONWriter(buffer.write, indent=4).dump(self.view())
+        return buffer.getvalue()
@@ -0,0 +1,211 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:
+    sampling cProfile middleware. Attributes LMS request time to this plugin
+    versus the rest of the platform.
+
+    A request is profiled when any of the following is true:
+    - it is the Nth request seen by this process, where N is sample_rate
+    - its path matches path_regex
+    - it is sent by a staff user and carries the trigger header
+      (X-Cookiecutter-Profile: 1 by default)
+
+    The middleware is inserted first in settings.MIDDLEWARE, so that a profile
+    covers the whole request: every platform middleware as well as the view.
+    request.user is not known yet at that point, so a request that carries
+    the trigger header is profiled, and its profile kept only if, once the
+    response is ready, its user turns out to be staff.
+
+    Profiles are written in pstats format to a bounded ring directory; the
+    oldest files are removed once max_profiles is exceeded. Only one request
+    per process is profiled at a time, which keeps the profiler safe under
+    multithreaded gunicorn workers. Unsampled requests pay for an integer
+    increment and, when configured, a regex match.
+
+    configured in settings.COOKIECUTTER_PLUGIN_PROFILER. see settings/common.py
+    captured profiles are listed at /cookiecutter_plugin/profiles/ (staff only)
+"""
+# python stuff
+import cProfile
+import itertools
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+# django stuff
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+log = logging.getLogger(__name__)
+
+DEFAULTS = {
+    "enabled": False,
+    # profile 1 in N requests. 0 disables periodic sampling.
+    "sample_rate": 1000,
+    # also profile requests whose path matches this regular expression.
+    "path_regex": None,
+    # also profile requests from staff users that carry this header.
+    "header": "X-Cookiecutter-Profile",
+    "directory": os.path.join(tempfile.gettempdir(), "cookiecutter_plugin_profiles"),
+    "max_profiles": 50,
+}
+
+PROFILE_SUFFIX = ".prof"
+# a request that asked to be profiled, whose user is not known yet.
+STAFF_ONLY = "staff_only"
+PROFILE_NAME_REGEX = re.compile(r"^[\w\-.]+\.prof$")
+
+
+def profiler_settings() -> dict:
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, "COOKIECUTTER_PLUGIN_PROFILER", None) or {})
+    return config
+
+
+def _slug(path: str) -> str:
+    return re.sub(r"[^\w\-]+", "_", path).strip("_")[:80] or "root"
+
+
+class ProfileRing:
+    """
+    a directory holding at most max_profiles pstats files.
+    """
+
+    def __init__(self, directory, max_profiles):
+        self.directory = directory
+        self.max_profiles = max_profiles
+
+    def _paths(self):
+        try:
+            names = [name for name in os.listdir(self.directory) if name.endswith(PROFILE_SUFFIX)]
+        except FileNotFoundError:
+            return []
+        return sorted(os.path.join(self.directory, name) for name in names)
+
+    def save(self, profile, request, elapsed) -> str:
+        os.makedirs(self.directory, exist_ok=True)
+        name = "{ts}-{pid}-{method}-{path}-{ms}ms{suffix}".format(
+            ts=datetime.utcnow().strftime("%Y%m%dT%H%M%S%f"),
+            pid=os.getpid(),
+            method=request.method,
+            path=_slug(request.path),
+            ms=int(elapsed * 1000),
+            suffix=PROFILE_SUFFIX,
+        )
+        path = os.path.join(self.directory, name)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        os.close(fd)
+        profile.dump_stats(tmp_path)
+        os.replace(tmp_path, path)
+        self.prune()
+        return path
+
+    def prune(self):
+        paths = self._paths()
+        # file names start with a utc timestamp, so lexical order is chronological.
+        for path in paths[: max(0, len(paths) - self.max_profiles)]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def list(self) -> list:
+        profiles = []
+        for path in reversed(self._paths()):
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            profiles.append({"name": os.path.basename(path), "size": stat.st_size, "modified": stat.st_mtime})
+        return profiles
+
+    def path_for(self, name):
+        """
+        absolute path of a stored profile, or None if name is not a profile in this ring.
+        """
+        if not PROFILE_NAME_REGEX.match(name):
+            return None
+        path = os.path.join(self.directory, name)
+        return path if os.path.isfile(path) else None
+
+
+def profile_ring() -> ProfileRing:
+    config = profiler_settings()
+    return ProfileRing(config["directory"], config["max_profiles"])
+
+
+class SamplingProfilerMiddleware:
+    """
+    registered by settings/common.py plugin_settings(). Removes itself from the
+    middleware chain when the profiler is disabled.
+    """
+
+    def __init__(self, get_response):
+        config = profiler_settings()
+        if not config["enabled"]:
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        self.sample_rate = int(config["sample_rate"] or 0)
+        self.path_regex = re.compile(config["path_regex"]) if config["path_regex"] else None
+        header = config["header"]
+        self.header_key = "HTTP_" + header.upper().replace("-", "_") if header else None
+        self.ring = ProfileRing(config["directory"], config["max_profiles"])
+        self._counter = itertools.count(1)
+        # cProfile cannot profile overlapping requests in the same process.
+        self._busy = threading.Lock()
+
+    def _should_sample(self, request):
+        """
+        True, False, or STAFF_ONLY: profile, but keep the profile only if the user is staff.
+        """
+        if self.sample_rate and next(self._counter) % self.sample_rate == 0:
+            return True
+        if self.path_regex is not None and self.path_regex.search(request.path):
+            return True
+        if self.header_key and request.META.get(self.header_key):
+            # AuthenticationMiddleware, later in the chain, has not set request.user yet.
+            return STAFF_ONLY
+        return False
+
+    @staticmethod
+    def _is_staff(request) -> bool:
+        user = getattr(request, "user", None)
+        return bool(user is not None and user.is_authenticated and user.is_staff)
+
+    def __call__(self, request):
+        sample = self._should_sample(request)
+        if not sample or not self._busy.acquire(blocking=False):
+            return self.get_response(request)
+
+        try:
+            profile = cProfile.Profile()
+            start = time.perf_counter()
+            try:
+                profile.enable()
+            except ValueError:
+                # another profiler (ie a debugger or coverage) is already active.
+                return self.get_response(request)
+            try:
+                response = self.get_response(request)
+            finally:
+                profile.disable()
+            elapsed = time.perf_counter() - start
+            if sample is STAFF_ONLY and not self._is_staff(request):
+                return response
+            try:
+                path = self.ring.save(profile, request, elapsed)
+                log.info("cookiecutter_plugin profiled %s %s -> %s", request.method, request.path, path)
+            except OSError as e:
+                log.warning("cookiecutter_plugin could not save profile: %s", e)
+            return response
+        finally:
+            self._busy.release()
@@ -0,0 +1,199 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:
+    per-event-type field projection of openedx-events payloads.
+
+    dispatch.dispatch_event() reduces each payload to the dotted field paths
+    configured for its event type before it is logged, handed to the worker
+    pool or written to the event sinks. The paths are compiled once into
+    nested operator.attrgetter() calls that run against the attrs instances,
+    so the fields that are not kept (PII, nested course metadata) are never
+    copied, redacted or serialized.
+
+    settings.COOKIECUTTER_PLUGIN_PROJECTIONS = {
+        "enabled": True,
+        "events": {
+            # the first segment of each path is the payload's keyword, ie enrollment.
+            "COURSE_ENROLLMENT_CREATED": ["enrollment.user.id", "enrollment.course.course_key", "enrollment.mode"],
+            # None: keep the whole payload.
+            "COHORT_MEMBERSHIP_CHANGED": None,
+        },
+    }
+
+    "events" is merged over DEFAULT_PROJECTIONS one event type at a time.
+    A path whose field does not exist in the installed openedx-events is
+    left out of the projected payload.
+"""
+# python stuff
+import logging
+import threading
+from operator import attrgetter
+
+# django stuff
+from django.conf import settings
+
+# our stuff
+from .apps import (
+    STUDENT_REGISTRATION_COMPLETED,
+    SESSION_LOGIN_COMPLETED,
+    COURSE_ENROLLMENT_CREATED,
+    COURSE_ENROLLMENT_CHANGED,
+    COURSE_UNENROLLMENT_COMPLETED,
+    PERSISTENT_GRADE_SUMMARY_CHANGED,
+    CERTIFICATE_CREATED,
+    CERTIFICATE_CHANGED,
+    CERTIFICATE_REVOKED,
+    COHORT_MEMBERSHIP_CHANGED,
+    COURSE_DISCUSSIONS_CHANGED,
+)
+
+log = logging.getLogger(__name__)
+
+_USER = ["user.id", "user.is_active"]
+_ENROLLMENT = [
+    "enrollment.user.id",
+    "enrollment.course.course_key",
+    "enrollment.mode",
+    "enrollment.is_active",
+    "enrollment.creation_date",
+]
+_CERTIFICATE = [
+    "certificate.user.id",
+    "certificate.course.course_key",
+    "certificate.mode",
+    "certificate.grade",
+    "certificate.current_status",
+]
+
+DEFAULT_PROJECTIONS = {
+    STUDENT_REGISTRATION_COMPLETED: _USER,
+    SESSION_LOGIN_COMPLETED: _USER,
+    COURSE_ENROLLMENT_CREATED: _ENROLLMENT,
+    COURSE_ENROLLMENT_CHANGED: _ENROLLMENT,
+    COURSE_UNENROLLMENT_COMPLETED: _ENROLLMENT,
+    PERSISTENT_GRADE_SUMMARY_CHANGED: [
+        "grade.user_id",
+        "grade.course.course_key",
+        "grade.percent_grade",
+        "grade.letter_grade",
+        "grade.passed_timestamp",
+    ],
+    CERTIFICATE_CREATED: _CERTIFICATE,
+    CERTIFICATE_CHANGED: _CERTIFICATE,
+    CERTIFICATE_REVOKED: _CERTIFICATE,
+    COHORT_MEMBERSHIP_CHANGED: ["cohort.user.id", "cohort.course.course_key", "cohort.name"],
+    # kept whole: capturing the full configuration, contexts and all, is the point of this event.
+    # payloads.BoundedJSONWriter keeps it within COOKIECUTTER_PLUGIN_SERIALIZATION["max_bytes"]
+    COURSE_DISCUSSIONS_CHANGED: None,
+}
+
+DEFAULTS = {
+    "enabled": True,
+    "events": DEFAULT_PROJECTIONS,
+}
+
+
+def projection_settings() -> dict:
+    custom = getattr(settings, "COOKIECUTTER_PLUGIN_PROJECTIONS", None) or {}
+    config = dict(DEFAULTS)
+    config.update(custom)
+    config["events"] = dict(DEFAULT_PROJECTIONS, **(custom.get("events") or {}))
+    return config
+
+
+def _compile(tree) -> tuple:
+    """
+    {"user": {"id": None}, "mode": None} -> ((key, getter, subtree or None), ...)
+    """
+    return tuple(
+        (key, attrgetter(key), None if subtree is None else _compile(subtree)) for key, subtree in tree.items()
+    )
+
+
+def _extract(obj, node) -> dict:
+    if obj is None:
+        return None
+    projected = {}
+    if isinstance(obj, dict):
+        for key, _getter, subtree in node:
+            if key in obj:
+                value = obj[key]
+                projected[key] = value if subtree is None else _extract(value, subtree)
+        return projected
+    for key, getter, subtree in node:
+        try:
+            value = getter(obj)
+        except AttributeError:
+            # not a field of this version of the openedx-events data class.
+            continue
+        projected[key] = value if subtree is None else _extract(value, subtree)
+    return projected
+
+
+class Projection:
+    """
+    dotted field paths, ie ["enrollment.user.id", "enrollment.mode"], compiled
+    into a function of an event's data, ie {"enrollment": CourseEnrollmentData}
+    """
+
+    def __init__(self, paths):
+        self.paths = list(paths)
+        tree = {}
+        for path in self.paths:
+            keys = path.split(".")
+            node = tree
+            for key in keys[:-1]:
+                node = node.setdefault(key, {})
+                if node is None:
+                    # a shorter path already keeps the whole of this field.
+                    break
+            else:
+                node[keys[-1]] = None
+        self._root = _compile(tree)
+
+    def __call__(self, data: dict) -> dict:
+        return _extract(data, self._root)
+
+
+class Projections:
+    def __init__(self, events):
+        self.projections = {}
+        for event_name, paths in events.items():
+            if event_name not in DEFAULT_PROJECTIONS:
+                log.warning(
+                    "cookiecutter_plugin ignored the projection of unknown event {name}".format(name=event_name)
+                )
+                continue
+            if paths is not None:
+                self.projections[event_name] = Projection(paths)
+
+    def project(self, event_name, data: dict) -> dict:
+        projection = self.projections.get(event_name)
+        return data if projection is None else projection(data)
+
+
+_projections = None
+_projections_lock = threading.Lock()
+
+
+def projections() -> Projections:
+    """
+    the configured projections. none at all if projection is disabled.
+    """
+    global _projections
+
+    if _projections is None:
+        with _projections_lock:
+            if _projections is None:
+                config = projection_settings()
+                _projections = Projections(config["events"] if config["enabled"] else {})
+    return _projections
+
+
+def project_event(event_name, data: dict) -> dict:
+    return projections().project(event_name, data)
@@ -0,0 +1,292 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:
+    incrementally maintained per-course enrollment roster index.
+
+    course_enrollment_created, course_enrollment_changed and
+    course_unenrollment_completed in signals.py report each user's current
+    enrollment state. States are coalesced in memory per (course, user) and
+    written to models.CourseEnrollmentRoster in batched upserts by a
+    background flusher (see batching.py), so dashboards can read active
+    enrollment counts per course and mode without scanning
+    student_courseenrollment.
+
+    Each gunicorn worker buffers and flushes on its own timer, so the states of
+    one user can reach the database out of order, ie an enrollment handled by
+    one worker lands after the unenrollment handled by another. Each roster
+    therefore keeps the event time of every user's last applied state, for
+    ordering_window seconds, and a state older than that is dropped, as
+    certificates.py does with CertificateStatus.updated. A state delayed by
+    more than ordering_window is applied regardless.
+
+    ./manage.py lms cookiecutter_plugin_rebuild_rosters rebuilds the index from scratch.
+    read api: /cookiecutter_plugin/api/v1/rosters/<course_key>/
+
+    configured in settings.COOKIECUTTER_PLUGIN_ROSTERS. see settings/common.py
+"""
+# python stuff
+import logging
+import threading
+import time
+import zlib
+
+# django stuff
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+# our stuff
+from .batching import CoalescingBuffer
+from .intset import decode_deltas, encode_deltas, read_varint, write_varint
+
+log = logging.getLogger(__name__)
+
+DEFAULTS = {
+    "enabled": True,
+    "flush_interval": 5,
+    "batch_size": 1000,
+    "max_pending": 100000,
+    # seconds that the event time of each user's last state is kept, to drop states that arrive out of order.
+    "ordering_window": 3600,
+}
+
+
+def rosters_settings() -> dict:
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, "COOKIECUTTER_PLUGIN_ROSTERS", None) or {})
+    return config
+
+
+# -----------------------------------------------------------------------------
+# storage format
+# -----------------------------------------------------------------------------
+def encode_roster(modes: dict) -> bytes:
+    """
+    {mode: set(user ids)} -> zlib(varint(n_modes) [varint(len(mode)) mode intset]*)
+    """
+    out = bytearray()
+    modes = {mode: users for mode, users in modes.items() if users}
+    write_varint(len(modes), out)
+    for mode in sorted(modes):
+        name = mode.encode("utf-8")
+        write_varint(len(name), out)
+        out.extend(name)
+        encode_deltas(modes[mode], out)
+    return zlib.compress(bytes(out))
+
+
+def decode_roster(data) -> dict:
+    if not data:
+        return {}
+    raw = zlib.decompress(bytes(data))
+    n_modes, pos = read_varint(raw, 0)
+    modes = {}
+    for _ in range(n_modes):
+        length, pos = read_varint(raw, pos)
+        mode = raw[pos : pos + length].decode("utf-8")
+        pos += length
+        users, pos = decode_deltas(raw, pos)
+        modes[mode] = set(users)
+    return modes
+
+
+def encode_event_times(times: dict) -> bytes:
+    """
+    {user_id: epoch milliseconds} -> zlib(intset(user ids) varint(base) [varint(ms - base)]*)
+    """
+    if not times:
+        return b""
+    out = bytearray()
+    users = sorted(times)
+    encode_deltas(users, out)
+    base = min(times.values())
+    write_varint(base, out)
+    for user_id in users:
+        write_varint(times[user_id] - base, out)
+    return zlib.compress(bytes(out))
+
+
+def decode_event_times(data) -> dict:
+    if not data:
+        return {}
+    raw = zlib.decompress(bytes(data))
+    users, pos = decode_deltas(raw, 0)
+    base, pos = read_varint(raw, pos)
+    times = {}
+    for user_id in users:
+        offset, pos = read_varint(raw, pos)
+        times[user_id] = base + offset
+    return times
+
+
+def event_milliseconds(event_time=None) -> int:
+    """
+    EventsMetadata.time as epoch milliseconds. now, if the event has no metadata.
+    """
+    if event_time is None:
+        return int(time.time() * 1000)
+    if timezone.is_naive(event_time):
+        # EventsMetadata.time is utc, but older openedx-events releases leave it naive.
+        event_time = timezone.make_aware(event_time, timezone.utc)
+    return int(event_time.timestamp() * 1000)
+
+
+def newer_states(states: dict, times: dict, ordering_window) -> dict:
+    """
+    states: {user_id: (mode or None, epoch ms)}. returns {user_id: mode or None} for
+    the states no older than the last applied state of their user, and records
+    their times in `times`, from which times older than ordering_window are pruned.
+    """
+    newer = {}
+    for user_id, (mode, event_ms) in states.items():
+        if event_ms >= times.get(user_id, 0):
+            newer[user_id] = mode
+            times[user_id] = event_ms
+    cutoff = int((time.time() - ordering_window) * 1000)
+    for user_id in [user_id for user_id, event_ms in times.items() if event_ms < cutoff]:
+        del times[user_id]
+    return newer
+
+
+def apply_states(modes: dict, states: dict) -> dict:
+    """
+    apply {user_id: mode or None} to {mode: set(user ids)} in place.
+    None means that the user no longer has an active enrollment.
+    """
+    for user_id, mode in states.items():
+        for users in modes.values():
+            users.discard(user_id)
+        if mode is not None:
+            modes.setdefault(mode, set()).add(user_id)
+    return modes
+
+
+def populate(roster, modes: dict, event_times=None):
+    modes = {mode: users for mode, users in modes.items() if users}
+    roster.active_users = encode_roster(modes)
+    roster.event_times = encode_event_times(event_times)
+    roster.mode_counts = {mode: len(users) for mode, users in sorted(modes.items())}
+    roster.total_active = sum(roster.mode_counts.values())
+    # bulk_update() does not honor auto_now.
+    roster.updated = timezone.now()
+    return roster
+
+
+# -----------------------------------------------------------------------------
+# batched upserts
+# -----------------------------------------------------------------------------
+def write_batch(batch: dict):
+    """
+    batch: {(course_key, user_id): (mode or None, event epoch ms)}
+    """
+    from .models import CourseEnrollmentRoster
+
+    ordering_window = rosters_settings()["ordering_window"]
+    by_course = {}
+    for (course_key, user_id), state in batch.items():
+        by_course.setdefault(course_key, {})[user_id] = state
+
+    for attempt in (1, 2):
+        try:
+            with transaction.atomic():
+                existing = {
+                    str(roster.course_key): roster
+                    for roster in CourseEnrollmentRoster.objects.select_for_update().filter(
+                        course_key__in=list(by_course.keys())
+                    )
+                }
+                updates = []
+                creates = []
+                for course_key, states in by_course.items():
+                    roster = existing.get(course_key)
+                    if roster is None:
+                        times = {}
+                        modes = apply_states({}, newer_states(states, times, ordering_window))
+                        creates.append(populate(CourseEnrollmentRoster(course_key=course_key), modes, times))
+                    else:
+                        times = decode_event_times(roster.event_times)
+                        modes = apply_states(
+                            decode_roster(roster.active_users), newer_states(states, times, ordering_window)
+                        )
+                        updates.append(populate(roster, modes, times))
+                if updates:
+                    CourseEnrollmentRoster.objects.bulk_update(
+                        updates, ["active_users", "event_times", "mode_counts", "total_active", "updated"]
+                    )
+                if creates:
+                    CourseEnrollmentRoster.objects.bulk_create(creates)
+            return
+        except IntegrityError:
+            # another worker created one of these courses first. its row now exists; retry once as an update.
+            if attempt == 2:
+                raise
+
+
+class RosterIndex:
+    def __init__(self, config=None):
+        self.config = config or rosters_settings()
+        self.buffer = CoalescingBuffer(
+            "rosters",
+            write_batch,
+            flush_interval=self.config["flush_interval"],
+            batch_size=self.config["batch_size"],
+            max_pending=self.config["max_pending"],
+        )
+
+    def record(self, course_key, user_id, mode, is_active=True, event_time=None):
+        if not self.config["enabled"] or course_key is None or user_id is None:
+            return
+        self.buffer.put((str(course_key), user_id), (mode if is_active else None, event_milliseconds(event_time)))
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def roster_index() -> RosterIndex:
+    global _index
+
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = RosterIndex()
+    return _index
+
+
+def record_enrollment(enrollment, metadata=None, unenrolled=False):
+    """
+    called from the enrollment receivers in signals.py with a CourseEnrollmentData
+    """
+    roster_index().record(
+        enrollment.course.course_key,
+        enrollment.user.id,
+        enrollment.mode,
+        is_active=enrollment.is_active and not unenrolled,
+        event_time=getattr(metadata, "time", None),
+    )
+
+
+def get_roster(course_key, include_users=False):
+    """
+    the stored roster of a course as a dict, or None if there is none.
+    """
+    from .models import CourseEnrollmentRoster
+
+    try:
+        roster = CourseEnrollmentRoster.objects.get(course_key=course_key)
+    except CourseEnrollmentRoster.DoesNotExist:
+        return None
+    result = {
+        "course_key": str(roster.course_key),
+        "total_active": roster.total_active,
+        "mode_counts": roster.mode_counts,
+        "updated": roster.updated.isoformat(),
+    }
+    if include_users:
+        result["users"] = {mode: sorted(users) for mode, users in decode_roster(roster.active_users).items()}
+    return result
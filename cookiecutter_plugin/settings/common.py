@@ -6,12 +6,29 @@ Handling of environment variables, see: https://django-environ.readthedocs.io/en
 to convert .env to yml see: https://django-environ.readthedocs.io/en/latest/tips.html#docker-style-file-based-variables
 """
 from path import Path as path
-import environ
 import os
 
+# set in os.environ once the .env file has been read. child processes inherit it along with the variables themselves.
+ENV_FILE_READ = "COOKIECUTTER_PLUGIN_ENV_FILE_READ"
+
+
+def read_env(env_file):
+    """
+    load env_file into os.environ once per process, however many times this
+    module is imported or reloaded, and not at all if there is no such file.
+    """
+    if os.environ.get(ENV_FILE_READ) == env_file:
+        return
+    if os.path.isfile(env_file):
+        import environ
+
+        environ.Env.read_env(env_file)
+    os.environ[ENV_FILE_READ] = env_file
+
+
 # path to this file.
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-environ.Env.read_env(os.path.join(BASE_DIR, ".env"))
+read_env(os.path.join(BASE_DIR, ".env"))
 
 
 APP_ROOT = (
@@ -26,3 +43,112 @@ def plugin_settings(settings):
     """
 
     settings.BADGING_BACKEND = "cookiecutter_plugin.badges.backends.badgr_boto3.BadgrBoto3Backend"
+
+    # see badges/circuit_breaker.py for the complete list of keys and their defaults.
+    settings.COOKIECUTTER_PLUGIN_CIRCUIT_BREAKER = {
+        "error_rate_threshold": 0.5,
+        "slow_call_seconds": 2.0,
+        "reset_timeout": 30,
+    }
+
+    # route the plugin's own loggers through a bounded, non-blocking queue. see log_queue.py
+    settings.COOKIECUTTER_PLUGIN_LOG_QUEUE = {
+        "enabled": False,
+        "maxsize": 10000,
+    }
+
+    # sampling cProfile middleware, first in the chain so that its profiles include the platform's
+    # own middleware. see profiling.py
+    settings.COOKIECUTTER_PLUGIN_PROFILER = {
+        "enabled": False,
+        "sample_rate": 1000,
+        "path_regex": None,
+        "header": "X-Cookiecutter-Profile",
+        "max_profiles": 50,
+    }
+    settings.MIDDLEWARE.insert(0, "cookiecutter_plugin.profiling.SamplingProfilerMiddleware")
+
+    # HyperLogLog unique active user estimates. see active_users.py
+    settings.COOKIECUTTER_PLUGIN_ACTIVE_USERS = {
+        "enabled": True,
+        "precision": 10,
+        "flush_interval": 10,
+        "cache_alias": "default",
+    }
+
+    # incrementally maintained per-course enrollment roster index. see rosters.py
+    settings.COOKIECUTTER_PLUGIN_ROSTERS = {
+        "enabled": True,
+        "flush_interval": 5,
+        "batch_size": 1000,
+        "ordering_window": 3600,
+    }
+
+    # materialized certificate status table. see certificates.py
+    settings.COOKIECUTTER_PLUGIN_CERTIFICATES = {
+        "enabled": True,
+        "flush_interval": 5,
+        "batch_size": 1000,
+    }
+
+    # where event processing runs: "inline" or "process_pool". see dispatch.py and workers.py
+    settings.COOKIECUTTER_PLUGIN_EVENT_EXECUTION = {
+        "mode": "inline",
+        "processes": 2,
+        "queue_size": 10000,
+        "drain_timeout": 5.0,
+    }
+
+    # fan-out of event payloads to file, sqlite and http sinks. none are configured by default.
+    # see sinks/base.py for an example.
+    settings.COOKIECUTTER_PLUGIN_EVENT_SINKS = {
+        "sinks": {},
+    }
+
+    # size limits of rendered event payloads. see payloads.BoundedJSONWriter
+    settings.COOKIECUTTER_PLUGIN_SERIALIZATION = {
+        "max_bytes": 65536,
+        "max_items": 50,
+        "max_string": 2048,
+    }
+
+    # per-worker event counters in a shared memory-mapped file. see shared_counters.py
+    settings.COOKIECUTTER_PLUGIN_SHARED_COUNTERS = {
+        "enabled": True,
+        "slots": 256,
+    }
+
+    # receivers called from a running event loop run on a bounded thread pool. see async_receivers.py
+    settings.COOKIECUTTER_PLUGIN_ASYNC_RECEIVERS = {
+        "enabled": True,
+        "max_concurrency": 8,
+        "max_pending": 10000,
+    }
+
+    # each event type's payload is reduced to these dotted field paths before it is
+    # logged or emitted. merged over projections.DEFAULT_PROJECTIONS. see projections.py
+    settings.COOKIECUTTER_PLUGIN_PROJECTIONS = {
+        "enabled": True,
+        "events": {},
+    }
+
+    # user-to-cohort index kept current by COHORT_MEMBERSHIP_CHANGED. see cohorts.py
+    settings.COOKIECUTTER_PLUGIN_COHORTS = {
+        "enabled": True,
+        "cache_alias": "default",
+        "timeout": 86400,
+        "max_entries": 100000,
+        "sync_interval": 1.0,
+        "max_changes": 1000,
+    }
+
+    # top courses, users and event types per sliding window, in fixed memory. see heavy_hitters.py
+    settings.COOKIECUTTER_PLUGIN_HEAVY_HITTERS = {
+        "enabled": True,
+        "bucket_seconds": 10,
+        "buckets": 30,
+        "windows": [60, 300],
+        "top_k": 20,
+        "width": 1024,
+        "depth": 4,
+    }
@@ -3,9 +3,31 @@
 Common Pluggable Django App settings
 """
 
+# settings.py dictionaries that can be overridden from the lms yml configuration.
+ENV_TOKEN_SETTINGS = [
+    "COOKIECUTTER_PLUGIN_CIRCUIT_BREAKER",
+    "COOKIECUTTER_PLUGIN_LOG_QUEUE",
+    "COOKIECUTTER_PLUGIN_PROFILER",
+    "COOKIECUTTER_PLUGIN_ACTIVE_USERS",
+    "COOKIECUTTER_PLUGIN_ROSTERS",
+    "COOKIECUTTER_PLUGIN_CERTIFICATES",
+    "COOKIECUTTER_PLUGIN_EVENT_EXECUTION",
+    "COOKIECUTTER_PLUGIN_EVENT_SINKS",
+    "COOKIECUTTER_PLUGIN_SERIALIZATION",
+    "COOKIECUTTER_PLUGIN_SHARED_COUNTERS",
+    "COOKIECUTTER_PLUGIN_ASYNC_RECEIVERS",
+    "COOKIECUTTER_PLUGIN_PROJECTIONS",
+    "COOKIECUTTER_PLUGIN_COHORTS",
+    "COOKIECUTTER_PLUGIN_HEAVY_HITTERS",
+]
+
 
 def plugin_settings(settings):
     """
     Injects local settings into django settings
     """
-    pass
+    env_tokens = getattr(settings, "ENV_TOKENS", {}) or {}
+    for name in ENV_TOKEN_SETTINGS:
+        value = dict(getattr(settings, name, {}) or {})
+        value.update(env_tokens.get(name, {}) or {})
+        setattr(settings, name, value)
@@ -0,0 +1,254 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:
+    exact, pod-wide event counts across every gunicorn worker, kept in a
+    memory-mapped file.
+
+    The file is a fixed table of slots. Each thread that receives events
+    (one per sync gunicorn worker, more under gthread) claims a slot of its
+    own and is its only writer, so an increment is a plain 8-byte aligned
+    store: no locks, no system calls and no network round trips. Readers
+    (see /cookiecutter_plugin/event-counters/) sum the slots.
+
+    layout, native-endian unsigned 64-bit words:
+
+    header      magic, version, layout hash, number of event types, number of slots, slot size
+    slot        pid, thread id, claimed at (unix time), one counter per event type in apps.OPENEDX_SIGNALS
+
+    Slots are padded to a multiple of 64 bytes so that two writers never
+    share a cache line. The slot of an exited process or thread is taken
+    over, counts and all, by the next one to claim a slot, so totals never
+    go backwards.
+
+    configured in settings.COOKIECUTTER_PLUGIN_SHARED_COUNTERS. see settings/common.py
+"""
+# python stuff
+import fcntl
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+
+# django stuff
+from django.conf import settings
+
+# our stuff
+from .apps import OPENEDX_SIGNALS
+
+log = logging.getLogger(__name__)
+
+MAGIC = int.from_bytes(b"CCPCTRS\0", "little")
+VERSION = 1
+HEADER_WORDS = 8
+SLOT_HEADER_WORDS = 3
+CACHE_LINE = 64
+WORD = struct.calcsize("Q")
+
+DEFAULTS = {
+    "enabled": True,
+    # tmpfs when it is available, so that the table never touches a disk.
+    "path": os.path.join(
+        "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir(), "cookiecutter_plugin_counters"
+    ),
+    # the largest number of event-receiving threads, across all worker processes, expected on one host.
+    "slots": 256,
+}
+
+
+def shared_counters_settings() -> dict:
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, "COOKIECUTTER_PLUGIN_SHARED_COUNTERS", None) or {})
+    return config
+
+
+def _process_exists(pid) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class SharedCounterTable:
+    def __init__(self, path, event_names, slots=256):
+        self.path = path
+        self.event_names = list(event_names)
+        self.index = {name: i for i, name in enumerate(self.event_names)}
+        self.slots = slots
+        slot_words = SLOT_HEADER_WORDS + len(self.event_names)
+        self.slot_words = -(-slot_words * WORD // CACHE_LINE) * CACHE_LINE // WORD
+        self.size = (HEADER_WORDS + self.slots * self.slot_words) * WORD
+        self.layout_hash = int.from_bytes(
+            hashlib.blake2b("\n".join(self.event_names).encode("utf-8"), digest_size=8).digest(), "little"
+        )
+        self._fd = None
+        self._mmap = None
+        self._words = None
+        # .base: first word of the counters of the calling thread's slot, or None if none was free.
+        self._local = threading.local()
+
+    # -------------------------------------------------------------------------
+    # file
+    # -------------------------------------------------------------------------
+    def _header(self) -> tuple:
+        return (MAGIC, VERSION, self.layout_hash, len(self.event_names), self.slots, self.slot_words, 0, 0)
+
+    def open(self):
+        """
+        map the table, creating or re-creating the file if its layout does not match ours.
+        """
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                header = struct.pack("{n}Q".format(n=HEADER_WORDS), *self._header())
+                if os.fstat(fd).st_size != self.size or os.pread(fd, len(header), 0) != header:
+                    # a new file, or one written for a different set of event types.
+                    os.ftruncate(fd, 0)
+                    os.ftruncate(fd, self.size)
+                    os.pwrite(fd, header, 0)
+                self._mmap = mmap.mmap(fd, self.size, mmap.MAP_SHARED, mmap.PROT_READ | mmap.PROT_WRITE)
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        except Exception:
+            os.close(fd)
+            raise
+        self._fd = fd
+        self._words = memoryview(self._mmap).cast("Q")
+        return self
+
+    def _slot_start(self, slot) -> int:
+        return HEADER_WORDS + slot * self.slot_words
+
+    def claim(self):
+        """
+        claim a slot for the calling thread: a free one, or one whose process
+        or thread has exited. Returns the first word of its counters, or None.
+        """
+        pid = os.getpid()
+        thread_id = threading.get_ident()
+        live_threads = {thread.ident for thread in threading.enumerate()}
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            for slot in range(self.slots):
+                start = self._slot_start(slot)
+                owner = self._words[start]
+                if owner == pid:
+                    reusable = self._words[start + 1] not in live_threads
+                else:
+                    reusable = owner == 0 or not _process_exists(owner)
+                if reusable:
+                    self._words[start + 2] = int(time.time())
+                    self._words[start + 1] = thread_id
+                    self._words[start] = pid
+                    return start + SLOT_HEADER_WORDS
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        log.warning(
+            "cookiecutter_plugin shared counters: all {slots} slots of {path} are taken. "
+            "events of pid {pid} thread {thread_id} will not be counted.".format(
+                slots=self.slots, path=self.path, pid=pid, thread_id=thread_id
+            )
+        )
+        return None
+
+    def release(self):
+        """
+        forget the slots claimed so far, ie in a freshly forked child.
+        """
+        self._local = threading.local()
+
+    # -------------------------------------------------------------------------
+    # writer
+    # -------------------------------------------------------------------------
+    def increment(self, event_name, n=1):
+        i = self.index.get(event_name)
+        if i is None:
+            return
+        try:
+            base = self._local.base
+        except AttributeError:
+            base = self._local.base = self.claim()
+        if base is not None:
+            # only this thread writes this slot. readers never see a torn aligned 8-byte store.
+            self._words[base + i] += n
+
+    # -------------------------------------------------------------------------
+    # reader
+    # -------------------------------------------------------------------------
+    def snapshot(self) -> dict:
+        totals = dict.fromkeys(self.event_names, 0)
+        workers = {}
+        for slot in range(self.slots):
+            start = self._slot_start(slot)
+            pid = self._words[start]
+            if pid == 0:
+                continue
+            counts = self._words[start + SLOT_HEADER_WORDS : start + SLOT_HEADER_WORDS + len(self.event_names)].tolist()
+            for name, count in zip(self.event_names, counts):
+                totals[name] += count
+            worker = workers.get(pid)
+            if worker is None:
+                worker = workers[pid] = {"pid": pid, "alive": _process_exists(pid), "slots": 0, "events": 0}
+            worker["slots"] += 1
+            worker["events"] += sum(counts)
+        return {
+            "time": time.time(),
+            "path": self.path,
+            "totals": totals,
+            "total": sum(totals.values()),
+            "workers": list(workers.values()),
+        }
+
+
+_table = None
+_table_lock = threading.Lock()
+_unavailable = False
+
+
+def _after_fork_in_child():
+    if _table is not None:
+        _table.release()
+
+
+def counter_table():
+    """
+    this process' mapping of the table, or None if shared counters are disabled or unavailable.
+    """
+    global _table, _unavailable
+
+    if _table is None and not _unavailable:
+        with _table_lock:
+            if _table is None and not _unavailable:
+                config = shared_counters_settings()
+                if not config["enabled"]:
+                    _unavailable = True
+                    return None
+                try:
+                    _table = SharedCounterTable(config["path"], OPENEDX_SIGNALS, slots=config["slots"]).open()
+                except OSError as e:
+                    log.error("cookiecutter_plugin shared counters unavailable: {e}".format(e=e))
+                    _unavailable = True
+                    return None
+                os.register_at_fork(after_in_child=_after_fork_in_child)
+    return _table
+
+
+def count_event(event_name):
+    table = _table or counter_table()
+    if table is not None:
+        table.increment(event_name)
@@ -9,19 +9,34 @@ usage:          listen for Django Signals published by Open edX
                 see https://docs.djangoproject.com/en/4.1/topics/signals/
 """
 # python stuff
-import json
 import logging
-from attr import asdict
 
 # django stuff
 from django.dispatch import receiver
 from django.contrib.auth.signals import user_logged_in, user_logged_out
-
-# open edx stuff
-from openedx.core.djangoapps.user_authn.views.register import REGISTER_USER
+from django.core.signals import request_started
 
 # our stuff
-from .utils import serialize_course_key, PluginJSONEncoder, masked_dict
+from .apps import (
+    STUDENT_REGISTRATION_COMPLETED,
+    SESSION_LOGIN_COMPLETED,
+    COURSE_ENROLLMENT_CREATED,
+    COURSE_ENROLLMENT_CHANGED,
+    COURSE_UNENROLLMENT_COMPLETED,
+    PERSISTENT_GRADE_SUMMARY_CHANGED,
+    CERTIFICATE_CREATED,
+    CERTIFICATE_CHANGED,
+    CERTIFICATE_REVOKED,
+    COHORT_MEMBERSHIP_CHANGED,
+    COURSE_DISCUSSIONS_CHANGED,
+)
+from .active_users import record_login
+from .async_receivers import loop_aware
+from .certificates import record_certificate
+from .cohorts import record_cohort_membership
+from .dispatch import dispatch_event
+from .heavy_hitters import track_event
+from .rosters import record_enrollment
 from .waffle import waffle_switches, SIGNALS
 
 
@@ -47,27 +62,47 @@ def _signals_enabled() -> bool:
 
 
 @receiver(user_logged_in, dispatch_uid="cookiecutter_plugin_user_logged_in")
+@loop_aware
 def post_login(sender, request, user, **kwargs):  # lint-amnesty, pylint: disable=unused-argument
     if not _signals_enabled():
         return
 
-    log.info("cookiecutter_plugin received user_logged_in signal for {username}".format(username=user.username))
+    record_login(user.id)
+    track_event("user_logged_in", user_id=user.id)
+    log.info("cookiecutter_plugin received user_logged_in signal for %s", user.username)
 
 
 @receiver(user_logged_out, dispatch_uid="cookiecutter_plugin_user_logged_out")
+@loop_aware
 def post_logout(sender, request, user, **kwargs):  # lint-amnesty, pylint: disable=unused-argument
     if not _signals_enabled():
         return
 
-    log.info("cookiecutter_plugin received user_logged_out signal for {username}".format(username=user.username))
+    track_event("user_logged_out", user_id=user.id)
+    log.info("cookiecutter_plugin received user_logged_out signal for %s", user.username)
 
 
-@receiver(REGISTER_USER, dispatch_uid="cookiecutter_plugin_REGISTER_USER")
+@loop_aware
 def register_user(sender, user, registration, **kwargs):  # pylint: disable=unused-argument
     if not _signals_enabled():
         return
 
-    log.info("cookiecutter_plugin received REGISTER_USER signal for {username}".format(username=user.username))
+    track_event("REGISTER_USER", user_id=user.id)
+    log.info("cookiecutter_plugin received REGISTER_USER signal for %s", user.username)
+
+
+@receiver(request_started, dispatch_uid="cookiecutter_plugin_connect_REGISTER_USER")
+def connect_register_user(sender, **kwargs):  # pylint: disable=unused-argument
+    """
+    REGISTER_USER lives in the registration view module, which imports a large
+    part of the LMS. It is only ever sent while serving a request, so connect
+    register_user() on the first request rather than when this module is
+    imported by every management command and worker process.
+    """
+    from openedx.core.djangoapps.user_authn.views.register import REGISTER_USER
+
+    REGISTER_USER.connect(register_user, dispatch_uid="cookiecutter_plugin_REGISTER_USER")
+    request_started.disconnect(dispatch_uid="cookiecutter_plugin_connect_REGISTER_USER")
 
 
 """
@@ -81,6 +116,7 @@ def register_user(sender, user, registration, **kwargs):  # pylint: disable=unus
 """
 
 
+@loop_aware
 def student_registration_completed(user, **kwargs):  # pylint: disable=unused-argument
     """
     see apps.py plugin_app["signals_config"]["lms.djangoapp"]["receivers"]
@@ -107,20 +143,10 @@ def student_registration_completed(user, **kwargs):  # pylint: disable=unused-ar
     if not _signals_enabled():
         return
 
-    user_info = asdict(user)
-    event_metadata = asdict(kwargs.get("metadata"))
-    payload = {
-        "user": user_info,
-        "event_metadata": event_metadata,
-    }
-
-    log.info(
-        "cookiecutter_plugin received STUDENT_REGISTRATION_COMPLETED signal for {payload}".format(
-            payload=json.dumps(masked_dict(payload), cls=PluginJSONEncoder, indent=4)
-        )
-    )
+    dispatch_event(STUDENT_REGISTRATION_COMPLETED, kwargs.get("metadata"), user=user)
 
 
+@loop_aware
 def session_login_completed(user, **kwargs):
     """
     see apps.py plugin_app["signals_config"]["lms.djangoapp"]["receivers"]
@@ -134,20 +160,11 @@ def session_login_completed(user, **kwargs):
     if not _signals_enabled():
         return
 
-    user_info = asdict(user)
-    event_metadata = asdict(kwargs.get("metadata"))
-    payload = {
-        "user": user_info,
-        "event_metadata": event_metadata,
-    }
-
-    log.info(
-        "cookiecutter_plugin received SESSION_LOGIN_COMPLETED signal for {payload}".format(
-            payload=json.dumps(masked_dict(payload), cls=PluginJSONEncoder, indent=4)
-        )
-    )
+    record_login(user.id)
+    dispatch_event(SESSION_LOGIN_COMPLETED, kwargs.get("metadata"), user=user)
 
 
+@loop_aware
 def course_enrollment_created(enrollment, **kwargs):
     """
     see apps.py plugin_app["signals_config"]["lms.djangoapp"]["receivers"]
@@ -182,23 +199,11 @@ def course_enrollment_created(enrollment, **kwargs):
     if not _signals_enabled():
         return
 
-    enrollment_info = asdict(
-        enrollment,
-        value_serializer=serialize_course_key,
-    )
-    event_metadata = asdict(kwargs.get("metadata"))
-    payload = {
-        "enrollment": enrollment_info,
-        "event_metadata": event_metadata,
-    }
-
-    log.info(
-        "cookiecutter_plugin received COURSE_ENROLLMENT_CREATED signal for {payload}".format(
-            payload=json.dumps(masked_dict(payload), cls=PluginJSONEncoder, indent=4)
-        )
-    )
+    record_enrollment(enrollment, kwargs.get("metadata"))
+    dispatch_event(COURSE_ENROLLMENT_CREATED, kwargs.get("metadata"), enrollment=enrollment)
 
 
+@loop_aware
 def course_enrollment_changed(enrollment, **kwargs):
     """
     see apps.py plugin_app["signals_config"]["lms.djangoapp"]["receivers"]
@@ -212,23 +217,11 @@ def course_enrollment_changed(enrollment, **kwargs):
     if not _signals_enabled():
         return
 
-    enrollment_info = asdict(
-        enrollment,
-        value_serializer=serialize_course_key,
-    )
-    event_metadata = asdict(kwargs.get("metadata"))
-    payload = {
-        "enrollment": enrollment_info,
-        "event_metadata": event_metadata,
-    }
-
-    log.info(
-        "cookiecutter_plugin received COURSE_ENROLLMENT_CREATED signal for {payload}".format(
-            payload=json.dumps(masked_dict(payload), cls=PluginJSONEncoder, indent=4)
-        )
-    )
+    record_enrollment(enrollment, kwargs.get("metadata"))
+    dispatch_event(COURSE_ENROLLMENT_CHANGED, kwargs.get("metadata"), enrollment=enrollment)
 
 
+@loop_aware
 def course_unenrollment_completed(enrollment, **kwargs):
     """
     see apps.py plugin_app["signals_config"]["lms.djangoapp"]["receivers"]
@@ -242,23 +235,11 @@ def course_unenrollment_completed(enrollment, **kwargs):
     if not _signals_enabled():
         return
 
-    enrollment_info = asdict(
-        enrollment,
-        value_serializer=serialize_course_key,
-    )
-    event_metadata = asdict(kwargs.get("metadata"))
-    payload = {
-        "enrollment": enrollment_info,
-        "event_metadata": event_metadata,
-    }
-
-    log.info(
-        "cookiecutter_plugin received COURSE_UNENROLLMENT_COMPLETED signal for {payload}".format(
-            payload=json.dumps(masked_dict(payload), cls=PluginJSONEncoder, indent=4)
-        )
-    )
+    record_enrollment(enrollment, kwargs.get("metadata"), unenrolled=True)
+    dispatch_event(COURSE_UNENROLLMENT_COMPLETED, kwargs.get("metadata"), enrollment=enrollment)
 
 
+@loop_aware
 def certificate_created(certificate, **kwargs):
     """
     see apps.py plugin_app["signals_config"]["lms.djangoapp"]["receivers"]
@@ -272,23 +253,11 @@ def certificate_created(certificate, **kwargs):
     if not _signals_enabled():
         return
 
-    certificate_info = asdict(
-        certificate,
-        value_serializer=serialize_course_key,
-    )
-    event_metadata = asdict(kwargs.get("metadata"))
-    payload = {
-        "certificate": certificate_info,
-        "event_metadata": event_metadata,
-    }
-
-    log.info(
-        "cookiecutter_plugin received CERTIFICATE_CREATED signal for {payload}".format(
-            payload=json.dumps(masked_dict(payload), cls=PluginJSONEncoder, indent=4)
-        )
-    )
+    record_certificate(certificate, kwargs.get("metadata"))
+    dispatch_event(CERTIFICATE_CREATED, kwargs.get("metadata"), certificate=certificate)
 
 
+@loop_aware
 def certificate_changed(certificate, **kwargs):
     """
     see apps.py plugin_app["signals_config"]["lms.djangoapp"]["receivers"]
@@ -302,23 +271,11 @@ def certificate_changed(certificate, **kwargs):
     if not _signals_enabled():
         return
 
-    certificate_info = asdict(
-        certificate,
-        value_serializer=serialize_course_key,
-    )
-    event_metadata = asdict(kwargs.get("metadata"))
-    payload = {
-        "certificate": certificate_info,
-        "event_metadata": event_metadata,
-    }
-
-    log.info(
-        "cookiecutter_plugin received CERTIFICATE_CHANGED signal for {payload}".format(
-            payload=json.dumps(masked_dict(payload), cls=PluginJSONEncoder, indent=4)
-        )
-    )
+    record_certificate(certificate, kwargs.get("metadata"))
+    dispatch_event(CERTIFICATE_CHANGED, kwargs.get("metadata"), certificate=certificate)
 
 
+@loop_aware
 def certificate_revoked(certificate, **kwargs):
     """
     see apps.py plugin_app["signals_config"]["lms.djangoapp"]["receivers"]
@@ -332,23 +289,11 @@ def certificate_revoked(certificate, **kwargs):
     if not _signals_enabled():
         return
 
-    certificate_info = asdict(
-        certificate,
-        value_serializer=serialize_course_key,
-    )
-    event_metadata = asdict(kwargs.get("metadata"))
-    payload = {
-        "certificate": certificate_info,
-        "event_metadata": event_metadata,
-    }
-
-    log.info(
-        "cookiecutter_plugin received CERTIFICATE_REVOKED signal for {payload}".format(
-            payload=json.dumps(masked_dict(payload), cls=PluginJSONEncoder, indent=4)
-        )
-    )
+    record_certificate(certificate, kwargs.get("metadata"), revoked=True)
+    dispatch_event(CERTIFICATE_REVOKED, kwargs.get("metadata"), certificate=certificate)
 
 
+@loop_aware
 def persistent_grade_summary_changed(grade, **kwargs):
     """
     see apps.py plugin_app["signals_config"]["lms.djangoapp"]["receivers"]
@@ -379,22 +324,10 @@ def persistent_grade_summary_changed(grade, **kwargs):
     if not _signals_enabled():
         return
 
-    grade_info = asdict(
-        grade,
-        value_serializer=serialize_course_key,
-    )
-    event_metadata = asdict(kwargs.get("metadata"))
-    payload = {
-        "grade": grade_info,
-        "event_metadata": event_metadata,
-    }
-    log.info(
-        "cookiecutter_plugin received COURSE_ENROLLMENT_CREATED signal for {payload}".format(
-            payload=json.dumps(masked_dict(payload), cls=PluginJSONEncoder, indent=4)
-        )
-    )
+    dispatch_event(PERSISTENT_GRADE_SUMMARY_CHANGED, kwargs.get("metadata"), grade=grade)
 
 
+@loop_aware
 def cohort_membership_changed(cohort, **kwargs):
     """
     see apps.py plugin_app["signals_config"]["lms.djangoapp"]["receivers"]
@@ -408,24 +341,12 @@ def cohort_membership_changed(cohort, **kwargs):
     if not _signals_enabled():
         return
 
-    cohort_info = asdict(
-        cohort,
-        value_serializer=serialize_course_key,
-    )
-    event_metadata = asdict(kwargs.get("metadata"))
-    payload = {
-        "cohort": cohort_info,
-        "event_metadata": event_metadata,
-    }
+    record_cohort_membership(cohort)
+    dispatch_event(COHORT_MEMBERSHIP_CHANGED, kwargs.get("metadata"), cohort=cohort)
 
-    log.info(
-        "cookiecutter_plugin received COHORT_MEMBERSHIP_CHANGED signal for {payload}".format(
-            payload=json.dumps(masked_dict(payload), cls=PluginJSONEncoder, indent=4)
-        )
-    )
 
-
-def course_discussions_changed(configuration, **kwargs):  # lint-amnesty, pylint: disable=unused-argument
+@loop_aware
+def course_discussions_changed(configuration, **kwargs):
     """
     see apps.py plugin_app["signals_config"]["lms.djangoapp"]["receivers"]
     signal_path: openedx_events.learning.signals.COHORT_MEMBERSHIP_CHANGED
@@ -435,8 +356,11 @@ def course_discussions_changed(configuration, **kwargs):  # lint-amnesty, pylint
     event_description: emitted when the configuration for a course's discussions changes in the course
                        Warning: This event is currently incompatible with the event bus, list/dict cannot be serialized yet
     event_data: CourseDiscussionConfigurationData
+
+    plugin_configuration and contexts can be arbitrarily large. payloads.BoundedJSONWriter
+    summarizes them within settings.COOKIECUTTER_PLUGIN_SERIALIZATION["max_bytes"]
     """
     if not _signals_enabled():
         return
 
-    log.info("cookiecutter_plugin received COURSE_DISCUSSIONS_CHANGED signal")
+    dispatch_event(COURSE_DISCUSSIONS_CHANGED, kwargs.get("metadata"), configuration=configuration)
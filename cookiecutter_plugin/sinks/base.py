@@ -0,0 +1,376 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:
+    fan-out of openedx-events payloads to pluggable event sinks.
+
+    dispatch.handle_event() hands every event to event_sinks().emit(). Each
+    configured sink has its own bounded buffer and its own writer thread, so
+    a slow or failing sink only ever fills its own buffer: it cannot stall
+    the other sinks, nor the receiver. What happens when a buffer is full is
+    the sink's overflow policy:
+
+    drop_newest     the incoming event is dropped. the default.
+    drop_oldest     the oldest buffered event is dropped to make room.
+    block           the caller waits up to block_timeout seconds for room,
+                    then drops the incoming event.
+
+    settings.COOKIECUTTER_PLUGIN_EVENT_SINKS = {
+        "sinks": {
+            "local-file": {
+                "backend": "cookiecutter_plugin.sinks.file.FileSink",
+                "path": "/openedx/data/events.ndjson",
+                "batch_size": 500,
+                "flush_interval": 1.0,
+                "max_buffer": 10000,
+                "overflow": "drop_oldest",
+            },
+            "collector": {
+                "backend": "cookiecutter_plugin.sinks.http.HTTPCollectorSink",
+                "url": "https://collector.example.com/events",
+            },
+        },
+    }
+
+    per-sink metrics are published at /cookiecutter_plugin/event-sinks/
+"""
+# python stuff
+import atexit
+import collections
+import datetime
+import io
+import logging
+import os
+import threading
+import time
+import uuid
+
+# django stuff
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+# our stuff
+from ..payloads import BoundedJSONWriter, PayloadView
+
+log = logging.getLogger(__name__)
+
+DROP_NEWEST = "drop_newest"
+DROP_OLDEST = "drop_oldest"
+BLOCK = "block"
+OVERFLOW_POLICIES = (DROP_NEWEST, DROP_OLDEST, BLOCK)
+
+DEFAULTS = {
+    "sinks": {},
+}
+
+SINK_DEFAULTS = {
+    "batch_size": 500,
+    "flush_interval": 1.0,
+    "max_buffer": 10000,
+    "overflow": DROP_NEWEST,
+    "block_timeout": 0.05,
+}
+
+# number of recent batch write times kept for the latency percentiles.
+LATENCY_SAMPLES = 1000
+
+
+def event_sinks_settings() -> dict:
+    config = dict(DEFAULTS)
+    config.update(getattr(settings, "COOKIECUTTER_PLUGIN_EVENT_SINKS", None) or {})
+    return config
+
+
+def json_default(value):
+    """
+    json encoding of the values found in openedx-events payloads that the
+    json module does not handle itself.
+    """
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, bytes):
+        return str(value, encoding="utf-8")
+    return str(value)
+
+
+class EventRecord:
+    """
+    one event on its way to the sinks. The json line is rendered once, by
+    whichever sink's writer thread asks for it first, and shared by the rest.
+    """
+
+    __slots__ = ("signal_name", "metadata", "data", "created", "_line")
+
+    def __init__(self, signal_name, metadata, data):
+        self.signal_name = signal_name
+        self.metadata = metadata
+        self.data = data
+        self.created = time.monotonic()
+        self._line = None
+
+    @property
+    def line(self) -> str:
+        """
+        {"event_name": ..., "event_metadata": {...}, "<data name>": {...}} without a trailing newline.
+        """
+        if self._line is None:
+            buffer = io.StringIO()
+            view = PayloadView(dict(self.data, event_name=self.signal_name, event_metadata=self.metadata))
+            BoundedJSONWriter(buffer.write, default=json_default).dump(view)
+            self._line = buffer.getvalue()
+        return self._line
+
+    @property
+    def event_time(self):
+        return getattr(self.metadata, "time", None)
+
+
+class EventSink:
+    """
+    base class of the event sinks. Subclasses implement write_batch(records),
+    which is always called from the sink's own writer thread, and may
+    implement close().
+    """
+
+    def __init__(
+        self,
+        name,
+        batch_size=SINK_DEFAULTS["batch_size"],
+        flush_interval=SINK_DEFAULTS["flush_interval"],
+        max_buffer=SINK_DEFAULTS["max_buffer"],
+        overflow=SINK_DEFAULTS["overflow"],
+        block_timeout=SINK_DEFAULTS["block_timeout"],
+    ):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(
+                "event sink {name}: overflow must be one of {policies}".format(name=name, policies=OVERFLOW_POLICIES)
+            )
+        self.name = name
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+
+        self._buffer = collections.deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        # writes are serialized so that batches land in the order they were taken from the buffer.
+        self._write_lock = threading.Lock()
+        self._thread = None
+        self._pid = None
+        self._closed = False
+
+        self.started = time.monotonic()
+        self.emitted = 0
+        self.written = 0
+        self.dropped = 0
+        self.failures = 0
+        self.batches = 0
+        self.max_lag = 0.0
+        self._write_times = collections.deque(maxlen=LATENCY_SAMPLES)
+
+    # -------------------------------------------------------------------------
+    # to be implemented by subclasses
+    # -------------------------------------------------------------------------
+    def write_batch(self, records):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    # -------------------------------------------------------------------------
+    # buffer
+    # -------------------------------------------------------------------------
+    def _ensure_thread(self):
+        # threads do not survive fork(); restart the writer in each worker process.
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name="cookiecutter-plugin-sink-" + self.name, daemon=True)
+            self._thread.start()
+
+    def emit(self, record):
+        """
+        buffer a record for writing. Never blocks longer than block_timeout.
+        """
+        self._ensure_thread()
+        with self._lock:
+            self.emitted += 1
+            if len(self._buffer) >= self.max_buffer:
+                if self.overflow == DROP_OLDEST:
+                    self._buffer.popleft()
+                    self.dropped += 1
+                elif self.overflow == BLOCK:
+                    self._not_full.wait_for(lambda: len(self._buffer) < self.max_buffer, self.block_timeout)
+                if len(self._buffer) >= self.max_buffer:
+                    self.dropped += 1
+                    return
+            self._buffer.append(record)
+            if len(self._buffer) >= self.batch_size:
+                self._not_empty.notify()
+
+    def _take(self) -> list:
+        batch = []
+        while self._buffer and len(batch) < self.batch_size:
+            batch.append(self._buffer.popleft())
+        if batch:
+            self._not_full.notify_all()
+        return batch
+
+    def _run(self):
+        while not self._closed:
+            with self._lock:
+                if len(self._buffer) < self.batch_size:
+                    self._not_empty.wait(self.flush_interval)
+                batch = self._take()
+            if batch:
+                self._write(batch)
+
+    def _write(self, batch):
+        with self._write_lock:
+            start = time.monotonic()
+            try:
+                self.write_batch(batch)
+            except Exception as e:  # noqa: B902
+                self.batch_failed(batch, e)
+                return
+            self.batch_written(batch, start)
+
+    def batch_written(self, batch, start):
+        """
+        record the successful write of batch, begun at time.monotonic() == start.
+        """
+        finished = time.monotonic()
+        with self._lock:
+            self._write_times.append(finished - start)
+            self.max_lag = max(self.max_lag, finished - batch[0].created)
+            self.written += len(batch)
+            self.batches += 1
+
+    def batch_failed(self, batch, e):
+        """
+        record that batch was given up on.
+        """
+        with self._lock:
+            self.failures += 1
+            self.dropped += len(batch)
+        log.error(
+            "cookiecutter_plugin event sink {name} failed to write {n} events: {e}".format(
+                name=self.name, n=len(batch), e=e
+            )
+        )
+
+    def flush(self):
+        """
+        write everything that is buffered, from the calling thread.
+        """
+        while True:
+            with self._lock:
+                batch = self._take()
+            if not batch:
+                return
+            self._write(batch)
+
+    def shutdown(self):
+        self._closed = True
+        with self._lock:
+            self._not_empty.notify_all()
+        if self._pid == os.getpid():
+            self.flush()
+            self.close()
+
+    # -------------------------------------------------------------------------
+    # metrics
+    # -------------------------------------------------------------------------
+    def stats(self) -> dict:
+        with self._lock:
+            buffered = len(self._buffer)
+            write_times = sorted(self._write_times)
+        ms = 1000.0
+
+        def _percentile(pct):
+            if not write_times:
+                return None
+            return round(write_times[min(len(write_times) - 1, int(pct / 100.0 * len(write_times)))] * ms, 3)
+
+        uptime = time.monotonic() - self.started
+        return {
+            "backend": "{module}.{name}".format(module=type(self).__module__, name=type(self).__name__),
+            "overflow": self.overflow,
+            "buffered": buffered,
+            "max_buffer": self.max_buffer,
+            "emitted": self.emitted,
+            "written": self.written,
+            "dropped": self.dropped,
+            "failures": self.failures,
+            "batches": self.batches,
+            "written_per_second": round(self.written / uptime, 1) if uptime else None,
+            "batch_write_p50_ms": _percentile(50),
+            "batch_write_p99_ms": _percentile(99),
+            "max_lag_ms": round(self.max_lag * ms, 3),
+        }
+
+
+class EventSinks:
+    """
+    the configured sinks of this process.
+    """
+
+    def __init__(self, sinks=None):
+        self.sinks = list(sinks or [])
+
+    @classmethod
+    def from_settings(cls, config=None):
+        config = config or event_sinks_settings()
+        sinks = []
+        for name, options in (config.get("sinks") or {}).items():
+            options = dict(options)
+            try:
+                backend = import_string(options.pop("backend"))
+                sinks.append(backend(name, **options))
+            except Exception as e:  # noqa: B902
+                log.error("cookiecutter_plugin could not configure event sink {name}: {e}".format(name=name, e=e))
+        return cls(sinks)
+
+    def emit(self, signal_name, metadata, data):
+        if not self.sinks:
+            return
+        record = EventRecord(signal_name, metadata, data)
+        for sink in self.sinks:
+            sink.emit(record)
+
+    def shutdown(self):
+        for sink in self.sinks:
+            try:
+                sink.shutdown()
+            except Exception as e:  # noqa: B902
+                log.error("cookiecutter_plugin event sink {name} shutdown failed: {e}".format(name=sink.name, e=e))
+
+    def stats(self) -> dict:
+        return {sink.name: sink.stats() for sink in self.sinks}
+
+
+_sinks = None
+_sinks_lock = threading.Lock()
+
+
+def event_sinks() -> EventSinks:
+    global _sinks
+
+    if _sinks is None:
+        with _sinks_lock:
+            if _sinks is None:
+                _sinks = EventSinks.from_settings()
+                atexit.register(_sinks.shutdown)
+    return _sinks
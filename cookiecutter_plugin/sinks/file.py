@@ -0,0 +1,47 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:          append events to a local NDJSON file, one line per event and
+                one write() per batch.
+
+                "backend": "cookiecutter_plugin.sinks.file.FileSink", "path": "/openedx/data/events.ndjson"
+"""
+# python stuff
+import os
+
+# our stuff
+from .base import EventSink
+
+
+class FileSink(EventSink):
+    def __init__(self, name, path, fsync=False, **kwargs):
+        super().__init__(name, **kwargs)
+        self.path = path
+        self.fsync = fsync
+        self._file = None
+        self._file_pid = None
+
+    def _open(self):
+        if self._file is None or self._file_pid != os.getpid():
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+            self._file_pid = os.getpid()
+        return self._file
+
+    def write_batch(self, records):
+        f = self._open()
+        f.write("".join(record.line + "\n" for record in records))
+        f.flush()
+        if self.fsync:
+            os.fsync(f.fileno())
+
+    def close(self):
+        if self._file is not None and self._file_pid == os.getpid():
+            self._file.close()
+        self._file = None
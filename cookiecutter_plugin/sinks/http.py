@@ -0,0 +1,49 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:          POST each batch of events to an http collector as NDJSON,
+                over a keep-alive requests.Session.
+
+                "backend": "cookiecutter_plugin.sinks.http.HTTPCollectorSink", "url": "https://collector.example.com/events"
+"""
+# python stuff
+import os
+
+import requests
+
+# our stuff
+from .base import EventSink
+
+NDJSON = "application/x-ndjson"
+
+
+class HTTPCollectorSink(EventSink):
+    def __init__(self, name, url, timeout=(3.05, 10), headers=None, **kwargs):
+        super().__init__(name, **kwargs)
+        self.url = url
+        # tuples do not survive the trip through yml / json settings.
+        self.timeout = tuple(timeout) if isinstance(timeout, list) else timeout
+        self.headers = dict(headers or {})
+        self.headers.setdefault("Content-Type", NDJSON)
+        self._session = None
+        self._session_pid = None
+
+    def _get_session(self):
+        if self._session is None or self._session_pid != os.getpid():
+            self._session = requests.Session()
+            self._session_pid = os.getpid()
+        return self._session
+
+    def write_batch(self, records):
+        body = "".join(record.line + "\n" for record in records).encode("utf-8")
+        response = self._get_session().post(self.url, data=body, headers=self.headers, timeout=self.timeout)
+        response.raise_for_status()
+
+    def close(self):
+        if self._session is not None and self._session_pid == os.getpid():
+            self._session.close()
+        self._session = None
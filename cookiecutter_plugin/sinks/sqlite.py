@@ -0,0 +1,74 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:          store events in a local SQLite database, one transaction per
+                batch.
+
+                "backend": "cookiecutter_plugin.sinks.sqlite.SQLiteSink", "path": "/openedx/data/events.sqlite3"
+"""
+# python stuff
+import os
+import sqlite3
+import time
+
+# our stuff
+from .base import EventSink
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    event_name TEXT NOT NULL,
+    event_time TEXT,
+    received REAL NOT NULL,
+    payload TEXT NOT NULL
+)
+"""
+INSERT = "INSERT INTO events (event_name, event_time, received, payload) VALUES (?, ?, ?, ?)"
+
+
+class SQLiteSink(EventSink):
+    def __init__(self, name, path, **kwargs):
+        super().__init__(name, **kwargs)
+        self.path = path
+        self._connection = None
+        self._connection_pid = None
+
+    def _connect(self):
+        # connections may not be shared across processes, and every write happens on the writer thread.
+        if self._connection is None or self._connection_pid != os.getpid():
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(SCHEMA)
+            self._connection = connection
+            self._connection_pid = os.getpid()
+        return self._connection
+
+    def write_batch(self, records):
+        received = time.time()
+        rows = []
+        for record in records:
+            event_time = record.event_time
+            rows.append(
+                (
+                    record.signal_name,
+                    event_time.isoformat() if event_time is not None else None,
+                    received,
+                    record.line,
+                )
+            )
+        connection = self._connect()
+        with connection:
+            connection.executemany(INSERT, rows)
+
+    def close(self):
+        if self._connection is not None and self._connection_pid == os.getpid():
+            self._connection.close()
+        self._connection = None
@@ -0,0 +1,425 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:
+    forward events to an http collector in gzip-compressed NDJSON batches.
+
+    Batches of up to batch_size events, or whatever has accumulated after
+    linger seconds, are compressed on the sink's writer thread and POSTed
+    by a small pool of delivery threads over pooled keep-alive connections.
+    At most max_in_flight batches are outstanding at a time; beyond that
+    the sink's buffer absorbs the backlog, and then its overflow policy
+    applies (see base.py).
+
+    Failed deliveries (connection errors, timeouts, 429 and 5xx) are retried
+    up to max_retries times with full-jitter exponential backoff. A batch
+    that still cannot be delivered is written to spill_directory, and is
+    re-sent from there once the collector is accepting batches again. A
+    process claims each spilled file, by renaming it, before it re-sends it,
+    so that no two worker processes send the same file.
+
+    At shutdown, deliveries stop retrying, and are given drain_timeout
+    seconds to finish. Those that have not are spilled.
+
+    settings.COOKIECUTTER_PLUGIN_EVENT_SINKS = {
+        "sinks": {
+            "collector": {
+                "backend": "cookiecutter_plugin.sinks.webhook.WebhookForwarder",
+                "url": "https://collector.example.com/events",
+                "batch_size": 1000,
+                "linger": 0.5,
+                "max_in_flight": 4,
+                "spill_directory": "/openedx/data/cookiecutter_plugin/spill",
+            },
+        },
+    }
+"""
+# python stuff
+import gzip
+import itertools
+import logging
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# our stuff
+from .base import EventSink
+from .http import NDJSON
+
+log = logging.getLogger(__name__)
+
+RETRYABLE_STATUS = (429, 500, 502, 503, 504)
+# suffix of a spilled file that a process is replaying: <spilled name>.<pid>.claimed
+CLAIMED = ".claimed"
+
+
+def _process_exists(pid) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class DeliveryError(Exception):
+    def __init__(self, message, retryable=True):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+class WebhookForwarder(EventSink):
+    def __init__(
+        self,
+        name,
+        url,
+        linger=None,
+        max_in_flight=4,
+        compresslevel=6,
+        timeout=(3.05, 10),
+        headers=None,
+        max_retries=5,
+        backoff_base=0.5,
+        backoff_max=30.0,
+        spill_directory=None,
+        max_spill_bytes=512 * 1024 * 1024,
+        replay_interval=30.0,
+        drain_timeout=10.0,
+        **kwargs,
+    ):
+        if linger is not None:
+            kwargs["flush_interval"] = linger
+        super().__init__(name, **kwargs)
+        self.url = url
+        self.max_in_flight = max_in_flight
+        self.compresslevel = compresslevel
+        # tuples do not survive the trip through yml / json settings.
+        self.timeout = tuple(timeout) if isinstance(timeout, list) else timeout
+        self.headers = dict(headers or {})
+        self.headers.setdefault("Content-Type", NDJSON)
+        if compresslevel:
+            self.headers["Content-Encoding"] = "gzip"
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.spill_directory = spill_directory
+        self.max_spill_bytes = max_spill_bytes
+        self.replay_interval = replay_interval
+        self.drain_timeout = drain_timeout
+
+        self._slots = None
+        self._executor = None
+        self._session = None
+        self._resources_pid = None
+        self._resources_lock = threading.Lock()
+        self._spill_sequence = itertools.count()
+        self._replay_lock = threading.Lock()
+        self._last_replay = 0.0
+        # set by close(): deliveries stop backing off and retrying.
+        self._closing = threading.Event()
+        self._idle = threading.Condition(self._lock)
+        # {token: (batch, body)} of the deliveries in progress, and {token: spill path} of those close() gave up on.
+        self._deliveries = {}
+        self._abandoned = {}
+        self._delivery_sequence = itertools.count()
+
+        self.bytes_raw = 0
+        self.bytes_encoded = 0
+        # every request body put on the wire, retries and replays included.
+        self.bytes_sent = 0
+        self.requests = 0
+        self.retries = 0
+        self.spilled = 0
+        self.replayed = 0
+        self.in_flight = 0
+
+    # -------------------------------------------------------------------------
+    # connections and delivery threads, created per process
+    # -------------------------------------------------------------------------
+    def _resources(self):
+        if self._resources_pid == os.getpid():
+            return self._session, self._executor
+        with self._resources_lock:
+            if self._resources_pid != os.getpid():
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_in_flight, pool_block=True)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._session = session
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_in_flight, thread_name_prefix="cookiecutter-plugin-webhook-" + self.name
+                )
+                self._slots = threading.BoundedSemaphore(self.max_in_flight)
+                self._resources_pid = os.getpid()
+        return self._session, self._executor
+
+    def encode(self, records) -> bytes:
+        raw = "".join(record.line + "\n" for record in records).encode("utf-8")
+        # mtime=0: identical batches compress to identical bytes.
+        body = gzip.compress(raw, compresslevel=self.compresslevel, mtime=0) if self.compresslevel else raw
+        with self._lock:
+            self.bytes_raw += len(raw)
+            self.bytes_encoded += len(body)
+        return body
+
+    def _write(self, batch):
+        """
+        called on the writer thread. Waits for an in-flight slot, then hands
+        the batch to a delivery thread.
+        """
+        session, executor = self._resources()
+        body = self.encode(batch)
+        self._slots.acquire()
+        with self._lock:
+            self.in_flight += 1
+        try:
+            executor.submit(self._deliver, session, batch, body, time.monotonic())
+        except RuntimeError as e:
+            # the executor has been shut down.
+            self._release()
+            self.batch_failed(batch, e)
+
+    def _release(self):
+        with self._lock:
+            self.in_flight -= 1
+            if not self.in_flight:
+                self._idle.notify_all()
+        self._slots.release()
+
+    def _post(self, session, body):
+        try:
+            response = session.post(self.url, data=body, headers=self.headers, timeout=self.timeout)
+        except requests.RequestException as e:
+            raise DeliveryError(str(e))
+        finally:
+            with self._lock:
+                self.requests += 1
+                self.bytes_sent += len(body)
+        if response.status_code >= 400:
+            raise DeliveryError(
+                "{url} responded {status}".format(url=self.url, status=response.status_code),
+                retryable=response.status_code in RETRYABLE_STATUS,
+            )
+
+    def backoff(self, attempt) -> float:
+        """
+        full jitter: uniform between 0 and the exponential backoff of this attempt.
+        """
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+    def _finish(self, token):
+        """
+        (abandoned, spill path): whether close() gave up on the delivery and spilled it, and where.
+        """
+        with self._lock:
+            if self._deliveries.pop(token, None) is not None:
+                return False, None
+            return True, self._abandoned.pop(token, None)
+
+    def _deliver(self, session, batch, body, start):
+        token = next(self._delivery_sequence)
+        with self._lock:
+            self._deliveries[token] = (batch, body)
+        try:
+            for attempt in range(self.max_retries + 1):
+                try:
+                    self._post(session, body)
+                except DeliveryError as e:
+                    if not e.retryable or attempt == self.max_retries or self._closing.is_set():
+                        abandoned, _path = self._finish(token)
+                        if not abandoned:
+                            self._spill(batch, body, e)
+                        return
+                    with self._lock:
+                        self.retries += 1
+                    # cut short by close().
+                    self._closing.wait(self.backoff(attempt))
+                    continue
+                abandoned, path = self._finish(token)
+                if abandoned:
+                    # delivered after all: the spilled copy would be sent twice.
+                    self._remove(path)
+                    return
+                self.batch_written(batch, start)
+                self._maybe_replay(session)
+                return
+        finally:
+            self._release()
+
+    # -------------------------------------------------------------------------
+    # spill directory
+    # -------------------------------------------------------------------------
+    def _spill_files(self) -> list:
+        try:
+            return sorted(name for name in os.listdir(self.spill_directory) if name.endswith((".ndjson", ".ndjson.gz")))
+        except FileNotFoundError:
+            return []
+
+    def _spill_size(self) -> int:
+        total = 0
+        for name in self._spill_files() + self._claimed_files():
+            try:
+                total += os.path.getsize(os.path.join(self.spill_directory, name))
+            except FileNotFoundError:
+                pass
+        return total
+
+    def _claimed_files(self) -> list:
+        try:
+            return sorted(name for name in os.listdir(self.spill_directory) if name.endswith(CLAIMED))
+        except FileNotFoundError:
+            return []
+
+    def _remove(self, path):
+        if path is None:
+            return
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def _spill(self, batch, body, error):
+        """
+        write body to spill_directory. returns its path, or None if it was dropped instead.
+        """
+        if not self.spill_directory or self._spill_size() + len(body) > self.max_spill_bytes:
+            self.batch_failed(batch, error)
+            return None
+        # <time_ns>-<pid>-<sequence>-<event count>: sorts oldest first, and unique across processes.
+        name = "{time_ns:020d}-{pid}-{sequence}-{count}.ndjson{gz}".format(
+            time_ns=time.time_ns(),
+            pid=os.getpid(),
+            sequence=next(self._spill_sequence),
+            count=len(batch),
+            gz=".gz" if self.compresslevel else "",
+        )
+        try:
+            os.makedirs(self.spill_directory, exist_ok=True)
+            path = os.path.join(self.spill_directory, name)
+            with open(path + ".tmp", "wb") as f:
+                f.write(body)
+            os.replace(path + ".tmp", path)
+        except OSError as e:
+            self.batch_failed(batch, e)
+            return None
+        with self._lock:
+            self.spilled += len(batch)
+        log.warning(
+            "cookiecutter_plugin event sink {name} spilled {n} events to {path}: {error}".format(
+                name=self.name, n=len(batch), path=path, error=error
+            )
+        )
+        return path
+
+    def _claim(self, name):
+        """
+        rename a spilled file to a name of this process' own. returns the new path, or None if
+        another process claimed it first.
+        """
+        path = os.path.join(self.spill_directory, name)
+        claimed = "{path}.{pid}{suffix}".format(path=path, pid=os.getpid(), suffix=CLAIMED)
+        try:
+            os.rename(path, claimed)
+        except FileNotFoundError:
+            return None
+        return claimed
+
+    def _release_claims(self):
+        """
+        return the files claimed by processes that no longer exist, ie killed mid-replay, to the spill directory.
+        """
+        for name in self._claimed_files():
+            original, pid = name[: -len(CLAIMED)].rsplit(".", 1)
+            if _process_exists(int(pid)):
+                continue
+            try:
+                os.rename(os.path.join(self.spill_directory, name), os.path.join(self.spill_directory, original))
+            except FileNotFoundError:
+                pass
+
+    def _maybe_replay(self, session):
+        """
+        after a successful delivery, re-send spilled batches, oldest first,
+        at most once every replay_interval seconds.
+        """
+        if (
+            not self.spill_directory
+            or self._closing.is_set()
+            or time.monotonic() - self._last_replay < self.replay_interval
+        ):
+            return
+        if not self._replay_lock.acquire(blocking=False):
+            return
+        try:
+            self._last_replay = time.monotonic()
+            self._release_claims()
+            for name in self._spill_files():
+                if name.endswith(".gz") != bool(self.compresslevel):
+                    # written with different compression settings. leave it for an operator.
+                    continue
+                path = self._claim(name)
+                if path is None:
+                    # another process is replaying it.
+                    continue
+                try:
+                    with open(path, "rb") as f:
+                        body = f.read()
+                    self._post(session, body)
+                except (OSError, DeliveryError):
+                    # give it back, for a later replay by any process.
+                    os.rename(path, os.path.join(self.spill_directory, name))
+                    return
+                self._remove(path)
+                count = int(name.split(".")[0].rsplit("-", 1)[-1])
+                with self._lock:
+                    self.replayed += count
+                    self.written += count
+        finally:
+            self._replay_lock.release()
+
+    # -------------------------------------------------------------------------
+    # shutdown and metrics
+    # -------------------------------------------------------------------------
+    def close(self):
+        if self._resources_pid != os.getpid():
+            return
+        # in-flight deliveries stop retrying, and get drain_timeout seconds to finish.
+        self._closing.set()
+        with self._lock:
+            self._idle.wait_for(lambda: not self.in_flight, self.drain_timeout)
+            abandoned, self._deliveries = self._deliveries, {}
+        for token, (batch, body) in abandoned.items():
+            path = self._spill(
+                batch, body, "not delivered within drain_timeout {timeout}s".format(timeout=self.drain_timeout)
+            )
+            with self._lock:
+                self._abandoned[token] = path
+        self._executor.shutdown(wait=False)
+        self._session.close()
+
+    def stats(self) -> dict:
+        stats = super().stats()
+        with self._lock:
+            stats.update(
+                {
+                    "in_flight": self.in_flight,
+                    "requests": self.requests,
+                    "retries": self.retries,
+                    "spilled": self.spilled,
+                    "replayed": self.replayed,
+                    "bytes_raw": self.bytes_raw,
+                    "bytes_sent": self.bytes_sent,
+                    "compression_ratio": round(self.bytes_raw / self.bytes_encoded, 2) if self.bytes_encoded else None,
+                }
+            )
+        return stats
@@ -1,5 +1,35 @@
 # coding=utf-8
+from django.conf import settings
 from django.conf.urls import url
 
+from . import views
+
 app_name = "cookiecutter_plugin"
-urlpatterns = []
+urlpatterns = [
+    url(r"^circuit-breakers/?$", views.circuit_breakers, name="circuit_breakers"),
+    url(r"^log-queue/?$", views.log_queue_stats, name="log_queue"),
+    url(r"^event-workers/?$", views.event_workers, name="event_workers"),
+    url(r"^event-sinks/?$", views.event_sinks, name="event_sinks"),
+    url(r"^event-counters/?$", views.event_counters, name="event_counters"),
+    url(r"^async-receivers/?$", views.async_receivers, name="async_receivers"),
+    url(r"^cohort-index/?$", views.cohort_index_stats, name="cohort_index"),
+    url(r"^heavy-hitters/?$", views.heavy_hitters, name="heavy_hitters"),
+    url(r"^profiles/?$", views.profiles, name="profiles"),
+    url(r"^profiles/(?P<name>[\w\-.]+\.prof)/?$", views.profile_download, name="profile_download"),
+    url(r"^active-users/?$", views.active_users, name="active_users"),
+    url(
+        r"^api/v1/rosters/{course_id}/?$".format(course_id=settings.COURSE_ID_PATTERN),
+        views.course_roster,
+        name="course_roster",
+    ),
+    url(
+        r"^api/v1/certificates/{course_id}/?$".format(course_id=settings.COURSE_ID_PATTERN),
+        views.course_certificates,
+        name="course_certificates",
+    ),
+    url(
+        r"^api/v1/cohorts/{course_id}/(?P<user_id>\d+)/?$".format(course_id=settings.COURSE_ID_PATTERN),
+        views.user_cohort,
+        name="user_cohort",
+    ),
+]
@@ -8,9 +8,8 @@ date:           feb-2022
 usage:          utility and convenience functions for cookiecutter_plugin
 """
 import json
-from dateutil.parser import parse, ParserError
-from unittest.mock import MagicMock
-from collections.abc import MutableMapping
+import sys
+from collections.abc import Mapping, MutableMapping, Sequence
 
 from opaque_keys.edx.locator import CourseLocator
 
@@ -59,6 +58,8 @@ def objects_key_by(iter, key):
 
 
 def parse_date_string(date_string, raise_exception=False):
+    from dateutil.parser import parse, ParserError
+
     try:
         return parse(date_string)
     except (TypeError, ParserError):
@@ -88,9 +89,17 @@ def masked_dict(obj) -> dict:
 
 class PluginJSONEncoder(json.JSONEncoder):
     def default(self, obj):
+        if isinstance(obj, Mapping):
+            # ie payloads.PayloadView. one level at a time; nested views are encoded as they are reached.
+            return dict(obj)
         if isinstance(obj, bytes):
             return str(obj, encoding="utf-8")
-        if isinstance(obj, MagicMock):
+        if isinstance(obj, Sequence) and not isinstance(obj, str):
+            # ie payloads.PayloadListView
+            return list(obj)
+        # unittest.mock imports asyncio. a MagicMock can only exist once some test has imported it.
+        mock = sys.modules.get("unittest.mock")
+        if mock is not None and isinstance(obj, mock.MagicMock):
             return ""
         try:
             return json.JSONEncoder.default(self, obj)
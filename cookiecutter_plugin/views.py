@@ -0,0 +1,221 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:          operational views published under the plugin's url namespace.
+                see urls.py
+"""
+# python stuff
+from functools import wraps
+
+# django stuff
+from django.http import FileResponse, Http404, HttpResponseBadRequest, HttpResponseForbidden, JsonResponse
+from django.views.decorators.http import require_GET
+
+# open edx stuff
+from opaque_keys import InvalidKeyError
+from opaque_keys.edx.keys import CourseKey
+
+# our stuff
+from . import log_queue
+from .active_users import estimator
+from .async_receivers import async_receivers as configured_async_receivers
+from .certificates import DOWNLOADABLE, list_certificates
+from .cohorts import cohort_index, get_user_cohort
+from .heavy_hitters import heavy_hitters as configured_heavy_hitters
+from .profiling import profile_ring
+from .rosters import get_roster
+from .shared_counters import counter_table
+from .sinks.base import event_sinks as configured_event_sinks
+from .workers import pool_stats
+from .badges.circuit_breaker import breakers
+
+
+def _course_key_or_404(course_id):
+    try:
+        return CourseKey.from_string(course_id)
+    except InvalidKeyError:
+        raise Http404()
+
+
+def staff_only(view_func):
+    """
+    restrict a view to authenticated staff users.
+    """
+
+    @wraps(view_func)
+    def _wrapped_view(request, *args, **kwargs):
+        user = getattr(request, "user", None)
+        if user is None or not user.is_authenticated or not user.is_staff:
+            return HttpResponseForbidden()
+        return view_func(request, *args, **kwargs)
+
+    return _wrapped_view
+
+
+@require_GET
+@staff_only
+def circuit_breakers(request):
+    """
+    current state of the circuit breakers protecting outbound badge calls.
+    """
+    return JsonResponse({"circuit_breakers": breakers.snapshot()})
+
+
+@require_GET
+@staff_only
+def log_queue_stats(request):
+    """
+    depth and drop counts of the queue logging pipeline.
+    """
+    return JsonResponse({"log_queue": log_queue.stats()})
+
+
+@require_GET
+@staff_only
+def event_workers(request):
+    """
+    per-shard queue depth and counters of the event worker pool of this process.
+    """
+    return JsonResponse({"event_workers": pool_stats()})
+
+
+@require_GET
+@staff_only
+def event_sinks(request):
+    """
+    throughput, latency and drop counts of each configured event sink of this process.
+    """
+    return JsonResponse({"event_sinks": configured_event_sinks().stats()})
+
+
+@require_GET
+@staff_only
+def event_counters(request):
+    """
+    event counts of every worker process on this host, summed from the shared counter table.
+    successive reads give exact event rates.
+    """
+    table = counter_table()
+    if table is None:
+        return JsonResponse({"event_counters": {"enabled": False}})
+    return JsonResponse({"event_counters": table.snapshot()})
+
+
+@require_GET
+@staff_only
+def async_receivers(request):
+    """
+    receiver tasks scheduled, pending, completed and dropped by this process' event loops.
+    """
+    return JsonResponse({"async_receivers": configured_async_receivers().stats()})
+
+
+@require_GET
+@staff_only
+def heavy_hitters(request):
+    """
+    the courses, users and event types with the most events in this process' recent windows.
+    ?window=<seconds>: a single window instead of the configured ones.
+    ?k=10
+    """
+    try:
+        windows = [int(request.GET["window"])] if "window" in request.GET else None
+        k = int(request.GET["k"]) if "k" in request.GET else None
+    except ValueError:
+        return HttpResponseBadRequest("window and k must be integers")
+    return JsonResponse({"heavy_hitters": configured_heavy_hitters().stats(windows=windows, k=k)})
+
+
+@require_GET
+@staff_only
+def cohort_index_stats(request):
+    """
+    size and hit rates of this process' cohort membership LRU.
+    """
+    return JsonResponse({"cohort_index": cohort_index().stats()})
+
+
+@require_GET
+@staff_only
+def profiles(request):
+    """
+    profiles captured by profiling.SamplingProfilerMiddleware, newest first.
+    """
+    return JsonResponse({"profiles": profile_ring().list()})
+
+
+@require_GET
+@staff_only
+def profile_download(request, name):
+    """
+    download a single pstats file. open it with python -m pstats <name> or snakeviz.
+    """
+    path = profile_ring().path_for(name)
+    if path is None:
+        raise Http404()
+    return FileResponse(open(path, "rb"), as_attachment=True, filename=name)
+
+
+@require_GET
+@staff_only
+def active_users(request):
+    """
+    HyperLogLog estimates of unique users logging in per minute, hour and day.
+    """
+    return JsonResponse({"active_users": estimator().estimates()})
+
+
+@require_GET
+@staff_only
+def course_roster(request, course_id):
+    """
+    active enrollment counts of a course, per mode, from the roster index.
+    add ?include_users=true for the active user ids of each mode.
+    """
+    include_users = request.GET.get("include_users", "").lower() in ("1", "true", "yes")
+    roster = get_roster(_course_key_or_404(course_id), include_users=include_users)
+    if roster is None:
+        raise Http404()
+    return JsonResponse(roster)
+
+
+@require_GET
+@staff_only
+def course_certificates(request, course_id):
+    """
+    certificate statuses of a course from the materialized certificate status table.
+    ?status=downloadable (default) | <any status> | all
+    ?after=<user_id>: the next_after value of the previous page
+    ?limit=100
+    """
+    course_key = _course_key_or_404(course_id)
+    status = request.GET.get("status", DOWNLOADABLE)
+    try:
+        after = int(request.GET.get("after", 0))
+        limit = int(request.GET.get("limit", 100))
+    except ValueError:
+        return HttpResponseBadRequest("after and limit must be integers")
+    return JsonResponse(
+        list_certificates(course_key, status=None if status == "all" else status, after=after, limit=limit)
+    )
+
+
+@require_GET
+@staff_only
+def user_cohort(request, course_id, user_id):
+    """
+    the cohort of a user in a course, from the cohort membership index.
+    cohort is null for a user who is in none of the course's cohorts.
+    """
+    course_key = _course_key_or_404(course_id)
+    return JsonResponse(
+        {
+            "course_key": str(course_key),
+            "user_id": int(user_id),
+            "cohort": get_user_cohort(course_key, int(user_id)),
+        }
+    )
@@ -0,0 +1,268 @@
+# coding=utf-8
+"""
+written by:     Lawrence McDaniel
+                https://lawrencemcdaniel.com
+
+date:           oct-2026
+
+usage:
+    ordered, sharded multi-process event worker pool. Used by dispatch.py
+    when settings.COOKIECUTTER_PLUGIN_EVENT_EXECUTION["mode"] == "process_pool"
+
+    Receivers pickle each event to bytes and put it on the queue of the
+    shard that owns its user id (user_id % processes). Each shard is drained
+    by exactly one worker process, so the events of a given user are
+    processed in the order in which they were received, while the pool as a
+    whole spreads event processing across cores and outside of the LMS
+    worker's GIL.
+
+    The pool starts lazily, from the first submit(), ie on a request thread
+    of a multithreaded LMS worker. Its processes are therefore spawned, not
+    forked: a fresh interpreter that runs django.setup() for itself, so that
+    none of the parent's locks held by other threads, or its open database
+    connections, are carried over.
+
+    - supervision: a daemon thread restarts dead worker processes. A worker
+      that dies may take the contents of its queue with it; those events are
+      counted as lost.
+    - shutdown: at exit each worker is sent a sentinel and given
+      drain_timeout seconds to finish its queue.
+    - metrics: per-shard enqueued, processed, dropped, lost and queue depth,
+      published at /cookiecutter_plugin/event-workers/
+"""
+# python stuff
+import atexit
+import logging
+import multiprocessing
+import os
+import pickle
+import queue
+import signal
+import threading
+import time
+
+# our stuff
+from .dispatch import execution_settings, handle_event
+
+log = logging.getLogger(__name__)
+
+SENTINEL = b""
+
+
+def _worker_main(shard, event_queue, processed):
+    """
+    entry point of a worker process.
+    """
+    import django
+
+    # a spawned interpreter: DJANGO_SETTINGS_MODULE is inherited from the parent's environment.
+    django.setup()
+    # the parent process decides when workers stop.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    while True:
+        message = event_queue.get()
+        if message == SENTINEL:
+            return
+        try:
+            signal_name, metadata, data = pickle.loads(message)
+            handle_event(signal_name, metadata, data)
+        except Exception as e:  # noqa: B902
+            log.error("cookiecutter_plugin event worker {shard} failed on an event: {e}".format(shard=shard, e=e))
+        finally:
+            processed.value += 1
+
+
+class Shard:
+    def __init__(self, index, context, queue_size):
+        self.index = index
+        self.context = context
+        self.queue_size = queue_size
+        # written only by the worker process; read by the parent for metrics.
+        self.processed = context.RawValue("Q", 0)
+        self.enqueued = 0
+        self.dropped = 0
+        self.lost = 0
+        self.restarts = 0
+        self.process = None
+        self.queue = None
+
+    def spawn(self):
+        """
+        a new queue, and a started worker process that drains it.
+        """
+        event_queue = self.context.Queue(maxsize=self.queue_size)
+        process = self.context.Process(
+            target=_worker_main,
+            args=(self.index, event_queue, self.processed),
+            name="cookiecutter-plugin-event-worker-{index}".format(index=self.index),
+            daemon=True,
+        )
+        process.start()
+        return event_queue, process
+
+    def start(self):
+        self.queue, self.process = self.spawn()
+
+    def replace(self, event_queue, process):
+        """
+        swap in a spawn() of this shard for its dead worker. called with the pool's lock held.
+        """
+        # the old queue may have been left locked by the dead process, so it is replaced,
+        # and whatever was still in it is gone.
+        self.lost += max(0, self.enqueued - self.processed.value)
+        self.enqueued = self.processed.value
+        self.restarts += 1
+        self.queue, self.process = event_queue, process
+
+    def depth(self) -> int:
+        return max(0, self.enqueued - self.processed.value)
+
+    def stats(self) -> dict:
+        return {
+            "shard": self.index,
+            "pid": self.process.pid if self.process else None,
+            "alive": bool(self.process and self.process.is_alive()),
+            "enqueued": self.enqueued,
+            "processed": self.processed.value,
+            "depth": self.depth(),
+            "dropped": self.dropped,
+            "lost": self.lost,
+            "restarts": self.restarts,
+        }
+
+
+class ShardedWorkerPool:
+    def __init__(self, config=None):
+        self.config = config or execution_settings()
+        # spawn, not fork: see the module docstring.
+        self.context = multiprocessing.get_context("spawn")
+        self.shards = [Shard(i, self.context, self.config["queue_size"]) for i in range(self.config["processes"])]
+        # guards the shards' queues and counters. never held while a process is started.
+        self._lock = threading.Lock()
+        # serializes starting the pool.
+        self._start_lock = threading.Lock()
+        self._pid = None
+        self._running = False
+        self._supervisor = None
+
+    def _ensure_started(self) -> bool:
+        if self._running and self._pid == os.getpid():
+            return True
+        with self._start_lock:
+            if self._running and self._pid == os.getpid():
+                return True
+            shards = self.shards
+            if self._pid is not None and self._pid != os.getpid():
+                # this pool object was inherited from a parent process. start a pool of our own.
+                shards = [Shard(i, self.context, self.config["queue_size"]) for i in range(self.config["processes"])]
+            for shard in shards:
+                shard.start()
+            with self._lock:
+                self.shards = shards
+                self._pid = os.getpid()
+                self._running = True
+            self._supervisor = threading.Thread(
+                target=self._supervise, name="cookiecutter-plugin-event-supervisor", daemon=True
+            )
+            self._supervisor.start()
+            atexit.register(self.shutdown)
+            log.info(
+                "cookiecutter_plugin started {n} event worker processes for pid {pid}".format(
+                    n=len(self.shards), pid=self._pid
+                )
+            )
+        return True
+
+    def _supervise(self):
+        while self._running:
+            time.sleep(self.config["supervise_interval"])
+            with self._lock:
+                if not self._running:
+                    return
+                dead = [shard for shard in self.shards if not shard.process.is_alive()]
+            for shard in dead:
+                log.warning(
+                    "cookiecutter_plugin event worker {index} (pid {pid}) exited with {code}. restarting.".format(
+                        index=shard.index, pid=shard.process.pid, code=shard.process.exitcode
+                    )
+                )
+                # started outside the lock, so that submit() never waits for a process to start.
+                event_queue, process = shard.spawn()
+                with self._lock:
+                    if not self._running:
+                        process.terminate()
+                        return
+                    shard.replace(event_queue, process)
+
+    def submit(self, signal_name, metadata, data, user_id) -> bool:
+        """
+        queue an event on its user's shard. Returns False if the pool cannot
+        accept events, in which case the caller should process it inline.
+        Events for a full shard are dropped and counted rather than blocking
+        the request, or being processed out of order.
+        """
+        if not self._ensure_started():
+            return False
+        message = pickle.dumps((signal_name, metadata, data), protocol=pickle.HIGHEST_PROTOCOL)
+        shard = self.shards[(user_id or 0) % len(self.shards)]
+        with self._lock:
+            if not self._running:
+                return False
+            try:
+                shard.queue.put_nowait(message)
+                shard.enqueued += 1
+            except queue.Full:
+                shard.dropped += 1
+        return True
+
+    def shutdown(self):
+        """
+        graceful drain: each worker finishes its queue, then exits.
+        """
+        with self._lock:
+            if not self._running or self._pid != os.getpid():
+                return
+            self._running = False
+            for shard in self.shards:
+                try:
+                    shard.queue.put(SENTINEL, timeout=1)
+                except queue.Full:
+                    pass
+        deadline = time.monotonic() + self.config["drain_timeout"]
+        for shard in self.shards:
+            shard.process.join(max(0.0, deadline - time.monotonic()))
+            if shard.process.is_alive():
+                log.warning(
+                    "cookiecutter_plugin event worker {index} did not drain in time. terminating.".format(
+                        index=shard.index
+                    )
+                )
+                shard.process.terminate()
+
+    def stats(self) -> dict:
+        return {
+            "running": self._running,
+            "pid": self._pid,
+            "shards": [shard.stats() for shard in self.shards],
+        }
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def worker_pool() -> ShardedWorkerPool:
+    global _pool
+
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ShardedWorkerPool()
+    return _pool
+
+
+def pool_stats() -> dict:
+    if _pool is None:
+        return {"running": False, "mode": execution_settings()["mode"]}
+    return dict(mode=execution_settings()["mode"], **_pool.stats())
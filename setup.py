@@ -77,7 +77,8 @@ setup(
     name="cookiecutter-openedx-plugin",
     version=ABOUT["__package_version__"],
     packages=find_packages(),
-    package_data={"": ["*.html"]},  # include any Mako templates found in this repo.
+    # include any Mako templates found in this repo, and the benchmark suite's baselines.
+    package_data={"": ["*.html"], "cookiecutter_plugin": ["benchmarks/baselines.json"]},
     include_package_data=True,
     license_files=("LICENSE.txt",),
     license="AGPLv3",